@@ -0,0 +1,147 @@
+"""
+FAP 2.0 - 분석 블럭 프로세스 풀 (백엔드)
+
+주요 기능:
+- 일감 수가 많은 분석 블럭 계산(유형별 상세, 진행 상세 등)을 별도 프로세스에서 실행
+  (스레드 풀은 GIL 때문에 CPU 계산 중 다른 요청 처리가 느려짐)
+- 일감 수가 ANALYTICS_PROCESS_POOL_MIN_ROWS 미만이면 기존처럼 현재 프로세스에서 계산
+- 프로세스 경계에는 블럭 계산에 필요한 컬럼(required_issue_columns)만 컬럼형으로 전달
+  (반복 값이 많은 컬럼은 코드 배열 + 값 목록)
+- 풀 사용/현재 프로세스 계산 횟수 지표 제공 (/api/metrics)
+
+사용 예:
+    results = compute_blocks_pooled(issues, ['type_data_list', 'progress_detail'], timings)
+"""
+
+import threading
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional
+
+from config import ANALYTICS_PROCESS_POOL_WORKERS, ANALYTICS_PROCESS_POOL_MIN_ROWS
+from issue_analytics import compute_blocks, required_issue_columns
+
+# 값 종류가 적어서 코드 배열 + 값 목록으로 줄여 보내는 컬럼
+POOL_CODED_COLUMNS = ('project_id', 'project_name', 'tracker_name', 'status_name', 'is_closed', 'author_name', 'product')
+
+
+def pack_issue_columns(issues: List[Dict], columns: List[str]) -> Dict:
+    """일감 목록을 컬럼형으로 변환 (일감에 없는 컬럼은 빠진 상태 그대로 유지)"""
+    present = [column for column in columns if issues and column in issues[0]]
+    packed = {'size': len(issues), 'columns': {}}
+    for column in present:
+        values = [issue.get(column) for issue in issues]
+        if column in POOL_CODED_COLUMNS:
+            index = {}
+            codes = array('i', (index.setdefault(value, len(index)) for value in values))
+            packed['columns'][column] = {'codes': codes.tobytes(), 'values': list(index)}
+        else:
+            packed['columns'][column] = {'values': values}
+    return packed
+
+
+def unpack_issue_columns(packed: Dict) -> List[Dict]:
+    """pack_issue_columns 결과를 일감 dict 목록으로 복원"""
+    names = []
+    columns = []
+    for column, data in packed['columns'].items():
+        if 'codes' in data:
+            codes = array('i')
+            codes.frombytes(data['codes'])
+            values = data['values']
+            columns.append([values[code] for code in codes])
+        else:
+            columns.append(data['values'])
+        names.append(column)
+
+    if not columns:
+        return [{} for _ in range(packed['size'])]
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+def _compute_packed_blocks(packed: Dict, block_names: List[str], options: Optional[Dict], fields: Optional[List[str]]) -> tuple:
+    """워커 프로세스에서 실행: 컬럼형 입력을 복원해서 블럭 계산 → (결과, 단계별 시간)"""
+    started = time.perf_counter()
+    issues = unpack_issue_columns(packed)
+    timings = {'unpack_ms': round((time.perf_counter() - started) * 1000, 2)}
+    results = compute_blocks(issues, block_names, timings, options, fields)
+    return results, timings
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+_stats = {'pooled': 0, 'in_process': 0, 'pool_errors': 0}
+
+
+def get_analytics_pool() -> Optional[ProcessPoolExecutor]:
+    """분석용 프로세스 풀 (ANALYTICS_PROCESS_POOL_WORKERS 가 0 이면 None, 처음 사용할 때 생성)"""
+    global _pool
+    if ANALYTICS_PROCESS_POOL_WORKERS <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=ANALYTICS_PROCESS_POOL_WORKERS)
+        return _pool
+
+
+def shutdown_analytics_pool():
+    """서버 종료 시 워커 프로세스 정리"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def _reset_broken_pool(pool: ProcessPoolExecutor):
+    """워커가 비정상 종료된 풀은 버리고 다음 요청에서 새로 생성"""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def compute_blocks_pooled(issues: List[Dict], block_names: List[str], timings: Optional[Dict] = None, options: Optional[Dict] = None,
+                          fields: Optional[List[str]] = None) -> Dict[str, Dict]:
+    """compute_blocks 와 같은 결과를, 일감 수가 기준 이상이면 프로세스 풀에서 계산
+
+    풀을 쓸 수 없으면(비활성화, 워커 비정상 종료) 현재 프로세스에서 계산
+    """
+    pool = get_analytics_pool() if len(issues) >= ANALYTICS_PROCESS_POOL_MIN_ROWS else None
+    if pool is not None:
+        started = time.perf_counter()
+        packed = pack_issue_columns(issues, required_issue_columns(block_names, fields))
+        pack_ms = round((time.perf_counter() - started) * 1000, 2)
+
+        try:
+            results, pool_timings = pool.submit(_compute_packed_blocks, packed, block_names, options, fields).result()
+        except BrokenProcessPool:
+            _reset_broken_pool(pool)
+            with _pool_lock:
+                _stats['pool_errors'] += 1
+        else:
+            with _pool_lock:
+                _stats['pooled'] += 1
+            if timings is not None:
+                timings.update(pool_timings)
+                timings['pack_ms'] = pack_ms
+                timings['pool_ms'] = round((time.perf_counter() - started) * 1000, 2)
+            return results
+
+    with _pool_lock:
+        _stats['in_process'] += 1
+    return compute_blocks(issues, block_names, timings, options, fields)
+
+
+def get_analytics_pool_metrics() -> Dict:
+    """프로세스 풀 설정과 사용 횟수 지표"""
+    with _pool_lock:
+        return {
+            'workers': max(ANALYTICS_PROCESS_POOL_WORKERS, 0),
+            'min_rows': ANALYTICS_PROCESS_POOL_MIN_ROWS,
+            'started': _pool is not None,
+            **_stats
+        }
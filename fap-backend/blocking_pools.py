@@ -0,0 +1,171 @@
+"""
+FAP 2.0 - 블로킹 작업 스레드 풀 / 이벤트 루프 지연 측정 (백엔드)
+
+주요 기능:
+- async 라우트의 동기 호출을 종류별 전용 스레드 풀에서 실행 (이벤트 루프를 막지 않음)
+  - db: 동기 PyMySQL 조회/갱신
+  - redmine: Redmine/PMS HTTP 호출 (느려져도 DB 작업 스레드를 차지하지 않음)
+  - cpu: 분석 계산, 대용량 인코딩 등
+- 풀 크기가 종류별 동시 실행 상한 (넘치는 작업은 대기열에서 순서대로 실행)
+- 종류별 실행/대기 중/실행 중 건수와 대기 시간 지표
+- 이벤트 루프 지연(loop lag): 주기적으로 sleep 한 뒤 예정보다 늦게 깨어난 시간을 기록
+- 지표는 /api/metrics 에서 조회
+
+사용 예:
+    issue = await run_blocking('redmine', fetch_redmine_issue, issue_id)
+    user_data = await run_blocking('db', db.get_user_api_key, user_id)
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from config import (
+    DB_THREAD_POOL_SIZE, REDMINE_THREAD_POOL_SIZE, CPU_THREAD_POOL_SIZE,
+    LOOP_LAG_INTERVAL_SECONDS, LOOP_LAG_WINDOW
+)
+
+
+class BlockingPool:
+    """작업 종류 하나의 전용 스레드 풀 (처음 사용할 때 생성)"""
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.errors = 0
+        self.running = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"fap-{self.name}")
+            return self._executor
+
+    def _call(self, submitted_at: float, func: Callable) -> Any:
+        """워커 스레드에서 실행: 대기 시간 기록 후 func 호출"""
+        wait = time.perf_counter() - submitted_at
+        with self._lock:
+            self.running += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+        try:
+            return func()
+        except Exception:
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """func(*args, **kwargs) 를 이 풀에서 실행하고 결과를 기다림"""
+        with self._lock:
+            self.submitted += 1
+        call = functools.partial(self._call, time.perf_counter(), functools.partial(func, *args, **kwargs))
+        return await asyncio.get_running_loop().run_in_executor(self._get_executor(), call)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_metrics(self) -> Dict:
+        """실행/대기 건수와 대기 시간 지표"""
+        with self._lock:
+            started = self.completed + self.running
+            return {
+                'name': self.name,
+                'max_workers': self.max_workers,
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'errors': self.errors,
+                'running': self.running,
+                'queued': self.submitted - started,
+                'avg_wait_ms': round(self.total_wait / started * 1000, 2) if started else 0,
+                'max_wait_ms': round(self.max_wait * 1000, 2)
+            }
+
+
+BLOCKING_POOLS: Dict[str, BlockingPool] = {
+    'db': BlockingPool('db', DB_THREAD_POOL_SIZE),
+    'redmine': BlockingPool('redmine', REDMINE_THREAD_POOL_SIZE),
+    'cpu': BlockingPool('cpu', CPU_THREAD_POOL_SIZE),
+}
+
+
+async def run_blocking(category: str, func: Callable, *args, **kwargs) -> Any:
+    """동기 함수를 종류(db / redmine / cpu)별 전용 스레드 풀에서 실행"""
+    pool = BLOCKING_POOLS.get(category)
+    if pool is None:
+        raise ValueError(f"등록되지 않은 작업 종류입니다: {category} (가능: {list(BLOCKING_POOLS)})")
+    return await pool.run(func, *args, **kwargs)
+
+
+def shutdown_blocking_pools():
+    """서버 종료 시 스레드 풀 정리 (대기 중인 작업은 취소)"""
+    for pool in BLOCKING_POOLS.values():
+        pool.shutdown()
+
+
+def get_blocking_pool_metrics() -> List[Dict]:
+    """모든 작업 종류별 스레드 풀 지표"""
+    return [pool.get_metrics() for pool in BLOCKING_POOLS.values()]
+
+
+class LoopLagMonitor:
+    """이벤트 루프 지연 측정 (sleep 예정 시간보다 늦게 깨어난 만큼이 루프가 막혀 있던 시간)"""
+
+    def __init__(self, interval: float, window: int):
+        self.interval = interval
+        self.samples = deque(maxlen=window)
+        self.max_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(loop.time() - started - self.interval, 0.0)
+            self.samples.append(lag)
+            self.max_lag = max(self.max_lag, lag)
+
+    def start(self):
+        """현재 이벤트 루프에서 측정 시작 (서버 시작 시 호출)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def get_metrics(self) -> Dict:
+        """최근 측정 구간의 현재/평균/p99 지연과 서버 시작 후 최대 지연 (ms)"""
+        samples = sorted(self.samples)
+        if not samples:
+            return {'interval_ms': self.interval * 1000, 'samples': 0}
+        return {
+            'interval_ms': self.interval * 1000,
+            'samples': len(samples),
+            'current_ms': round(self.samples[-1] * 1000, 2),
+            'mean_ms': round(sum(samples) / len(samples) * 1000, 2),
+            'p99_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000, 2),
+            'max_ms': round(self.max_lag * 1000, 2)
+        }
+
+
+loop_lag_monitor = LoopLagMonitor(LOOP_LAG_INTERVAL_SECONDS, LOOP_LAG_WINDOW)
@@ -0,0 +1,207 @@
+"""
+FAP 2.0 - 응답 압축 미들웨어 (백엔드)
+
+주요 기능:
+- Accept-Encoding 협상으로 brotli(br) 또는 gzip 압축 (br 우선, q=0 이면 제외)
+- 최소 크기(COMPRESSION_MIN_SIZE) 미만 응답, 이미 압축된 형식(이미지/zip 등), 제외 경로(첨부파일)는 그대로 전달
+- ETag 가 있는 응답은 (ETag, 인코딩) 별 압축 결과를 캐시해서 같은 응답을 두 번 압축하지 않음
+  (ETag 응답 본문에는 요청마다 달라지는 값을 넣지 않음, 진단 정보는 Server-Timing 등 헤더로 전달)
+- 스트리밍 응답은 청크마다 flush 해서 받는 쪽이 바로 처리할 수 있게 압축
+
+brotli 는 선택 의존성:
+- 설치되지 않은 환경에서는 gzip 만 사용
+"""
+
+import zlib
+from typing import Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config import (
+    COMPRESSION_MIN_SIZE, COMPRESSION_GZIP_LEVEL, COMPRESSION_BROTLI_QUALITY,
+    COMPRESSION_EXCLUDED_PATHS, COMPRESSED_RESPONSE_CACHE_MAX_BYTES
+)
+from response_cache import create_response_cache
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BROTLI_AVAILABLE = brotli is not None
+
+# 이미 압축된 형식이라 다시 압축해도 크기가 거의 줄지 않는 Content-Type
+COMPRESSED_CONTENT_TYPES = (
+    'image/', 'video/', 'audio/', 'font/woff',
+    'application/zip', 'application/gzip', 'application/x-gzip', 'application/pdf', 'application/octet-stream'
+)
+
+# ETag 응답의 압축 결과 캐시 ((ETag, 인코딩) → 압축된 본문)
+compressed_response_cache = create_response_cache("compressed_responses", COMPRESSED_RESPONSE_CACHE_MAX_BYTES)
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding 헤더에서 사용할 인코딩 선택 (br > gzip, 지원하지 않으면 None)"""
+    accepted = {}
+    for part in accept_encoding.split(','):
+        name, _, params = part.strip().partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name] = quality
+
+    def is_accepted(encoding: str) -> bool:
+        return accepted.get(encoding, accepted.get('*', 0.0)) > 0
+
+    if BROTLI_AVAILABLE and is_accepted('br'):
+        return 'br'
+    if is_accepted('gzip'):
+        return 'gzip'
+    return None
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    """본문 전체 압축"""
+    if encoding == 'br':
+        return brotli.compress(body, quality=COMPRESSION_BROTLI_QUALITY)
+    compressor = zlib.compressobj(COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(body) + compressor.flush()
+
+
+class StreamCompressor:
+    """스트리밍 응답용 압축기 (청크마다 flush 해서 바로 전송 가능한 데이터 반환)"""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == 'br':
+            self._compressor = brotli.Compressor(quality=COMPRESSION_BROTLI_QUALITY)
+        else:
+            self._compressor = zlib.compressobj(COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, chunk: bytes) -> bytes:
+        if self.encoding == 'br':
+            return self._compressor.process(chunk) + self._compressor.flush()
+        return self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == 'br':
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+def is_compressible(status: int, headers: Headers) -> bool:
+    """압축 대상 응답인지 (본문 없는 상태 코드, 이미 인코딩된 응답, 압축된 형식 제외)"""
+    if status < 200 or status in (204, 304):
+        return False
+    if 'content-encoding' in headers:
+        return False
+    content_type = headers.get('content-type', '').lower()
+    return not content_type.startswith(COMPRESSED_CONTENT_TYPES)
+
+
+class CompressionMiddleware:
+    """brotli / gzip 협상 압축 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MIN_SIZE, excluded_paths: Tuple[str, ...] = COMPRESSION_EXCLUDED_PATHS):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.excluded_paths = tuple(excluded_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http' or scope['path'].startswith(self.excluded_paths):
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get('accept-encoding', ''))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """요청 1건의 응답 메시지를 받아 압축 여부를 정하고 전송"""
+
+    def __init__(self, send: Send, encoding: str, minimum_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start_message: Optional[Message] = None
+        self.decided = False
+        self.compressor: Optional[StreamCompressor] = None
+
+    async def send(self, message: Message):
+        if message['type'] == 'http.response.start':
+            self.start_message = message
+            return
+
+        if message['type'] != 'http.response.body':
+            await self._send(message)
+            return
+
+        if self.decided:
+            await self._send_body(message)
+            return
+
+        self.decided = True
+        headers = MutableHeaders(raw=self.start_message['headers'])
+        body = message.get('body', b'')
+        more_body = message.get('more_body', False)
+
+        if not is_compressible(self.start_message['status'], headers) or (not more_body and len(body) < self.minimum_size):
+            await self._send(self.start_message)
+            await self._send(message)
+            return
+
+        headers.add_vary_header('Accept-Encoding')
+        headers['Content-Encoding'] = self.encoding
+        etag = headers.get('etag')
+        if etag and not etag.startswith('W/'):
+            # 인코딩마다 바이트가 달라지므로 약한 ETag 로 표시 (If-None-Match 비교는 W/ 를 무시)
+            headers['ETag'] = f'W/{etag}'
+
+        if not more_body:
+            compressed = self._compress_once(body, etag)
+            headers['Content-Length'] = str(len(compressed))
+            await self._send(self.start_message)
+            await self._send({'type': 'http.response.body', 'body': compressed})
+            return
+
+        # 스트리밍 응답: 길이를 미리 알 수 없으므로 Content-Length 제거 후 청크별 압축
+        del headers['Content-Length']
+        self.compressor = StreamCompressor(self.encoding)
+        await self._send(self.start_message)
+        await self._send_body(message)
+
+    async def _send_body(self, message: Message):
+        if self.compressor is None:
+            await self._send(message)
+            return
+
+        more_body = message.get('more_body', False)
+        chunk = self.compressor.compress(message.get('body', b''))
+        if not more_body:
+            chunk += self.compressor.finish()
+        await self._send({'type': 'http.response.body', 'body': chunk, 'more_body': more_body})
+
+    def _compress_once(self, body: bytes, etag: Optional[str]) -> bytes:
+        """ETag 가 있으면 같은 응답의 압축 결과를 재사용"""
+        if not etag:
+            return compress_body(body, self.encoding)
+
+        cache_key = (etag, self.encoding)
+        compressed = compressed_response_cache.get(cache_key)
+        if compressed is None:
+            compressed = compress_body(body, self.encoding)
+            compressed_response_cache.put(cache_key, compressed, len(compressed))
+        return compressed
@@ -63,3 +63,66 @@ ATI_PROJECT_IDS = {
     'ATI_SAMPLE_EVALUATION': 846,  # ATI 시료 평가 (Level 21)
     'ATI_GUIDE': 422,           # PMS System 안내 (Level 31)
 }  # 'Help GPT' 프로젝트의 Redmine ID
+
+# 프로젝트 계층 캐시: 동기화 세대(sync generation) 재확인 주기 (초)
+HIERARCHY_GENERATION_CHECK_SECONDS = 5
+
+# 레드마인 프로젝트 정보 캐시 유지 시간 (초) - 로컬 계층에 없는 프로젝트 조회 시 사용
+REDMINE_PROJECT_CACHE_TTL_SECONDS = 600
+
+# 프로젝트 계층 스냅샷 파일 경로 (fap-backend 기준 상대 경로) - 재시작 시 빠른 로딩용
+HIERARCHY_SNAPSHOT_PATH = "cache/project_hierarchy.pickle"
+
+# 건수만 필요한 분석 블럭(진행률 요약, 유형별 건수 등)을 SQL 집계로 계산할지 여부 (False 면 일감 조회 후 Python 계산)
+ANALYTICS_SQL_COUNT_BLOCKS = True
+
+# 건수 블럭 SQL 집계 시 issues 대신 일별 집계 테이블(issue_rollup_daily)을 먼저 사용할지 여부
+ANALYTICS_ROLLUP_COUNT_BLOCKS = True
+
+# 드릴다운 상세 조회(/get-issue-detail) 기본 페이지 크기 / 최대 페이지 크기
+ISSUE_DETAIL_PAGE_SIZE = 50
+ISSUE_DETAIL_MAX_PAGE_SIZE = 200
+
+# 분석 블럭 계산용 프로세스 풀 워커 수 (0 이면 사용 안 함) / 풀에서 계산할 최소 일감 수
+# 결과 전달(직렬화) 비용이 있으므로 CPU 코어가 2개 이상인 서버에서만 켜는 것을 권장
+ANALYTICS_PROCESS_POOL_WORKERS = 0
+ANALYTICS_PROCESS_POOL_MIN_ROWS = 30000
+
+# 분석 API 응답 캐시 최대 크기 (바이트) - 동기화 세대가 바뀌면 이전 결과는 자동으로 사용되지 않음
+ANALYTICS_RESPONSE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# 응답 압축 (brotli/gzip) - 이 크기(바이트) 미만 응답은 압축하지 않음
+COMPRESSION_MIN_SIZE = 1024
+COMPRESSION_GZIP_LEVEL = 6
+COMPRESSION_BROTLI_QUALITY = 5
+
+# 압축하지 않는 경로 (첨부파일 이미지는 이미 압축된 데이터)
+COMPRESSION_EXCLUDED_PATHS = ("/api/main/attachment-image",)
+
+# ETag 응답의 압축 결과 캐시 최대 크기 (바이트)
+COMPRESSED_RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# 일감 목록(/get-issue-list) 키셋 페이지 기본 크기 / 최대 크기
+ISSUE_LIST_PAGE_SIZE = 100
+ISSUE_LIST_MAX_PAGE_SIZE = 500
+
+# 일감 내보내기(/export-issues) 시 서버 측 커서에서 한 번에 읽어 전송하는 행 수
+ISSUE_EXPORT_BATCH_SIZE = 1000
+
+# 블로킹 작업 종류별 전용 스레드 풀 크기 (= 종류별 동시 실행 상한)
+# DB: 동기 PyMySQL 조회 / Redmine: 외부 HTTP 호출 / CPU: 분석 계산, 인코딩 등 (GIL 때문에 작게 유지)
+DB_THREAD_POOL_SIZE = 16
+REDMINE_THREAD_POOL_SIZE = 8
+CPU_THREAD_POOL_SIZE = 4
+
+# 이벤트 루프 지연(loop lag) 측정 주기 (초) / 지표 계산에 쓰는 최근 측정 수
+LOOP_LAG_INTERVAL_SECONDS = 0.5
+LOOP_LAG_WINDOW = 120
+
+# WebSocket 일감 이벤트 구독자별 대기 큐 크기 (넘치면 resync 이벤트로 교체)
+ISSUE_EVENT_QUEUE_SIZE = 256
+
+# 일괄 상태 변경(/update-progress-status-batch) 최대 건수 / 요청 1건의 Redmine 동시 호출 수
+# (Redmine 스레드 풀보다 작게 두어서 일괄 변경 중에도 단건 요청이 스레드를 얻을 수 있게 함)
+ISSUE_STATUS_BATCH_MAX_ITEMS = 100
+ISSUE_STATUS_BATCH_CONCURRENCY = 4
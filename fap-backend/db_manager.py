@@ -27,7 +27,8 @@ FAP 2.0 - 데이터베이스 관리 클래스 (백엔드)
 """
 
 import pymysql
-from typing import List, Dict, Optional
+import pymysql.cursors
+from typing import List, Dict, Iterator, Optional, Sequence
 import json
 from datetime import datetime, timezone, timedelta
 import requests
@@ -215,6 +216,310 @@ class DatabaseManager:
         finally:
             conn.close()
     
+    # 컬럼을 골라 조회할 수 있는 issues 컬럼 (쿼리에 직접 들어가므로 화이트리스트로 제한)
+    ISSUE_SELECT_COLUMNS = ('redmine_id', 'project_id', 'project_name', 'tracker_id', 'tracker_name',
+                            'status_id', 'status_name', 'is_closed', 'priority_id', 'priority_name',
+                            'author_id', 'author_name', 'assigned_to_id', 'assigned_to_name',
+                            'subject', 'description', 'cost', 'pending', 'product',
+                            'created_at', 'updated_at', 'raw_data')
+
+    @staticmethod
+    def _check_select_columns(columns: Sequence[str], allowed: Sequence[str]) -> tuple:
+        """조회 컬럼 목록 검증 (허용 목록에 없거나 비어 있으면 ValueError)"""
+        columns = tuple(columns)
+        invalid_columns = [column for column in columns if column not in allowed]
+        if invalid_columns or not columns:
+            raise ValueError(f"조회할 수 없는 컬럼입니다: {invalid_columns or '(없음)'}")
+        return columns
+
+    def get_issue_columns_by_filter(self, start_date: str, end_date: str, project_ids: List[int], columns: Sequence[str]) -> List[Dict]:
+        """get_issues_by_filter 와 같은 조건/정렬로 지정한 컬럼만 조회 (raw_data 등 큰 컬럼을 필요할 때만 읽음)"""
+        columns = self._check_select_columns(columns, self.ISSUE_SELECT_COLUMNS)
+        if not project_ids:
+            return []
+
+        conn = self.get_connection()
+        if not conn:
+            return []
+
+        try:
+            cursor = conn.cursor()
+
+            id_placeholders = ','.join(['%s'] * len(project_ids))
+            cursor.execute(f"""
+                SELECT {', '.join(columns)}
+                FROM issues
+                WHERE created_at >= %s AND created_at <= %s
+                   AND project_id IN ({id_placeholders})
+                ORDER BY updated_at DESC
+            """, [start_date, end_date] + list(project_ids))
+
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+        except Exception as e:
+            print(f"필터링된 일감 컬럼 조회 실패: {e}")
+            return []
+        finally:
+            conn.close()
+
+    def get_issue_counts_by_project(self, start_date: str, end_date: str, project_ids: List[int]) -> Dict[int, Dict]:
+        """기간과 프로젝트 ID로 필터링한 일감 수를 프로젝트별로 집계 (일감 행은 가져오지 않음)"""
+        if not project_ids:
+            return {}
+
+        conn = self.get_connection()
+        if not conn:
+            return {}
+
+        try:
+            cursor = conn.cursor()
+
+            id_placeholders = ','.join(['%s'] * len(project_ids))
+            query = f"""
+                SELECT project_id, COUNT(*), SUM(CASE WHEN is_closed = 1 THEN 1 ELSE 0 END)
+                FROM issues
+                WHERE created_at >= %s AND created_at <= %s
+                   AND project_id IN ({id_placeholders})
+                GROUP BY project_id
+            """
+
+            cursor.execute(query, [start_date, end_date] + list(project_ids))
+            rows = cursor.fetchall()
+
+            return {
+                row[0]: {'total': int(row[1]), 'completed': int(row[2] or 0)}
+                for row in rows
+            }
+
+        except Exception as e:
+            print(f"프로젝트별 일감 수 집계 실패: {e}")
+            return {}
+        finally:
+            conn.close()
+
+    # GROUP BY 집계에 허용하는 issues 컬럼 (쿼리에 직접 들어가므로 화이트리스트로 제한)
+    ISSUE_GROUP_COLUMNS = ('project_id', 'tracker_name', 'status_name', 'is_closed', 'product', 'author_name')
+
+    def get_issue_group_counts(self, start_date: str, end_date: str, project_ids: List[int], group_columns: List[str]) -> List[Dict]:
+        """기간과 프로젝트 ID로 필터링한 일감 수를 지정 컬럼 조합별로 집계 (행마다 컬럼값 + 'count')
+
+        그룹 순서는 get_issues_by_filter(updated_at DESC)에서 각 조합이 처음 등장하는 순서와 같음
+        """
+        if not project_ids:
+            return []
+
+        invalid_columns = [column for column in group_columns if column not in self.ISSUE_GROUP_COLUMNS]
+        if invalid_columns or not group_columns:
+            raise ValueError(f"집계할 수 없는 컬럼입니다: {invalid_columns}")
+
+        conn = self.get_connection()
+        if not conn:
+            return []
+
+        try:
+            cursor = conn.cursor()
+
+            id_placeholders = ','.join(['%s'] * len(project_ids))
+            columns = ', '.join(group_columns)
+            query = f"""
+                SELECT {columns}, COUNT(*)
+                FROM issues
+                WHERE created_at >= %s AND created_at <= %s
+                   AND project_id IN ({id_placeholders})
+                GROUP BY {columns}
+                ORDER BY MAX(updated_at) DESC
+            """
+
+            cursor.execute(query, [start_date, end_date] + list(project_ids))
+            rows = cursor.fetchall()
+
+            groups = []
+            for row in rows:
+                group = dict(zip(group_columns, row[:-1]))
+                group['count'] = int(row[-1])
+                groups.append(group)
+            return groups
+
+        except Exception as e:
+            print(f"일감 그룹별 집계 실패: {e}")
+            return []
+        finally:
+            conn.close()
+
+    # 목록/상세 조회에서 내려주는 issues 컬럼 (raw_data 제외)
+    ISSUE_LIST_COLUMNS = ('redmine_id', 'project_id', 'project_name', 'tracker_name', 'status_name', 'is_closed',
+                          'author_name', 'product', 'subject', 'description', 'created_at', 'updated_at')
+
+    # 키셋 페이지 정렬에 허용하는 컬럼 (동률은 redmine_id 로 구분)
+    ISSUE_LIST_SORT_COLUMNS = ('updated_at', 'created_at')
+
+    def get_issue_cell_page(self, start_date: str, end_date: str, project_ids: List[int], cell: Dict, limit: int, offset: int,
+                            columns: Optional[Sequence[str]] = None) -> Dict:
+        """기간/프로젝트 필터 + 셀 조건(컬럼 = 값)에 해당하는 일감 한 페이지와 전체 건수 조회
+
+        정렬은 get_issues_by_filter 와 같은 updated_at DESC (같은 시각은 redmine_id DESC)
+        columns 는 ISSUE_LIST_COLUMNS 중 조회할 컬럼 (None 이면 전체)
+        """
+        columns = self._check_select_columns(columns or self.ISSUE_LIST_COLUMNS, self.ISSUE_LIST_COLUMNS)
+        empty = {'total_count': 0, 'issues': []}
+        if not project_ids:
+            return empty
+
+        invalid_columns = [column for column in cell if column not in self.ISSUE_GROUP_COLUMNS]
+        if invalid_columns:
+            raise ValueError(f"조회 조건으로 쓸 수 없는 컬럼입니다: {invalid_columns}")
+
+        conn = self.get_connection()
+        if not conn:
+            return empty
+
+        try:
+            cursor = conn.cursor()
+
+            id_placeholders = ','.join(['%s'] * len(project_ids))
+            conditions = []
+            params = [start_date, end_date] + list(project_ids)
+            for column, value in cell.items():
+                if value is None:
+                    conditions.append(f"{column} IS NULL")
+                else:
+                    conditions.append(f"{column} = %s")
+                    params.append(value)
+            where = f"""
+                WHERE created_at >= %s AND created_at <= %s
+                   AND project_id IN ({id_placeholders})
+                   {''.join(' AND ' + condition for condition in conditions)}
+            """
+
+            cursor.execute(f"SELECT COUNT(*) FROM issues {where}", params)
+            total_count = int(cursor.fetchone()[0])
+            if total_count == 0 or offset >= total_count:
+                return {'total_count': total_count, 'issues': []}
+
+            cursor.execute(f"""
+                SELECT {', '.join(columns)}
+                FROM issues {where}
+                ORDER BY updated_at DESC, redmine_id DESC
+                LIMIT %s OFFSET %s
+            """, params + [limit, offset])
+            issues = [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+            return {'total_count': total_count, 'issues': issues}
+
+        except Exception as e:
+            print(f"셀 일감 조회 실패: {e}")
+            return empty
+        finally:
+            conn.close()
+
+    def get_issues_keyset_page(self, start_date: str, end_date: str, project_ids: List[int], sort_column: str, descending: bool,
+                               after: Optional[tuple], limit: int, columns: Optional[Sequence[str]] = None) -> List[Dict]:
+        """기간/프로젝트 필터 일감을 (sort_column, redmine_id) 키셋으로 limit 개 조회
+
+        after 는 이전 페이지 마지막 행의 (sort_column 값, redmine_id), None 이면 첫 페이지.
+        ORDER BY 는 원본 컬럼 + redmine_id 그대로 사용 (인덱스 순서로 읽을 수 있도록 식으로 감싸지 않음)
+        NULL 정렬 값은 MariaDB 기본 순서대로 오름차순 맨 앞, 내림차순 맨 뒤이며 키셋 조건에서 IS NULL 분기로 처리
+        OFFSET 을 쓰지 않으므로 뒤쪽 페이지도 조회 비용이 같음
+        columns 는 ISSUE_LIST_COLUMNS 중 조회할 컬럼 (None 이면 전체)
+        """
+        columns = self._check_select_columns(columns or self.ISSUE_LIST_COLUMNS, self.ISSUE_LIST_COLUMNS)
+        if not project_ids:
+            return []
+
+        if sort_column not in self.ISSUE_LIST_SORT_COLUMNS:
+            raise ValueError(f"정렬할 수 없는 컬럼입니다: {sort_column}")
+
+        conn = self.get_connection()
+        if not conn:
+            return []
+
+        try:
+            cursor = conn.cursor()
+
+            id_placeholders = ','.join(['%s'] * len(project_ids))
+            params = [start_date, end_date] + list(project_ids)
+            direction = 'DESC' if descending else 'ASC'
+            comparison = '<' if descending else '>'
+
+            keyset_condition = ''
+            if after is not None:
+                after_value, after_id = after
+                if after_value is None and descending:
+                    # 맨 뒤 NULL 구간 안: 남은 NULL 행만
+                    keyset_condition = f"AND ({sort_column} IS NULL AND redmine_id < %s)"
+                    params += [after_id]
+                elif after_value is None:
+                    # 맨 앞 NULL 구간 안: 남은 NULL 행 + 값이 있는 모든 행
+                    keyset_condition = f"AND (({sort_column} IS NULL AND redmine_id > %s) OR {sort_column} IS NOT NULL)"
+                    params += [after_id]
+                elif descending:
+                    # 값이 있는 구간: 뒤에 오는 NULL 행도 포함
+                    keyset_condition = (f"AND ({sort_column} < %s OR ({sort_column} = %s AND redmine_id < %s)"
+                                        f" OR {sort_column} IS NULL)")
+                    params += [after_value, after_value, after_id]
+                else:
+                    keyset_condition = f"AND ({sort_column} > %s OR ({sort_column} = %s AND redmine_id > %s))"
+                    params += [after_value, after_value, after_id]
+
+            cursor.execute(f"""
+                SELECT {', '.join(columns)}
+                FROM issues
+                WHERE created_at >= %s AND created_at <= %s
+                   AND project_id IN ({id_placeholders})
+                   {keyset_condition}
+                ORDER BY {sort_column} {direction}, redmine_id {direction}
+                LIMIT %s
+            """, params + [limit])
+
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+        except Exception as e:
+            print(f"일감 목록 페이지 조회 실패: {e}")
+            return []
+        finally:
+            conn.close()
+
+    def iter_issues_by_filter(self, start_date: str, end_date: str, project_ids: List[int], batch_size: int = 1000,
+                              columns: Optional[Sequence[str]] = None) -> Iterator[List[Dict]]:
+        """기간/프로젝트 필터 일감을 서버 측 커서(SSCursor)로 batch_size 개씩 읽어 차례로 반환
+
+        결과 전체를 메모리에 올리지 않으므로 내보내기 행 수와 관계없이 메모리 사용량이 일정함.
+        정렬은 get_issues_by_filter 와 같은 updated_at DESC
+        columns 는 ISSUE_LIST_COLUMNS 중 조회할 컬럼 (None 이면 전체)
+        """
+        columns = self._check_select_columns(columns or self.ISSUE_LIST_COLUMNS, self.ISSUE_LIST_COLUMNS)
+        if not project_ids:
+            return
+
+        conn = self.get_connection()
+        if not conn:
+            return
+
+        try:
+            cursor = conn.cursor(pymysql.cursors.SSCursor)
+
+            id_placeholders = ','.join(['%s'] * len(project_ids))
+            cursor.execute(f"""
+                SELECT {', '.join(columns)}
+                FROM issues
+                WHERE created_at >= %s AND created_at <= %s
+                   AND project_id IN ({id_placeholders})
+                ORDER BY updated_at DESC, redmine_id DESC
+            """, [start_date, end_date] + list(project_ids))
+
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield [dict(zip(columns, row)) for row in rows]
+
+        except Exception as e:
+            # 이미 전송 중인 응답이므로 빈 결과로 끝내지 않고 예외를 올려서 전송을 중단 (잘린 파일이 정상처럼 보이지 않게)
+            print(f"일감 스트리밍 조회 실패: {e}")
+            raise
+        finally:
+            conn.close()
+
     def get_issues_by_ids(self, issue_ids: List[int]) -> List[Dict]: # 수정 불가
         """여러 ID의 일감 정보를 한 번에 조회하는 메서드"""
         if not issue_ids:
@@ -388,8 +693,13 @@ class DatabaseManager:
                 """, (redmine_id, json.dumps(issue, ensure_ascii=False)))
                 saved_count += 1
             
+            # 일별 집계(롤업)도 같은 트랜잭션에서 다시 생성 (테이블은 서버 시작 시 생성되어 있어 DDL 로 인한 암묵적 커밋 없음)
+            self._rebuild_issue_rollup(cursor)
+            
             conn.commit()
             conn.close()
+            self.bump_sync_generation('issue_rollup')
+            self.bump_sync_generation('issues')
             
             return {
                 'success': True,
@@ -605,8 +915,14 @@ class DatabaseManager:
                 ))
                 saved_count += 1
             
+            # 일별 집계(롤업)도 같은 트랜잭션에서 다시 생성 (테이블은 서버 시작 시 생성되어 있어 DDL 로 인한 암묵적 커밋 없음)
+            print("6. 일감 일별 집계(롤업) 갱신 중...")
+            self._rebuild_issue_rollup(cursor)
+            
             conn.commit()
             conn.close()
+            self.bump_sync_generation('issue_rollup')
+            self.bump_sync_generation('issues')
             
             print("=== 이슈 동기화 완료 ===")
             return {
@@ -754,8 +1070,9 @@ class DatabaseManager:
             cursor = conn.cursor()
             
             # 1. 먼저 해당 이슈가 존재하고 현재 상태가 old_status_name과 일치하는지 확인
+            #    (tracker/product/project 는 상태 변경 이벤트에 함께 전달)
             cursor.execute("""
-                SELECT status_name FROM issues 
+                SELECT status_name, tracker_name, product, project_id FROM issues 
                 WHERE redmine_id = %s
             """, (redmine_id,))
             
@@ -779,23 +1096,33 @@ class DatabaseManager:
                 SET status_name = %s, updated_at = NOW()
                 WHERE redmine_id = %s
             """, (new_status_name, redmine_id))
+            updated_count = cursor.rowcount
+            
+            # 해당 일감이 속한 일별 집계(롤업) 행도 같은 트랜잭션에서 갱신 (DELETE/INSERT 만 실행, 실패 시 상태 변경과 함께 롤백)
+            self._refresh_issue_rollup_slice(cursor, redmine_id)
             
             conn.commit()
             
             # 4. 업데이트 결과 확인
-            if cursor.rowcount == 0:
+            if updated_count == 0:
                 return {
                     "success": False,
                     "message": f"이슈 #{redmine_id} 상태 업데이트에 실패했습니다."
                 }
             
+            # 분석 응답 캐시가 다음 요청부터 새 데이터로 계산되도록 세대 증가
+            self.bump_sync_generation('issues')
+            
             return {
                 "success": True,
                 "message": f"이슈 #{redmine_id} 상태가 성공적으로 변경되었습니다: {old_status_name} → {new_status_name}",
                 "data": {
                     "redmine_id": redmine_id,
                     "old_status": old_status_name,
-                    "new_status": new_status_name
+                    "new_status": new_status_name,
+                    "tracker_name": result[1],
+                    "product": result[2],
+                    "project_id": result[3]
                 }
             }
             
@@ -812,6 +1139,92 @@ class DatabaseManager:
             if conn:
                 conn.close()
 
+    def set_update_issue_statusnames(self, moves: List[Dict]) -> Dict:
+        """여러 이슈 상태명을 한 트랜잭션으로 업데이트 (moves: redmine_id, old_status_name, new_status_name)
+
+        이슈마다 현재 상태가 old_status_name 과 같을 때만 변경하고 결과는 results[redmine_id] 에 기록.
+        롤업 갱신과 세대 증가는 변경된 이슈 전체에 대해 한 번씩만 수행.
+        행 잠금, 상태 UPDATE, 롤업 갱신은 DDL 없이 한 트랜잭션에서 실행되므로
+        (롤업 테이블은 서버 시작 시 생성) 롤업 갱신을 포함해 DB 오류가 나면 전체를 되돌리고 success False (results 비어 있음)
+        """
+        if not moves:
+            return {"success": True, "message": "변경할 이슈가 없습니다.", "results": {}}
+
+        conn = self.get_connection()
+        if not conn:
+            return {"success": False, "message": "DB 연결 실패", "results": {}}
+
+        try:
+            cursor = conn.cursor()
+
+            # 1. 대상 이슈의 현재 상태를 한 번에 조회 (트랜잭션이 끝날 때까지 행 잠금)
+            redmine_ids = [move['redmine_id'] for move in moves]
+            id_placeholders = ','.join(['%s'] * len(redmine_ids))
+            cursor.execute(f"""
+                SELECT redmine_id, status_name, tracker_name, product, project_id FROM issues
+                WHERE redmine_id IN ({id_placeholders})
+                FOR UPDATE
+            """, redmine_ids)
+            current = {row[0]: row for row in cursor.fetchall()}
+
+            # 2. 상태가 일치하는 이슈만 업데이트
+            results = {}
+            updated_ids = []
+            for move in moves:
+                redmine_id = move['redmine_id']
+                old_status_name = move['old_status_name']
+                new_status_name = move['new_status_name']
+                row = current.get(redmine_id)
+                if row is None:
+                    results[redmine_id] = {"success": False, "message": f"이슈 #{redmine_id}를 찾을 수 없습니다."}
+                    continue
+                if row[1] != old_status_name:
+                    results[redmine_id] = {
+                        "success": False,
+                        "message": f"이슈 #{redmine_id}의 현재 상태가 일치하지 않습니다. 현재: {row[1]}, 예상: {old_status_name}"
+                    }
+                    continue
+
+                cursor.execute("""
+                    UPDATE issues
+                    SET status_name = %s, updated_at = NOW()
+                    WHERE redmine_id = %s
+                """, (new_status_name, redmine_id))
+                updated_ids.append(redmine_id)
+                results[redmine_id] = {
+                    "success": True,
+                    "message": f"이슈 #{redmine_id} 상태가 성공적으로 변경되었습니다: {old_status_name} → {new_status_name}",
+                    "data": {
+                        "redmine_id": redmine_id,
+                        "old_status": old_status_name,
+                        "new_status": new_status_name,
+                        "tracker_name": row[2],
+                        "product": row[3],
+                        "project_id": row[4]
+                    }
+                }
+
+            # 3. 변경된 이슈들이 속한 일별 집계(롤업) 행을 같은 트랜잭션에서 갱신 (실패하면 위 UPDATE 도 함께 롤백)
+            if updated_ids:
+                self._refresh_issue_rollup_slices(cursor, updated_ids)
+
+            conn.commit()
+
+            if updated_ids:
+                self.bump_sync_generation('issues')
+
+            return {
+                "success": True,
+                "message": f"{len(updated_ids)}/{len(moves)}건 상태 업데이트 완료",
+                "results": results
+            }
+
+        except Exception as e:
+            conn.rollback()
+            return {"success": False, "message": f"DB 일괄 업데이트 중 오류 발생: {str(e)}", "results": {}}
+        finally:
+            conn.close()
+
 # ===== 프로젝트 관련 메서드들 =====
     
     def _row_to_project_dict(self, row) -> Dict:  # 수정 불가
@@ -891,6 +1304,32 @@ class DatabaseManager:
         finally:
             conn.close()
 
+    def get_all_projects(self) -> List[Dict]:
+        """계층 인덱스 생성용 - projects 테이블 전체를 이름순으로 한 번에 조회"""
+        conn = self.get_connection()
+        if not conn:
+            return []
+
+        try:
+            cursor = conn.cursor()
+
+            query = """
+                SELECT id, redmine_project_id, project_name, raw_data, children_ids, level
+                FROM projects
+                ORDER BY project_name ASC
+            """
+
+            cursor.execute(query)
+            rows = cursor.fetchall()
+
+            return [self._row_to_project_dict(row) for row in rows]
+
+        except Exception as e:
+            print(f"전체 프로젝트 조회 실패: {e}")
+            return []
+        finally:
+            conn.close()
+
     def sync_projects_fast(self, limit: int = 1000) -> Dict: # 수정 불가
         """레드마인에서 프로젝트 목록을 빠르게 가져와서 DB에 저장 (자식 프로젝트 조회 없이)"""
         try:
@@ -1113,7 +1552,10 @@ class DatabaseManager:
             
             conn.commit()
             conn.close()
-            
+
+            # 계층 캐시 무효화를 위해 프로젝트 동기화 세대 증가
+            self.bump_sync_generation('projects')
+
             print(f"프로젝트 관계 분석 완료: {saved_count}개 프로젝트 저장")
             
             return {
@@ -1157,6 +1599,254 @@ class DatabaseManager:
             return 3  # 지역의 하위 (건물명)
 
 
+# ===== 동기화 세대 관련 메서드들 =====
+
+    def create_sync_generations_table(self) -> bool:
+        """sync_generations 테이블이 없으면 생성 (서버 시작 시 1번 호출, 조회/증가 경로에서는 DDL 을 실행하지 않음)"""
+        conn = self.get_connection()
+        if not conn:
+            return False
+
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS sync_generations (
+                    scope VARCHAR(32) PRIMARY KEY,
+                    generation BIGINT NOT NULL DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+                )
+            """)
+            conn.commit()
+            return True
+
+        except Exception as e:
+            print(f"sync_generations 테이블 생성 실패: {e}")
+            return False
+        finally:
+            conn.close()
+
+    def get_sync_generation(self, scope: str) -> Optional[int]:
+        """동기화 세대 번호 조회 (scope: 'projects', 'issues' 등, 기록이 없으면 0, DB 실패 시 None)"""
+        conn = self.get_connection()
+        if not conn:
+            return None
+
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT generation FROM sync_generations WHERE scope = %s", (scope,))
+            result = cursor.fetchone()
+
+            return int(result[0]) if result else 0
+
+        except Exception as e:
+            print(f"동기화 세대 조회 실패 ({scope}): {e}")
+            return None
+        finally:
+            conn.close()
+
+    def get_sync_generations(self, scopes: List[str]) -> Optional[Dict[str, int]]:
+        """여러 scope 의 동기화 세대 번호를 쿼리 1번으로 조회 (기록이 없으면 0, DB 실패 시 None)"""
+        conn = self.get_connection()
+        if not conn:
+            return None
+
+        try:
+            cursor = conn.cursor()
+            placeholders = ','.join(['%s'] * len(scopes))
+            cursor.execute(f"SELECT scope, generation FROM sync_generations WHERE scope IN ({placeholders})", list(scopes))
+            generations = {scope: 0 for scope in scopes}
+            for scope, generation in cursor.fetchall():
+                generations[scope] = int(generation)
+            return generations
+
+        except Exception as e:
+            print(f"동기화 세대 조회 실패 ({scopes}): {e}")
+            return None
+        finally:
+            conn.close()
+
+    def bump_sync_generation(self, scope: str) -> Optional[int]:
+        """데이터 변경 시 동기화 세대 번호를 1 증가시키고 새 번호 반환"""
+        conn = self.get_connection()
+        if not conn:
+            return None
+
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO sync_generations (scope, generation) VALUES (%s, 1)
+                ON DUPLICATE KEY UPDATE generation = generation + 1
+            """, (scope,))
+            conn.commit()
+
+            cursor.execute("SELECT generation FROM sync_generations WHERE scope = %s", (scope,))
+            result = cursor.fetchone()
+
+            return int(result[0]) if result else None
+
+        except Exception as e:
+            print(f"동기화 세대 증가 실패 ({scope}): {e}")
+            return None
+        finally:
+            conn.close()
+
+
+# ===== 일감 일별 집계(롤업) 관련 메서드들 =====
+
+    # 롤업 행을 나누는 차원 컬럼 (issues 컬럼과 같은 이름, 이름 컬럼은 건수 블럭 표시용)
+    ISSUE_ROLLUP_DIMENSIONS = (
+        'project_id', 'tracker_id', 'tracker_name', 'status_id', 'status_name',
+        'author_id', 'author_name', 'product', 'is_closed'
+    )
+
+    def create_issue_rollup_table(self) -> bool:
+        """issue_rollup_daily 테이블이 없으면 생성 (서버 시작 시 1번 호출, 동기화/상태 변경 트랜잭션에서는 DDL 을 실행하지 않음)"""
+        conn = self.get_connection()
+        if not conn:
+            return False
+
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS issue_rollup_daily (
+                    rollup_date DATE NOT NULL,
+                    project_id INT,
+                    tracker_id INT,
+                    tracker_name VARCHAR(255),
+                    status_id INT,
+                    status_name VARCHAR(255),
+                    author_id INT,
+                    author_name VARCHAR(255),
+                    product VARCHAR(255),
+                    is_closed TINYINT,
+                    issue_count INT NOT NULL DEFAULT 0,
+                    last_updated_at DATETIME,
+                    INDEX idx_rollup_date_project (rollup_date, project_id)
+                )
+            """)
+            conn.commit()
+            return True
+
+        except Exception as e:
+            print(f"issue_rollup_daily 테이블 생성 실패: {e}")
+            return False
+        finally:
+            conn.close()
+
+    def _rollup_select_query(self, where_clause: str) -> str:
+        """issues 를 일자 + 롤업 차원별로 집계하는 SELECT 문"""
+        dimensions = ', '.join(self.ISSUE_ROLLUP_DIMENSIONS)
+        return f"""
+            SELECT DATE(created_at), {dimensions}, COUNT(*), MAX(updated_at)
+            FROM issues
+            WHERE {where_clause}
+            GROUP BY DATE(created_at), {dimensions}
+        """
+
+    def _rollup_insert_query(self, where_clause: str) -> str:
+        """_rollup_select_query 결과를 issue_rollup_daily 에 넣는 INSERT 문"""
+        dimensions = ', '.join(self.ISSUE_ROLLUP_DIMENSIONS)
+        return f"""
+            INSERT INTO issue_rollup_daily (rollup_date, {dimensions}, issue_count, last_updated_at)
+            {self._rollup_select_query(where_clause)}
+        """
+
+    def _rebuild_issue_rollup(self, cursor):
+        """issues 전체로 롤업 테이블 재생성 (일감 동기화 트랜잭션 안에서 호출)"""
+        cursor.execute("DELETE FROM issue_rollup_daily")
+        cursor.execute(self._rollup_insert_query("created_at IS NOT NULL"))
+
+    def _refresh_issue_rollup_slice(self, cursor, redmine_id: int):
+        """일감 1건이 속한 (일자, 프로젝트) 롤업 행만 다시 집계 (상태 변경 트랜잭션 안에서 호출)"""
+        self._refresh_issue_rollup_slices(cursor, [redmine_id])
+
+    def _refresh_issue_rollup_slices(self, cursor, redmine_ids: List[int]):
+        """일감들이 속한 (일자, 프로젝트) 롤업 행을 조합마다 한 번씩 다시 집계 (상태 변경 트랜잭션 안에서 호출)"""
+        id_placeholders = ','.join(['%s'] * len(redmine_ids))
+        cursor.execute(f"""
+            SELECT DISTINCT DATE(created_at), project_id FROM issues
+            WHERE redmine_id IN ({id_placeholders}) AND created_at IS NOT NULL
+        """, list(redmine_ids))
+
+        for rollup_date, project_id in cursor.fetchall():
+            cursor.execute("""
+                DELETE FROM issue_rollup_daily
+                WHERE rollup_date = %s AND project_id <=> %s
+            """, (rollup_date, project_id))
+            cursor.execute(
+                self._rollup_insert_query("DATE(created_at) = %s AND project_id <=> %s"),
+                (rollup_date, project_id)
+            )
+
+    def get_issue_rollup_counts(self, start_date: str, end_date: str, project_ids: List[int], group_columns: List[str]) -> Optional[List[Dict]]:
+        """롤업 테이블로 get_issue_group_counts 와 같은 결과 계산
+
+        롤업은 일 단위이므로 start_date/end_date 가 'YYYY-MM-DD' 형식일 때만 사용:
+        - start_date <= 일자 < end_date 는 롤업 행 합산
+        - created_at = end_date 00:00:00 인 일감(created_at <= end_date 경계)은 issues 에서 직접 합산
+        롤업이 아직 만들어지지 않았거나 날짜 형식이 다르거나 DB 실패 시 None (호출하는 쪽에서 원본 집계 사용)
+        """
+        if not project_ids:
+            return []
+
+        invalid_columns = [column for column in group_columns if column not in self.ISSUE_GROUP_COLUMNS]
+        if invalid_columns or not group_columns:
+            raise ValueError(f"집계할 수 없는 컬럼입니다: {invalid_columns}")
+
+        try:
+            datetime.strptime(start_date, '%Y-%m-%d')
+            datetime.strptime(end_date, '%Y-%m-%d')
+        except (TypeError, ValueError):
+            return None
+
+        # 동기화로 롤업이 한 번이라도 만들어진 뒤에만 사용
+        if not self.get_sync_generation('issue_rollup'):
+            return None
+
+        conn = self.get_connection()
+        if not conn:
+            return None
+
+        try:
+            cursor = conn.cursor()
+
+            id_placeholders = ','.join(['%s'] * len(project_ids))
+            columns = ', '.join(group_columns)
+            query = f"""
+                SELECT {columns}, SUM(issue_count), MAX(last_updated_at)
+                FROM (
+                    SELECT {columns}, issue_count, last_updated_at
+                    FROM issue_rollup_daily
+                    WHERE rollup_date >= %s AND rollup_date < %s
+                       AND project_id IN ({id_placeholders})
+                    UNION ALL
+                    SELECT {columns}, 1, updated_at
+                    FROM issues
+                    WHERE created_at = %s
+                       AND project_id IN ({id_placeholders})
+                ) rollup
+                GROUP BY {columns}
+                ORDER BY MAX(last_updated_at) DESC
+            """
+
+            params = [start_date, end_date] + list(project_ids) + [end_date] + list(project_ids)
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+
+            groups = []
+            for row in rows:
+                group = dict(zip(group_columns, row[:-2]))
+                group['count'] = int(row[-2])
+                groups.append(group)
+            return groups
+
+        except Exception as e:
+            print(f"일감 롤업 집계 실패: {e}")
+            return None
+        finally:
+            conn.close()
+
+
 # ===== API 관련 메서드들 =====
 
     def get_user_api_key(self, login: str) -> Dict: # 수정 불가
@@ -1439,6 +2129,7 @@ class DatabaseManager:
             
             print(f"[로드맵 동기화] 모든 프로젝트 처리 완료")
             conn.commit()
+            self.bump_sync_generation('roadmap')
             
             print(f"[로드맵 동기화] 최종 결과: 총 {total_versions}개 버전, 저장 {saved_count}개")
             return {
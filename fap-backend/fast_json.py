@@ -0,0 +1,110 @@
+"""
+FAP 2.0 - 빠른 JSON 응답 (백엔드)
+
+주요 기능:
+- orjson 기반 응답 클래스 (datetime / date / Decimal / numpy 값 직접 처리)
+- 라우트에서 FastJSONResponse 를 바로 반환하면 FastAPI 의 jsonable_encoder 순회를 생략
+- 출력은 기존 응답과 같은 형식 (datetime 은 isoformat, dict 의 None/숫자 키는 문자열)
+
+orjson 은 선택 의존성:
+- 설치되지 않은 환경에서는 표준 json 으로 직렬화 (jsonable_encoder 생략은 동일)
+
+벤치마크:
+    python fast_json.py   # 대용량 분석 응답 형태의 데이터로 직렬화 시간 비교
+"""
+
+import datetime
+import decimal
+import json
+from typing import Any, Optional
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ORJSON_AVAILABLE = orjson is not None
+
+
+def _default(value: Any) -> Any:
+    """기본 직렬화가 못 하는 값 변환 (jsonable_encoder 와 같은 결과)"""
+    if isinstance(value, decimal.Decimal):
+        # jsonable_encoder 와 동일: 소수부가 없으면 int, 있으면 float
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if isinstance(value, bytes):
+        return value.decode()
+    raise TypeError(f"JSON 으로 직렬화할 수 없는 값입니다: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """응답 본문 직렬화 (orjson 이 없으면 표준 json)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """jsonable_encoder 없이 바로 직렬화하는 JSON 응답 (앱 기본 응답 클래스로도 사용)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def fast_json_response(content: Any, response: Optional[Response] = None) -> FastJSONResponse:
+    """라우트에서 직접 반환할 JSON 응답 (response 에 설정한 ETag 등 헤더를 함께 전달)"""
+    return FastJSONResponse(content, headers=response.headers if response is not None else None)
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from fastapi.encoders import jsonable_encoder
+
+    # 유형별 상세 리스트(type_data_list) 와 비슷한 구조: tracker → product → 인원 → 일감
+    rng = random.Random(0)
+    started_at = datetime.datetime(2025, 1, 1, 9, 30)
+    payload = {"success": True, "data": {"blocks": [{"type": "type_data_list", "data": {"type_list": [{
+        "tracker_name": f"[AE][이슈] Tracker {tracker}",
+        "total_count": 1000,
+        "completion_rate": 55.5,
+        "product_details": [{
+            "product_name": f"Product {product}",
+            "issue_titles": [f"이슈 제목 {n}" for n in range(100)],
+            "issue_numbers": list(range(100)),
+            "member_details": [{
+                "member_name": f"작업자 {member}",
+                "issues": [{
+                    "subject": f"이슈 제목 {n}",
+                    "redmine_id": n,
+                    "is_closed": rng.choice([0, 1]),
+                    "description": "설명 " * rng.randint(5, 40),
+                    "created_at": started_at + datetime.timedelta(hours=n),
+                    "cost": decimal.Decimal("12.50")
+                } for n in range(20)]
+            } for member in range(5)]
+        } for product in range(10)]
+    } for tracker in range(6)]}}]}}
+
+    def measure(label: str, serialize, repeat: int = 5):
+        best = min(_time(serialize) for _ in range(repeat))
+        print(f"{label:<40} {best * 1000:8.1f} ms")
+        return best
+
+    def _time(serialize) -> float:
+        started = time.perf_counter()
+        serialize()
+        return time.perf_counter() - started
+
+    size = len(dumps(payload))
+    print(f"payload: {size / 1024 / 1024:.1f} MB, orjson: {ORJSON_AVAILABLE}")
+    baseline = measure("jsonable_encoder + JSONResponse", lambda: JSONResponse(jsonable_encoder(payload)))
+    fast = measure("FastJSONResponse", lambda: FastJSONResponse(payload))
+    print(f"{'speedup':<40} {baseline / fast:8.1f} x")
@@ -0,0 +1,50 @@
+"""
+FAP 2.0 - ETag / 304 응답 유틸리티 (백엔드)
+
+주요 기능:
+- 동기화 세대(sync_generations) + 요청 파라미터로 강한 ETag 생성
+- If-None-Match 헤더 비교 (여러 값, '*', 약한 비교 접두어 W/ 지원, GET/HEAD 요청만)
+- 일치하면 본문 없는 304 응답 (DB 조회와 직렬화 모두 생략)
+
+사용 예:
+    etag = make_etag("roadmap", [roadmap_generation, issues_generation])
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+    response.headers.update(etag_headers(etag))
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+from fastapi import Request, Response
+
+
+def make_etag(name: str, generations: List[int], params: Optional[Any] = None) -> str:
+    """응답 이름 + 데이터 세대 + 요청 파라미터 요약으로 강한 ETag 생성"""
+    parts = [name] + [str(generation) for generation in generations]
+    if params is not None:
+        serialized = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+        parts.append(hashlib.sha1(serialized.encode('utf-8')).hexdigest()[:16])
+    return f'"{"-".join(parts)}"'
+
+
+def etag_matches(request: Request, etag: Optional[str]) -> bool:
+    """요청의 If-None-Match 가 etag 와 일치하는지 (GET/HEAD 조건부 요청만 약한 비교, 그 외 메서드는 항상 False)"""
+    if not etag or request.method not in ('GET', 'HEAD'):
+        return False
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [candidate.strip() for candidate in header.split(',')]
+    return '*' in candidates or any(candidate.removeprefix('W/') == etag for candidate in candidates)
+
+
+def etag_headers(etag: str) -> Dict[str, str]:
+    """ETag 응답 헤더 (브라우저가 매번 재검증하도록 no-cache)"""
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
+def not_modified_response(etag: str) -> Response:
+    """본문 없는 304 응답"""
+    return Response(status_code=304, headers=etag_headers(etag))
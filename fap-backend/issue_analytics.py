@@ -0,0 +1,1167 @@
+"""
+FAP 2.0 - 이슈 분석 블럭 엔진 (백엔드)
+
+주요 기능:
+- 분석 블럭(진행률, 유형, 인원, HW, SW 등)을 이름으로 등록하고 한 번에 계산
+- 각 블럭은 필요한 누적기(accumulator)만 선언하고, 여러 블럭이 같은 누적기를 공유
+- 이슈 목록은 요청된 블럭 수와 관계없이 한 번만 순회
+
+구조:
+- 누적기: add(issue) 로 이슈를 하나씩 받아 그룹별 상태를 쌓는 클래스 (ACCUMULATORS 에 등록)
+- 블럭: 누적기 결과로 최종 응답 데이터를 만드는 함수 (register_block 으로 등록)
+- compute_blocks(issues, names): 필요한 누적기를 모아 한 번 순회 후 블럭별 결과 반환
+- compute_blocks_from_groups(groups, names): 건수만 필요한 블럭을 SQL GROUP BY 결과로 계산
+- group_issues(issues, keys): author → product → 일감 같은 중첩 그룹을 1회 순회로 생성
+- 요약 모드(summary=True): 일감 목록 대신 건수 + 드릴다운 키만 반환 (상세는 키로 따로 조회)
+- fields: 블럭 안 일감 항목에 넣을 issues 컬럼 선택 (required_issue_columns 로 DB 조회 컬럼도 줄임)
+
+블럭 결과는 기존 헬퍼 함수(get_progress_summary, get_type_data_list 등)와 동일한 구조
+"""
+
+import base64
+import heapq
+import json
+import re
+import time
+from typing import Callable, Dict, List, Optional
+
+# tracker 이름 정리 / 상태 표시 순서 등 블럭 공통 상수
+BEST_WORK_STATUS = '[AE]BEST 작업'
+HW_TRACKER_NAME = '[AE][이슈] HW Part'
+SW_TRACKER_NAME = '[AE][이슈] SW Part'
+TRACKER_TEXT_SEPARATOR = "&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;"
+
+# 건수 블럭(is_count_block)을 SQL 집계로 계산할 때 GROUP BY 할 컬럼
+COUNT_GROUP_COLUMNS = ['tracker_name', 'status_name', 'product', 'is_closed', 'author_name']
+
+STATUS_ORDER_BY_TRACKER = {
+    '[AE][이슈] AE Part': [
+        '[AE][운영]이슈 등록',
+        '[AE][운영] 문제 조치',
+        '[AE][운영] 확산 적용',
+        '[AE][운영] 조치 완료',
+        '[AE]BEST 작업'
+    ],
+    '[AE][이슈] HW Part': [
+        '[AE][HW] 이슈 등록',
+        '[AE][HW] 개선 방향 협의',
+        '[AE][HW] 문제 조치',
+        '[AE][HW] 확산',
+        '[AE][HW] 조치 완료',
+        '[AE]BEST 작업'
+    ],
+    '[AE][이슈] SW Part': [
+        '[AE][SW] 이슈 등록',
+        '[AE][SW] 개선 방향 협의',
+        '[사내][SW] 개발',
+        '[사내][SW] 개발 완료',
+        '[AE][SW] 현장 적용',
+        '[AE][SW] 확산 Patch',
+        '[AE][SW] 조치 완료',
+        '[AE]BEST 작업'
+    ],
+    '[AE][Setup] 이설 Setup': [
+        '[AE][Setup] 반입&레벨링',
+        '[AE][Setup] 기초 Setup',
+        '[AE][Setup] TTTM',
+        '[AE][Setup] 자동화',
+        '[AE][Setup] Setup 완료'
+    ],
+    '[AE][Setup] 초기 Setup': [
+        '[AE][Setup] 반입&레벨링',
+        '[AE][Setup] 기초 Setup',
+        '[AE][Setup] TTTM',
+        '[AE][Setup] 자동화',
+        '[AE][Setup] Setup 완료'
+    ],
+    '[AE] 확산 적용': [
+        '[AE][확산] 확산 시작',
+        '[AE][확산] 확산 완료'
+    ]
+}
+
+
+def clean_tracker_name(tracker_name: str) -> str:
+    """tracker_name에서 대괄호 접두어 제거 (예: "[AE][이슈] HW Part" -> "HW Part")"""
+    return tracker_name.replace('[AE][이슈] ', '').replace('[AE][Setup] ', '').replace('[AE] ', '')
+
+
+def tracker_color(tracker_name: str, default: str = '#222222') -> str:
+    """tracker별 고정 색상 매핑 (HW 빨간색, SW 초록색, AE 파란색)"""
+    if 'HW' in tracker_name:
+        return '#FF6B6B'
+    elif 'SW' in tracker_name:
+        return '#4CAF50'
+    elif 'AE' in tracker_name:
+        return '#2196F3'
+    return default
+
+
+def format_sw_project_name(original_project_name: str) -> str:
+    """SW 분석용 프로젝트 이름: #번호 뒷부분만 남기고 첫 단어 파란색, 두 번째 단어부터 줄바꿈"""
+    processed_project_name = original_project_name
+
+    match = re.search(r'#\d+\s*(.+)', original_project_name)
+    if match:
+        processed_project_name = match.group(1).strip()
+
+    if processed_project_name:
+        words = processed_project_name.split()
+        if len(words) >= 1:
+            first_word = f'<span style="color: #007bff; font-weight: 600;">{words[0]}</span>'
+            if len(words) >= 2:
+                second_word = f'<br/>{words[1]}'
+                remaining_words = ' '.join(words[2:]) if len(words) > 2 else ''
+                processed_project_name = f'{first_word}{second_word} {remaining_words}'.strip()
+            else:
+                processed_project_name = first_word
+        else:
+            processed_project_name = ''
+
+    return processed_project_name
+
+
+# ===== 그룹핑 유틸리티 =====
+
+class IssueGrouper:
+    """키 순서대로 중첩 그룹 생성 (예: author_name → product → 일감 목록), 처음 등장한 순서 유지
+
+    keys 는 컬럼 이름 또는 issue 를 받아 키를 돌려주는 함수, defaults 는 컬럼별 값이 없을 때 쓸 키
+    """
+
+    def __init__(self, keys: List, defaults: Optional[Dict] = None, transform: Optional[Callable] = None):
+        if not keys:
+            raise ValueError("그룹핑 키가 필요합니다")
+        defaults = defaults or {}
+        self.key_getters = [self._key_getter(key, defaults) for key in keys]
+        self.transform = transform
+        self.groups = {}
+
+    @staticmethod
+    def _key_getter(key, defaults: Dict) -> Callable:
+        if callable(key):
+            return key
+        if key in defaults:
+            default = defaults[key]
+            return lambda issue: issue.get(key, default)
+        return lambda issue: issue.get(key)
+
+    def add(self, issue: Dict):
+        node = self.groups
+        for get_key in self.key_getters[:-1]:
+            key = get_key(issue)
+            child = node.get(key)
+            if child is None:
+                child = node[key] = {}
+            node = child
+
+        item = self.transform(issue) if self.transform else issue
+        node.setdefault(self.key_getters[-1](issue), []).append(item)
+
+
+def group_issues(issues: List[Dict], keys: List, defaults: Optional[Dict] = None, transform: Optional[Callable] = None) -> Dict:
+    """일감 목록을 한 번 순회해서 keys 순서의 중첩 그룹 생성 (IssueGrouper 참고)"""
+    grouper = IssueGrouper(keys, defaults, transform)
+    for issue in issues:
+        grouper.add(issue)
+    return grouper.groups
+
+
+# ===== 누적기 =====
+
+class IssueAccumulator:
+    """누적기 공통 - 읽는 issues 컬럼 선언과 출력 일감 항목 필드 선택
+
+    COLUMNS 는 집계/그룹핑에 항상 필요한 컬럼, ENTRY_COLUMNS 는 출력 일감 항목 키 → 원본 컬럼.
+    fields 가 주어지면 fields 에 없는 컬럼에서 온 항목 키는 출력하지 않음 (None 이면 전체)
+    """
+
+    COLUMNS: tuple = ()
+    ENTRY_COLUMNS: Dict[str, str] = {}
+
+    def __init__(self, fields: Optional[List[str]] = None):
+        self.fields = None if fields is None else frozenset(fields)
+        self.dropped_keys = [] if fields is None else [
+            key for key, column in self.ENTRY_COLUMNS.items() if column not in self.fields
+        ]
+
+    def includes(self, column: str) -> bool:
+        """출력 일감 항목에 column 을 넣는지"""
+        return self.fields is None or column in self.fields
+
+    def prune(self, entry: Dict) -> Dict:
+        """fields 에 없는 컬럼에서 온 키를 일감 항목에서 제거"""
+        for key in self.dropped_keys:
+            del entry[key]
+        return entry
+
+    @classmethod
+    def required_columns(cls, fields: Optional[List[str]] = None) -> List[str]:
+        """이 누적기가 읽는 issues 컬럼 (출력 항목 컬럼은 fields 에 있는 것만)"""
+        entry_columns = [column for column in cls.ENTRY_COLUMNS.values() if fields is None or column in fields]
+        return list(dict.fromkeys(list(cls.COLUMNS) + entry_columns))
+
+
+class IssueCounter(IssueAccumulator):
+    """전체 일감 수 / 완료 일감 수"""
+
+    COLUMNS = ('is_closed',)
+
+    def __init__(self, fields: Optional[List[str]] = None):
+        super().__init__(fields)
+        self.total = 0
+        self.completed = 0
+
+    def add(self, issue: Dict):
+        self.add_group(issue, 1)
+
+    def add_group(self, group: Dict, count: int):
+        self.total += count
+        if group.get('is_closed') == 1:
+            self.completed += count
+
+
+class TrackerStatusCounter(IssueAccumulator):
+    """tracker → status → 전체/완료 건수 (처음 등장한 순서 유지)"""
+
+    COLUMNS = ('tracker_name', 'status_name', 'is_closed')
+
+    def __init__(self, fields: Optional[List[str]] = None):
+        super().__init__(fields)
+        self.trackers = {}
+
+    def add(self, issue: Dict):
+        self.add_group(issue, 1)
+
+    def add_group(self, group: Dict, count: int):
+        tracker_name = group.get('tracker_name', 'Unknown')
+        status_name = group.get('status_name', 'Unknown')
+
+        statuses = self.trackers.get(tracker_name)
+        if statuses is None:
+            statuses = self.trackers[tracker_name] = {}
+        stats = statuses.get(status_name)
+        if stats is None:
+            stats = statuses[status_name] = {'total': 0, 'completed': 0}
+
+        stats['total'] += count
+        if group.get('is_closed', 0) == 1:
+            stats['completed'] += count
+
+    def tracker_totals(self) -> Dict[str, Dict]:
+        """tracker별 전체/완료 건수 합계"""
+        totals = {}
+        for tracker_name, statuses in self.trackers.items():
+            totals[tracker_name] = {
+                'total': sum(stats['total'] for stats in statuses.values()),
+                'completed': sum(stats['completed'] for stats in statuses.values())
+            }
+        return totals
+
+
+class TrackerStatusIssues(IssueAccumulator):
+    """tracker → status → 진행률 상세용 일감 요약 리스트"""
+
+    COLUMNS = ('tracker_name', 'status_name')
+    ENTRY_COLUMNS = {
+        'subject': 'subject',
+        'description': 'description',
+        'status_name': 'status_name',
+        'redmine_id': 'redmine_id',
+        'author_name': 'author_name'
+    }
+
+    def __init__(self, fields: Optional[List[str]] = None):
+        super().__init__(fields)
+        self.trackers = {}
+
+    def add(self, issue: Dict):
+        tracker_name = issue.get('tracker_name', 'Unknown')
+        status_name = issue.get('status_name', 'Unknown')
+
+        statuses = self.trackers.setdefault(tracker_name, {})
+        statuses.setdefault(status_name, []).append(self.prune({
+            'assigned_to': issue.get('assigned_to', '미지정'),
+            'subject': issue.get('subject', '제목 없음'),
+            'description': issue.get('description', '내용 없음'),
+            'status_name': status_name,
+            'redmine_id': issue.get('redmine_id', 0),
+            'author_name': issue.get('author_name', '미지정')
+        }))
+
+
+class ProductTrackerCounter(IssueAccumulator):
+    """product(설비군) → 전체 건수 + tracker별 전체/완료 건수"""
+
+    COLUMNS = ('product', 'tracker_name', 'is_closed')
+
+    def __init__(self, fields: Optional[List[str]] = None):
+        super().__init__(fields)
+        self.products = {}
+
+    def add(self, issue: Dict):
+        self.add_group(issue, 1)
+
+    def add_group(self, group: Dict, count: int):
+        product_name = group.get('product', 'Unknown')
+
+        product = self.products.get(product_name)
+        if product is None:
+            product = self.products[product_name] = {'total': 0, 'trackers': {}}
+        product['total'] += count
+
+        tracker = product['trackers'].get(group.get('tracker_name'))
+        if tracker is None:
+            tracker = product['trackers'][group.get('tracker_name')] = {'total': 0, 'completed': 0}
+        tracker['total'] += count
+        if group.get('is_closed') == 1:
+            tracker['completed'] += count
+
+
+class ProjectNameCounter(IssueAccumulator):
+    """project_name → 전체/완료 건수"""
+
+    COLUMNS = ('project_name', 'is_closed')
+
+    def __init__(self, fields: Optional[List[str]] = None):
+        super().__init__(fields)
+        self.projects = {}
+
+    def add(self, issue: Dict):
+        project_name = issue.get('project_name', '')
+
+        stats = self.projects.get(project_name)
+        if stats is None:
+            stats = self.projects[project_name] = {'total': 0, 'completed': 0}
+        stats['total'] += 1
+        if issue.get('is_closed', 0) == 1:
+            stats['completed'] += 1
+
+
+class BestWorkIssues(IssueAccumulator):
+    """[AE]BEST 작업 상태의 일감 목록"""
+
+    COLUMNS = ('status_name',)
+    ENTRY_COLUMNS = {
+        'author': 'author_name',
+        'product': 'product',
+        'issue_id': 'redmine_id',
+        'subject': 'subject'
+    }
+
+    def __init__(self, fields: Optional[List[str]] = None):
+        super().__init__(fields)
+        self.issues = []
+
+    def add(self, issue: Dict):
+        if issue.get('status_name') == BEST_WORK_STATUS:
+            self.issues.append(issue)
+
+
+class BestWorkAuthorCounter(IssueAccumulator):
+    """작성자별 [AE]BEST 작업 건수 (처음 등장한 순서 유지)"""
+
+    COLUMNS = ('status_name', 'author_name')
+
+    def __init__(self, fields: Optional[List[str]] = None):
+        super().__init__(fields)
+        self.authors = {}
+
+    def add(self, issue: Dict):
+        self.add_group(issue, 1)
+
+    def add_group(self, group: Dict, count: int):
+        if group.get('status_name') != BEST_WORK_STATUS:
+            return
+        author_name = group.get('author_name', '')
+        if author_name:
+            self.authors[author_name] = self.authors.get(author_name, 0) + count
+
+
+class MemberIssueStats(IssueAccumulator):
+    """작성자 → 전체/진행/완료 건수, tracker 유형별 건수, Product별 일감 목록"""
+
+    COLUMNS = ('author_name', 'tracker_name', 'is_closed', 'product')
+    ENTRY_COLUMNS = {
+        'redmine_id': 'redmine_id',
+        'subject': 'subject',
+        'tracker_name': 'tracker_name',
+        'status_name': 'status_name',
+        'created_date': 'created_at',
+        'updated_date': 'updated_at',
+        'description': 'description',
+        'is_closed': 'is_closed'
+    }
+
+    def __init__(self, fields: Optional[List[str]] = None):
+        super().__init__(fields)
+        self.members = {}
+        # Product별 일감 목록은 author_name 값 그대로 묶음 (값이 없는 일감은 'Unknown' 작업자에 포함하지 않음)
+        self.products = IssueGrouper(['author_name', 'product'], {'product': 'Unknown'}, self._product_issue)
+
+    def _product_issue(self, issue: Dict) -> Dict:
+        return self.prune({
+            'redmine_id': issue.get('redmine_id'),
+            'subject': issue.get('subject'),
+            'tracker_name': issue.get('tracker_name'),
+            'status_name': issue.get('status_name'),
+            'created_date': issue.get('created_at'),
+            'updated_date': issue.get('updated_at'),
+            'description': issue.get('description'),
+            'is_closed': issue.get('is_closed')
+        })
+
+    def add(self, issue: Dict):
+        author_name = issue.get('author_name', 'Unknown')
+        clean_name = clean_tracker_name(issue.get('tracker_name', 'Unknown'))
+
+        member = self.members.get(author_name)
+        if member is None:
+            member = self.members[author_name] = {
+                'total_tasks': 0,
+                'in_progress_tasks': 0,
+                'completed_tasks': 0,
+                'in_progress_types': {},
+                'completed_types': {}
+            }
+
+        member['total_tasks'] += 1
+        if issue.get('is_closed', 0) == 1:
+            member['completed_tasks'] += 1
+            types = member['completed_types']
+        else:
+            member['in_progress_tasks'] += 1
+            types = member['in_progress_types']
+        types[clean_name] = types.get(clean_name, 0) + 1
+
+        self.products.add(issue)
+
+
+class TrackerProductDetails(IssueAccumulator):
+    """tracker → product → 인원별 통계와 일감 목록 (유형별 상세 리스트용)"""
+
+    COLUMNS = ('tracker_name', 'product', 'is_closed', 'author_name')
+    ENTRY_COLUMNS = {
+        'subject': 'subject',
+        'redmine_id': 'redmine_id',
+        'is_closed': 'is_closed',
+        'description': 'description'
+    }
+
+    # Product 항목의 일감별 값 목록 키 → (누적 목록 이름, 원본 컬럼)
+    PRODUCT_LIST_COLUMNS = {
+        'issue_titles': ('titles', 'subject'),
+        'issue_closed_status': ('closed_status', 'is_closed'),
+        'issue_numbers': ('issue_numbers', 'redmine_id'),
+        'issue_descriptions': ('descriptions', 'description')
+    }
+
+    def __init__(self, fields: Optional[List[str]] = None):
+        super().__init__(fields)
+        self.trackers = {}
+        # Product 항목에 포함할 일감별 값 목록 (fields 에 없는 컬럼 목록은 쌓지 않음)
+        self.product_lists = {
+            key: list_name for key, (list_name, column) in self.PRODUCT_LIST_COLUMNS.items() if self.includes(column)
+        }
+
+    def add(self, issue: Dict):
+        tracker_name = issue.get('tracker_name', 'Unknown')
+        product = issue.get('product', 'Unknown')
+        is_closed = issue.get('is_closed', 0)
+        subject = issue.get('subject', '제목 없음')
+        description = issue.get('description', '')
+        redmine_id = issue.get('redmine_id', 0)
+        assigned_to = issue.get('author_name', 'Unknown')
+
+        tracker = self.trackers.get(tracker_name)
+        if tracker is None:
+            tracker = self.trackers[tracker_name] = {'total': 0, 'completed': 0, 'in_progress': 0, 'products': {}}
+        tracker['total'] += 1
+        if issue.get('is_closed') == 1:
+            tracker['completed'] += 1
+        elif issue.get('is_closed') == 0:
+            tracker['in_progress'] += 1
+
+        stats = tracker['products'].get(product)
+        if stats is None:
+            stats = tracker['products'][product] = {
+                'total': 0,
+                'completed': 0,
+                'in_progress': 0,
+                'titles': [],
+                'closed_status': [],
+                'issue_numbers': [],
+                'descriptions': [],
+                'members': {}
+            }
+        stats['total'] += 1
+        if self.fields is None:
+            stats['titles'].append(subject)
+            stats['closed_status'].append(is_closed)
+            stats['issue_numbers'].append(redmine_id)
+            stats['descriptions'].append(description)
+        else:
+            values = {'titles': subject, 'closed_status': is_closed, 'issue_numbers': redmine_id, 'descriptions': description}
+            for list_name in self.product_lists.values():
+                stats[list_name].append(values[list_name])
+
+        member = stats['members'].get(assigned_to)
+        if member is None:
+            member = stats['members'][assigned_to] = {'total': 0, 'completed': 0, 'in_progress': 0, 'issues': []}
+        member['total'] += 1
+        member['issues'].append(self.prune({
+            'subject': subject,
+            'redmine_id': redmine_id,
+            'is_closed': is_closed,
+            'description': description
+        }))
+
+        if is_closed == 1:
+            stats['completed'] += 1
+            member['completed'] += 1
+        else:
+            stats['in_progress'] += 1
+            member['in_progress'] += 1
+
+
+class HwEquipmentIssues(IssueAccumulator):
+    """HW 이슈의 설비군별 [HW]/[Optic] 부품 값과 상세 목록"""
+
+    COLUMNS = ('tracker_name', 'product', 'raw_data')
+    ENTRY_COLUMNS = {
+        'redmine_id': 'redmine_id',
+        'subject': 'subject',
+        'is_closed': 'is_closed',
+        'description': 'description'
+    }
+
+    def __init__(self, fields: Optional[List[str]] = None):
+        super().__init__(fields)
+        self.hw_issue_count = 0
+        self.equipment = {}
+
+    def add(self, issue: Dict):
+        if issue.get('tracker_name') != HW_TRACKER_NAME:
+            return
+        self.hw_issue_count += 1
+
+        product_name = issue.get('product', 'Unknown')
+        try:
+            raw_dict = json.loads(issue.get('raw_data', '{}'))
+        except json.JSONDecodeError:
+            return
+        custom_fields = raw_dict.get('custom_fields', [])
+
+        equipment = self.equipment.get(product_name)
+        if equipment is None:
+            equipment = self.equipment[product_name] = {
+                'total_hw_issues': 0,
+                'hw_components': [],
+                'hw_issues': []
+            }
+        equipment['total_hw_issues'] += 1
+
+        # [HW] 또는 [Optic] 태그가 있고 값이 있는 필드
+        hw_values = []
+        for field in custom_fields:
+            field_name = field.get('name', '')
+            field_value = field.get('value', '')
+            if ('[HW]' in field_name or '[Optic]' in field_name) and field_value:
+                hw_values.append(field_value)
+
+        if hw_values:
+            equipment['hw_components'].extend(hw_values)
+        else:
+            equipment['hw_components'].append("없음")
+
+        equipment['hw_issues'].append(self.prune({
+            'redmine_id': issue.get('redmine_id'),
+            'subject': issue.get('subject', ''),
+            'hw_components': hw_values,
+            'is_closed': issue.get('is_closed', 0),
+            'description': issue.get('description', '')
+        }))
+
+
+class SwProjectIssues(IssueAccumulator):
+    """SW 이슈의 설비군 → 프로젝트별 상세 목록"""
+
+    COLUMNS = ('tracker_name', 'product', 'project_id', 'project_name')
+    ENTRY_COLUMNS = {
+        'redmine_id': 'redmine_id',
+        'subject': 'subject',
+        'is_closed': 'is_closed',
+        'description': 'description',
+        'created_on': 'created_at',
+        'updated_on': 'updated_at',
+        'author_name': 'author_name',
+        'project_id': 'project_id',
+        'project_name': 'project_name'
+    }
+
+    def __init__(self, fields: Optional[List[str]] = None):
+        super().__init__(fields)
+        self.equipment = {}
+
+    def add(self, issue: Dict):
+        if issue.get('tracker_name') != SW_TRACKER_NAME:
+            return
+
+        product_name = issue.get('product', 'Unknown')
+        equipment = self.equipment.get(product_name)
+        if equipment is None:
+            equipment = self.equipment[product_name] = {
+                'total_sw_issues': 0,
+                'project_groups': {}
+            }
+        equipment['total_sw_issues'] += 1
+
+        project_id = issue.get('project_id', 'Unknown')
+        project_group = equipment['project_groups'].get(project_id)
+        if project_group is None:
+            project_group = equipment['project_groups'][project_id] = {
+                'total_issues': 0,
+                'project_name': format_sw_project_name(issue.get('project_name', '')),
+                'sw_issues': []
+            }
+        project_group['total_issues'] += 1
+
+        project_group['sw_issues'].append(self.prune({
+            'redmine_id': issue.get('redmine_id'),
+            'subject': issue.get('subject', ''),
+            'is_closed': issue.get('is_closed', 0),
+            'description': issue.get('description', ''),
+            'created_on': issue.get('created_at', ''),
+            'updated_on': issue.get('updated_at', ''),
+            'author_name': issue.get('author_name', ''),
+            'status': issue.get('status', ''),
+            'project_id': project_id,
+            'project_name': issue.get('project_name', '')
+        }))
+
+
+ACCUMULATORS = {
+    'issue_counter': IssueCounter,
+    'tracker_status_counter': TrackerStatusCounter,
+    'tracker_status_issues': TrackerStatusIssues,
+    'product_tracker_counter': ProductTrackerCounter,
+    'project_name_counter': ProjectNameCounter,
+    'best_work_issues': BestWorkIssues,
+    'best_work_author_counter': BestWorkAuthorCounter,
+    'member_issue_stats': MemberIssueStats,
+    'tracker_product_details': TrackerProductDetails,
+    'hw_equipment_issues': HwEquipmentIssues,
+    'sw_project_issues': SwProjectIssues,
+}
+
+
+# ===== 블럭 등록 =====
+
+BLOCKS: Dict[str, Dict] = {}
+
+# top_k 옵션을 받는 순위 블럭
+RANKING_BLOCKS = ('problematic_products', 'best_member_summary')
+
+# summary 옵션을 받는 블럭 (일감 목록 대신 드릴다운 키 반환)
+SUMMARY_BLOCKS = ('type_data_list', 'member_issue_type')
+
+
+def register_block(name: str, accumulators: List[str]) -> Callable:
+    """블럭 결과 생성 함수를 필요한 누적기 이름과 함께 등록하는 데코레이터"""
+    def decorator(build: Callable) -> Callable:
+        unknown = [key for key in accumulators if key not in ACCUMULATORS]
+        if unknown:
+            raise ValueError(f"등록되지 않은 누적기입니다: {unknown}")
+        BLOCKS[name] = {'accumulators': accumulators, 'build': build}
+        return build
+    return decorator
+
+
+def _create_accumulators(block_names: List[str], fields: Optional[List[str]] = None) -> Dict:
+    """요청된 블럭들이 필요로 하는 누적기만 한 번씩 생성 (fields 는 출력 일감 항목에 넣을 컬럼)"""
+    unknown = [name for name in block_names if name not in BLOCKS]
+    if unknown:
+        raise ValueError(f"등록되지 않은 블럭입니다: {unknown}")
+
+    accumulators = {}
+    for name in block_names:
+        for key in BLOCKS[name]['accumulators']:
+            if key not in accumulators:
+                accumulators[key] = ACCUMULATORS[key](fields)
+    return accumulators
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+def _build_blocks(accumulators: Dict, block_names: List[str], timings: Optional[Dict] = None, options: Optional[Dict] = None) -> Dict[str, Dict]:
+    """누적기 결과로 블럭별 최종 데이터 생성 (timings 가 있으면 timings['blocks'] 에 블럭별 ms 기록)
+
+    options 는 {블럭 이름: 결과 생성 함수 키워드 인자} (예: {'problematic_products': {'top_k': 5}})
+    """
+    options = options or {}
+    results = {}
+    for name in block_names:
+        started = time.perf_counter()
+        block_accumulators = (accumulators[key] for key in BLOCKS[name]['accumulators'])
+        results[name] = BLOCKS[name]['build'](*block_accumulators, **options.get(name, {}))
+        if timings is not None:
+            timings.setdefault('blocks', {})[name] = _elapsed_ms(started)
+    return results
+
+
+def compute_blocks(issues: List[Dict], block_names: List[str], timings: Optional[Dict] = None, options: Optional[Dict] = None, fields: Optional[List[str]] = None) -> Dict[str, Dict]:
+    """요청된 블럭들을 이슈 1회 순회로 계산해서 {블럭 이름: 결과} 반환
+
+    timings 가 있으면 공통 순회 시간(issue_pass_ms)과 블럭별 결과 생성 시간(blocks)을 기록
+    fields 가 있으면 블럭 안 일감 항목에 해당 issues 컬럼에서 온 값만 포함
+    (issues 는 required_issue_columns(block_names, fields) 컬럼만 있어도 됨)
+    """
+    accumulators = _create_accumulators(block_names, fields)
+
+    # 이슈 1회 순회로 모든 누적기 갱신
+    started = time.perf_counter()
+    adders = [accumulator.add for accumulator in accumulators.values()]
+    for issue in issues:
+        for add in adders:
+            add(issue)
+    if timings is not None:
+        timings['issue_pass_ms'] = _elapsed_ms(started)
+
+    return _build_blocks(accumulators, block_names, timings, options)
+
+
+def compute_block(issues: List[Dict], block_name: str, **options) -> Dict:
+    """블럭 하나만 계산 (options 는 블럭 결과 생성 함수 키워드 인자)"""
+    return compute_blocks(issues, [block_name], options={block_name: options})[block_name]
+
+
+def required_issue_columns(block_names: List[str], fields: Optional[List[str]] = None) -> List[str]:
+    """블럭 계산에 필요한 issues 컬럼 (DB 조회 컬럼 선택용, 선언 순서 유지)"""
+    unknown = [name for name in block_names if name not in BLOCKS]
+    if unknown:
+        raise ValueError(f"등록되지 않은 블럭입니다: {unknown}")
+
+    columns = {}
+    for name in block_names:
+        for key in BLOCKS[name]['accumulators']:
+            columns.update(dict.fromkeys(ACCUMULATORS[key].required_columns(fields)))
+    return list(columns)
+
+
+def is_count_block(block_name: str) -> bool:
+    """건수 집계만으로 계산할 수 있는 블럭인지 (모든 누적기가 add_group 지원)"""
+    block = BLOCKS.get(block_name)
+    if block is None:
+        return False
+    return all(hasattr(ACCUMULATORS[key], 'add_group') for key in block['accumulators'])
+
+
+def compute_blocks_from_groups(groups: List[Dict], block_names: List[str], timings: Optional[Dict] = None, options: Optional[Dict] = None) -> Dict[str, Dict]:
+    """GROUP BY 집계 행(COUNT_GROUP_COLUMNS 값 + 'count')으로 건수 블럭들을 계산
+
+    집계 행은 일감 조회와 같은 순서(최근 수정순으로 처음 등장한 순서)로 들어와야
+    tracker/status 출력 순서가 compute_blocks 결과와 같아짐
+    """
+    not_countable = [name for name in block_names if not is_count_block(name)]
+    if not_countable:
+        raise ValueError(f"건수 집계로 계산할 수 없는 블럭입니다: {not_countable}")
+
+    accumulators = _create_accumulators(block_names)
+
+    started = time.perf_counter()
+    adders = [accumulator.add_group for accumulator in accumulators.values()]
+    for group in groups:
+        count = group['count']
+        for add_group in adders:
+            add_group(group, count)
+    if timings is not None:
+        timings['group_pass_ms'] = _elapsed_ms(started)
+
+    return _build_blocks(accumulators, block_names, timings, options)
+
+
+# ===== 드릴다운 키 =====
+
+# 드릴다운 키로 지정할 수 있는 셀 컬럼 (tracker / product / 작업자)
+DRILL_COLUMNS = ('tracker_name', 'product', 'author_name')
+
+
+def encode_drill_key(**cell) -> str:
+    """셀 조건(tracker_name/product/author_name 값)을 URL 에 넣을 수 있는 불투명 키로 변환"""
+    unknown = [column for column in cell if column not in DRILL_COLUMNS]
+    if unknown:
+        raise ValueError(f"드릴다운 컬럼이 아닙니다: {unknown}")
+    payload = json.dumps(cell, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_drill_key(drill_key: str) -> Dict:
+    """encode_drill_key 로 만든 키를 셀 조건으로 되돌림 (형식이 잘못되면 ValueError)"""
+    try:
+        padded = drill_key + '=' * (-len(drill_key) % 4)
+        cell = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+    except Exception:
+        raise ValueError("잘못된 드릴다운 키입니다")
+    if not isinstance(cell, dict) or not cell or any(column not in DRILL_COLUMNS for column in cell):
+        raise ValueError("잘못된 드릴다운 키입니다")
+    return cell
+
+
+# ===== 블럭 정의 =====
+
+@register_block('overall_issue_status', ['issue_counter', 'tracker_status_counter'])
+def build_overall_issue_status(counter: IssueCounter, tracker_status: TrackerStatusCounter) -> Dict:
+    """전체 이슈 현황 (완료율 + tracker별 건수 텍스트)"""
+    total_issues = counter.total
+    completed_count = counter.completed
+    completion_rate = (completed_count / total_issues * 100) if total_issues > 0 else 0
+
+    tracker_counts = {}
+    for tracker_name, stats in tracker_status.tracker_totals().items():
+        clean_name = clean_tracker_name(tracker_name)
+        tracker_counts[clean_name] = tracker_counts.get(clean_name, 0) + stats['total']
+
+    tracker_text_parts = [
+        f'<span style="color: {tracker_color(tracker_name)}">{tracker_name}: {count}건</span>'
+        for tracker_name, count in tracker_counts.items()
+    ]
+
+    # 3개씩 그룹으로 나누어서 줄바꿈
+    tracker_text = ""
+    for i in range(0, len(tracker_text_parts), 3):
+        tracker_text += TRACKER_TEXT_SEPARATOR.join(tracker_text_parts[i:i+3])
+        if i + 3 < len(tracker_text_parts):
+            tracker_text += "<br>"
+
+    return {
+        "total_issues": total_issues,
+        "completed_count": completed_count,
+        "in_progress_count": total_issues - completed_count,
+        "completion_rate": round(completion_rate, 1),
+        "tracker_text": tracker_text
+    }
+
+
+def top_k_items(items, top_k: Optional[int], key: Callable) -> List:
+    """key 기준 내림차순 상위 top_k개 (None 이면 전체 정렬, 동률은 원래 순서 유지 - sorted(reverse=True)와 같은 결과)"""
+    if top_k is None:
+        return sorted(items, key=key, reverse=True)
+    return heapq.nlargest(top_k, items, key=key)
+
+
+@register_block('problematic_products', ['project_name_counter'])
+def build_problematic_products(project_names: ProjectNameCounter, top_k: int = 3) -> Dict:
+    """진행중 일감이 가장 많은 Product Top K (기본 3개)"""
+    product_stats = {}
+    for project_name, stats in project_names.projects.items():
+        # Product 이름 추출 (예: "설비A #01" -> "설비A")
+        product_name = project_name.split('#')[0].strip() if '#' in project_name else project_name
+        if product_name not in product_stats:
+            product_stats[product_name] = {'in_progress': 0, 'completed': 0, 'total': 0}
+        product_stats[product_name]['total'] += stats['total']
+        product_stats[product_name]['completed'] += stats['completed']
+        product_stats[product_name]['in_progress'] += stats['total'] - stats['completed']
+
+    sorted_products = top_k_items(product_stats.items(), top_k, key=lambda x: x[1]['in_progress'])
+
+    problematic_products = []
+    for product_name, stats in sorted_products:
+        completion_rate = (stats['completed'] / stats['total'] * 100) if stats['total'] > 0 else 0
+        problematic_products.append({
+            'product': product_name,
+            'in_progress': stats['in_progress'],
+            'completed': stats['completed'],
+            'completion_rate': round(completion_rate, 1)
+        })
+
+    return {
+        "type": "problematic_products",
+        "data": problematic_products
+    }
+
+
+@register_block('best_member_data', ['best_work_issues'])
+def build_best_member_data(best_work: BestWorkIssues) -> Dict:
+    """[AE]BEST 작업 일감 상세 리스트"""
+    best_member_data = [best_work.prune({
+        'author': issue.get('author_name', ''),
+        'product': issue.get('product', ''),
+        'issue_id': issue.get('redmine_id', ''),
+        'subject': issue.get('subject', '')
+    }) for issue in best_work.issues]
+
+    return {
+        "type": "best_member_data",
+        "data": best_member_data
+    }
+
+
+@register_block('best_member_summary', ['best_work_author_counter'])
+def build_best_member_summary(best_work_authors: BestWorkAuthorCounter, top_k: Optional[int] = None) -> Dict:
+    """작성자별 [AE]BEST 작업 건수 (건수 내림차순, top_k 가 있으면 상위 K명만)"""
+    best_member_summary = [
+        {'author': author_name, 'count': count}
+        for author_name, count in top_k_items(best_work_authors.authors.items(), top_k, key=lambda x: x[1])
+    ]
+
+    return {
+        "type": "best_member_summary",
+        "data": best_member_summary
+    }
+
+
+@register_block('member_issue_type', ['member_issue_stats'])
+def build_member_issue_type(member_stats: MemberIssueStats, summary: bool = False) -> Dict:
+    """작업자별 이슈 유형 (진행중/완료 유형 텍스트 + Product별 일감 목록)
+
+    summary 이면 Product별 일감 목록 대신 {건수, 드릴다운 키}만 반환
+    """
+    member_issue_data = []
+    for author_name, stats in member_stats.members.items():
+        completion_rate = round((stats['completed_tasks'] / stats['total_tasks']) * 100, 1) if stats['total_tasks'] > 0 else 0
+
+        in_progress_text_parts = [
+            f'<span style="color: {tracker_color(tracker_name)}">{tracker_name}: {count}건</span>'
+            for tracker_name, count in stats['in_progress_types'].items()
+        ]
+        completed_text_parts = [
+            f'<span style="color: {tracker_color(tracker_name)}">{tracker_name}: {count}건</span>'
+            for tracker_name, count in stats['completed_types'].items()
+        ]
+
+        products = member_stats.products.groups.get(author_name, {})
+        if summary:
+            products = {
+                product: {
+                    'total_count': len(issues),
+                    'drill_key': encode_drill_key(author_name=author_name, product=product)
+                }
+                for product, issues in products.items()
+            }
+
+        member_data = {
+            'worker': author_name,
+            'total_tasks': stats['total_tasks'],
+            'in_progress_tasks': stats['in_progress_tasks'],
+            'completed_tasks': stats['completed_tasks'],
+            'completion_rate': completion_rate,
+            'in_progress_types': TRACKER_TEXT_SEPARATOR.join(in_progress_text_parts) if in_progress_text_parts else "없음",
+            'completed_types': TRACKER_TEXT_SEPARATOR.join(completed_text_parts) if completed_text_parts else "없음",
+            'products': products
+        }
+        if summary:
+            member_data['drill_key'] = encode_drill_key(author_name=author_name)
+        member_issue_data.append(member_data)
+
+    # 전체 작업 수로 정렬 (내림차순)
+    member_issue_data.sort(key=lambda x: x['total_tasks'], reverse=True)
+
+    return {
+        "type": "member_issue_type",
+        "title": "작업자별 이슈 유형",
+        "data": member_issue_data
+    }
+
+
+@register_block('type_data_count', ['tracker_status_counter'])
+def build_type_data_count(tracker_status: TrackerStatusCounter) -> Dict:
+    """tracker_name별 일감 수"""
+    return {
+        "tracker_counts": {
+            tracker_name: stats['total']
+            for tracker_name, stats in tracker_status.tracker_totals().items()
+        }
+    }
+
+
+@register_block('type_data_list', ['tracker_product_details'])
+def build_type_data_list(details: TrackerProductDetails, summary: bool = False) -> Dict:
+    """tracker → Product → 인원별 상세 리스트
+
+    summary 이면 일감 제목/설명/번호 목록을 빼고 tracker/Product/인원 셀마다 드릴다운 키만 반환
+    """
+    type_list = []
+    for tracker_name, tracker in details.trackers.items():
+        product_details = []
+        for product, stats in tracker['products'].items():
+            product_completion_rate = (stats['completed'] / stats['total'] * 100) if stats['total'] > 0 else 0
+
+            member_details = []
+            for member_name, member in stats['members'].items():
+                member_completion_rate = (member['completed'] / member['total'] * 100) if member['total'] > 0 else 0
+                member_detail = {
+                    'member_name': member_name,
+                    'total_count': member['total'],
+                    'completed_count': member['completed'],
+                    'in_progress_count': member['in_progress'],
+                    'completion_rate': round(member_completion_rate, 1)
+                }
+                if summary:
+                    member_detail['drill_key'] = encode_drill_key(tracker_name=tracker_name, product=product, author_name=member_name)
+                else:
+                    member_detail['issues'] = member['issues']
+                member_details.append(member_detail)
+            member_details.sort(key=lambda x: x['total_count'], reverse=True)
+
+            product_detail = {
+                'product_name': product,
+                'total_count': stats['total'],
+                'completed_count': stats['completed'],
+                'in_progress_count': stats['in_progress'],
+                'completion_rate': round(product_completion_rate, 1)
+            }
+            if summary:
+                product_detail['drill_key'] = encode_drill_key(tracker_name=tracker_name, product=product)
+            else:
+                product_detail.update({key: stats[list_name] for key, list_name in details.product_lists.items()})
+            product_detail['member_details'] = member_details
+            product_details.append(product_detail)
+        product_details.sort(key=lambda x: x['completion_rate'], reverse=True)
+
+        completion_rate = (tracker['completed'] / tracker['total'] * 100) if tracker['total'] > 0 else 0
+        tracker_detail = {
+            "tracker_name": tracker_name,
+            "total_count": tracker['total'],
+            "completed_count": tracker['completed'],
+            "in_progress_count": tracker['in_progress'],
+            "completion_rate": round(completion_rate, 1),
+            "product_details": product_details
+        }
+        if summary:
+            tracker_detail["drill_key"] = encode_drill_key(tracker_name=tracker_name)
+        type_list.append(tracker_detail)
+
+    # 총 건수로 정렬 (내림차순)
+    type_list.sort(key=lambda x: x['total_count'], reverse=True)
+
+    return {
+        "type_list": type_list
+    }
+
+
+@register_block('progress_summary', ['tracker_status_counter'])
+def build_progress_summary(tracker_status: TrackerStatusCounter) -> Dict:
+    """tracker → status별 진행률 요약 ([사내] tracker 제외)"""
+    progress_data = []
+    for tracker_name, statuses in tracker_status.trackers.items():
+        if '[사내]' in tracker_name:
+            continue
+
+        tracker_total = 0
+        tracker_completed = 0
+        status_details = []
+        for status_name, stats in statuses.items():
+            tracker_total += stats['total']
+            tracker_completed += stats['completed']
+            status_details.append({
+                'status_name': status_name,
+                'total_count': stats['total'],
+                'completed_count': stats['completed'],
+                'in_progress_count': stats['total'] - stats['completed']
+            })
+
+        tracker_completion_rate = (tracker_completed / tracker_total * 100) if tracker_total > 0 else 0
+        progress_data.append({
+            'tracker_name': tracker_name,
+            'total_count': tracker_total,
+            'completed_count': tracker_completed,
+            'in_progress_count': tracker_total - tracker_completed,
+            'completion_rate': round(tracker_completion_rate, 1),
+            'status_details': status_details
+        })
+
+    # 전체 갯수 기준으로 정렬 (내림차순)
+    progress_data.sort(key=lambda x: x['total_count'], reverse=True)
+
+    return {
+        "progress_data": progress_data
+    }
+
+
+@register_block('progress_detail', ['tracker_status_issues'])
+def build_progress_detail(tracker_status: TrackerStatusIssues) -> Dict:
+    """tracker별 상태 순서대로 정렬한 진행률 상세 일감 목록"""
+    detail_data = []
+    for tracker_name, status_groups in tracker_status.trackers.items():
+        current_status_order = STATUS_ORDER_BY_TRACKER.get(tracker_name, [])
+
+        # 정의된 순서대로 먼저 (카운트가 0이어도 출력), 정의되지 않은 상태는 뒤에
+        status_details = [
+            {'status_name': status_name, 'issues': status_groups.get(status_name, [])}
+            for status_name in current_status_order
+        ]
+        status_details.extend(
+            {'status_name': status_name, 'issues': issues}
+            for status_name, issues in status_groups.items()
+            if status_name not in current_status_order
+        )
+
+        detail_data.append({
+            'tracker_name': tracker_name,
+            'status_details': status_details
+        })
+
+    return {
+        "progress_detail": detail_data
+    }
+
+
+@register_block('hw_equipment_analysis', ['hw_equipment_issues'])
+def build_hw_equipment_analysis(hw_equipment: HwEquipmentIssues) -> Dict:
+    """설비군별 HW 부품 문제 분석"""
+    return hw_equipment.equipment
+
+
+def _build_part_overview(part: str, tracker_name: str, counter: IssueCounter, products: ProductTrackerCounter) -> Dict:
+    """HW/SW 공통 - 설비군별 전체 이슈 대비 해당 Part 이슈 요약"""
+    part_total = 0
+    part_completed = 0
+    equipment_summary = {}
+    for equipment, product in products.products.items():
+        stats = product['trackers'].get(tracker_name, {'total': 0, 'completed': 0})
+        part_total += stats['total']
+        part_completed += stats['completed']
+
+        equipment_summary[equipment] = {
+            "total": product['total'],
+            part: stats['total'],
+            f"{part}_ratio": round((stats['total'] / product['total'] * 100), 1) if product['total'] > 0 else 0,
+            f"{part}_completion_rate": round((stats['completed'] / stats['total'] * 100), 1) if stats['total'] > 0 else 0
+        }
+
+    if part_total == 0:
+        return {
+            f"total_{part}_issues": 0,
+            "total_equipment": 0,
+            "completion_rate": 0,
+            "equipment_summary": {}
+        }
+
+    total_all_issues = counter.total
+    return {
+        f"total_{part}_issues": part_total,
+        "total_all_issues": total_all_issues,
+        f"{part}_ratio": round((part_total / total_all_issues * 100), 1) if total_all_issues > 0 else 0,
+        "completion_rate": round((part_completed / part_total * 100), 1),
+        "equipment_summary": equipment_summary
+    }
+
+
+@register_block('hw_overview_summary', ['issue_counter', 'product_tracker_counter'])
+def build_hw_overview_summary(counter: IssueCounter, products: ProductTrackerCounter) -> Dict:
+    """HW 이슈 전체 요약"""
+    return _build_part_overview('hw', HW_TRACKER_NAME, counter, products)
+
+
+@register_block('sw_overview_summary', ['issue_counter', 'product_tracker_counter'])
+def build_sw_overview_summary(counter: IssueCounter, products: ProductTrackerCounter) -> Dict:
+    """SW 이슈 전체 요약"""
+    return _build_part_overview('sw', SW_TRACKER_NAME, counter, products)
+
+
+@register_block('sw_detail_analysis', ['sw_project_issues'])
+def build_sw_detail_analysis(sw_projects: SwProjectIssues) -> Dict:
+    """설비군 → 프로젝트별 SW 이슈 상세 분석"""
+    return sw_projects.equipment
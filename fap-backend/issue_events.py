@@ -0,0 +1,101 @@
+"""
+FAP 2.0 - 일감 변경 이벤트 pub/sub (백엔드)
+
+주요 기능:
+- 프로세스 내 토픽별 발행/구독 (구독자마다 크기 제한이 있는 asyncio.Queue)
+- 상태 변경 API 가 이벤트를 발행하면 WebSocket 으로 연결된 대시보드에 바로 전달
+  (클라이언트는 전체 분석을 다시 요청하지 않고 화면 상태만 갱신)
+- 느린 구독자의 큐가 가득 차면 쌓인 이벤트를 버리고 resync 이벤트 1개로 교체
+  (클라이언트는 resync 를 받으면 전체 데이터를 다시 조회)
+- 발행/전달/resync 횟수와 구독자 수 지표 (/api/metrics)
+
+주의:
+- 같은 프로세스의 구독자에게만 전달 (워커를 여러 개 띄우면 워커별로 따로 동작)
+- publish 는 이벤트 루프 스레드에서 호출 (스레드 풀 작업 안에서는 호출하지 않음)
+
+사용 예:
+    async with issue_event_broker.subscribe(ISSUE_STATUS_TOPIC) as queue:
+        event = await queue.get()
+    issue_event_broker.publish(ISSUE_STATUS_TOPIC, make_status_event(...))
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+from config import ISSUE_EVENT_QUEUE_SIZE
+
+# 일감 상태 변경 이벤트 토픽
+ISSUE_STATUS_TOPIC = "issue_status"
+
+# 구독자 큐가 넘쳤을 때 대신 보내는 이벤트 (전체 다시 조회 필요)
+RESYNC_EVENT = {'type': 'resync'}
+
+
+def make_status_event(redmine_id: int, old_status: str, new_status: str,
+                      tracker_name: Optional[str], product: Optional[str], project_id: Optional[int]) -> Dict:
+    """상태 변경 이벤트 (클라이언트가 화면의 해당 일감만 옮길 수 있는 최소 정보)"""
+    return {
+        'type': 'issue_status_changed',
+        'redmine_id': redmine_id,
+        'old_status': old_status,
+        'new_status': new_status,
+        'tracker_name': tracker_name,
+        'product': product,
+        'project_id': project_id
+    }
+
+
+class EventBroker:
+    """토픽별 구독자 큐에 이벤트를 나눠 주는 프로세스 내 pub/sub"""
+
+    def __init__(self, name: str, queue_size: int):
+        self.name = name
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self.published = 0
+        self.delivered = 0
+        self.resyncs = 0
+
+    @asynccontextmanager
+    async def subscribe(self, topic: str) -> AsyncIterator[asyncio.Queue]:
+        """topic 구독 (블록을 벗어나면 자동 해지)"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(topic, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            subscribers = self._subscribers.get(topic)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[topic]
+
+    def publish(self, topic: str, event: Any) -> int:
+        """topic 구독자 모두에게 이벤트 전달 (기다리지 않음), 전달한 구독자 수 반환"""
+        self.published += 1
+        subscribers = list(self._subscribers.get(topic, ()))
+        for queue in subscribers:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # 따라오지 못한 구독자: 쌓인 이벤트 대신 resync 하나만 남김
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(RESYNC_EVENT)
+                self.resyncs += 1
+        self.delivered += len(subscribers)
+        return len(subscribers)
+
+    def get_metrics(self) -> Dict:
+        """발행/전달 횟수와 토픽별 구독자 수"""
+        return {
+            'name': self.name,
+            'published': self.published,
+            'delivered': self.delivered,
+            'resyncs': self.resyncs,
+            'subscribers': {topic: len(queues) for topic, queues in self._subscribers.items()}
+        }
+
+
+issue_event_broker = EventBroker("issue_events", ISSUE_EVENT_QUEUE_SIZE)
@@ -11,12 +11,16 @@ FAP 2.0 - FastAPI 메인 애플리케이션 (백엔드)
 - 서버 초기화: FastAPI 앱 생성 및 미들웨어 설정
 - 라우터 통합: redmine_service, issue_database, setting_database 라우터 통합
 - CORS 설정: 프론트엔드와의 안전한 통신을 위한 CORS 미들웨어
+- 응답 압축: Accept-Encoding 협상으로 brotli/gzip 압축 (compression.py)
 - 사용자 인증: PMS 시스템과 연동된 로그인 API 제공
 - 기본 엔드포인트: 루트 경로, 헬스체크, 로그인 처리
+- 시작 시 초기화: 프로젝트 계층 스냅샷 로딩 (재시작 직후 첫 요청 지연 제거)
+- 블로킹 작업 분리: DB / Redmine / CPU 작업을 종류별 스레드 풀에서 실행하고 이벤트 루프 지연 측정 (blocking_pools.py)
 
 API 엔드포인트:
 - GET /: 루트 경로 (서버 상태 확인)
 - GET /api/health: 헬스체크 (서버 상태 점검)
+- GET /api/metrics: 서버 내부 지표 (동일 요청 합치기, 분석 프로세스 풀, 응답 캐시 적중률, 스레드 풀, 이벤트 루프 지연, 일감 이벤트 구독 등)
 - POST /api/login: 사용자 로그인 (PMS 시스템 인증)
 
 인증 시스템:
@@ -42,10 +46,20 @@ from routers.redmine_service import router as PMS_router
 from routers.issue_database import router as AE_issues_router
 from routers.setting_database import router as settings_router
 from routers.main_database import router as main_router
+from db_manager import DatabaseManager
+from project_hierarchy import load_hierarchy_snapshot
+from single_flight import get_single_flight_metrics
+from analytics_pool import get_analytics_pool_metrics, shutdown_analytics_pool
+from response_cache import get_response_cache_metrics
+from fast_json import FastJSONResponse
+from compression import CompressionMiddleware
+from blocking_pools import run_blocking, get_blocking_pool_metrics, shutdown_blocking_pools, loop_lag_monitor
+from issue_events import issue_event_broker
 from pydantic import BaseModel
 import requests
 
-app = FastAPI(title="FAP 2.0", version="0.1.0")
+# 기본 응답은 orjson 직렬화 (대용량 분석 라우트는 FastJSONResponse 를 직접 반환해서 jsonable_encoder 도 생략)
+app = FastAPI(title="FAP 2.0", version="0.1.0", default_response_class=FastJSONResponse)
 
 # CORS 설정 추가
 app.add_middleware(
@@ -60,11 +74,42 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 큰 응답은 Accept-Encoding 에 따라 brotli/gzip 압축 (첨부파일 등 이미 압축된 응답 제외)
+app.add_middleware(CompressionMiddleware)
+
 app.include_router(PMS_router)
 app.include_router(AE_issues_router)
 app.include_router(settings_router)
 app.include_router(main_router)
 
+@app.on_event("startup")
+def create_support_tables():
+    """서버 시작 시 보조 테이블 생성 (요청 처리 중 DDL 로 트랜잭션이 암묵적으로 커밋되지 않도록 미리 1번만 실행)"""
+    db = DatabaseManager()
+    db.create_sync_generations_table()
+    db.create_issue_rollup_table()
+
+@app.on_event("startup")
+def load_project_hierarchy():
+    """서버 시작 시 프로젝트 계층 스냅샷 로딩 (DB 동기화 세대와 다르면 새로 생성)"""
+    load_hierarchy_snapshot()
+
+@app.on_event("startup")
+async def start_loop_lag_monitor():
+    """서버 시작 시 이벤트 루프 지연 측정 시작"""
+    loop_lag_monitor.start()
+
+@app.on_event("shutdown")
+def stop_analytics_pool():
+    """서버 종료 시 분석 블럭 프로세스 풀 정리"""
+    shutdown_analytics_pool()
+
+@app.on_event("shutdown")
+def stop_blocking_pools():
+    """서버 종료 시 이벤트 루프 지연 측정 중지 및 블로킹 작업 스레드 풀 정리"""
+    loop_lag_monitor.stop()
+    shutdown_blocking_pools()
+
 class LoginRequest(BaseModel):
     id: str
     password: str
@@ -77,12 +122,25 @@ async def read_root():  # 수정 불가
 async def health_check(): # 미사용 
     return {"status": "ok"}
 
+@app.get("/api/metrics")
+async def get_metrics():
+    """서버 내부 지표 조회 (동일 요청 합치기 실행/합류 횟수, 분석 프로세스 풀 사용 횟수, 응답 캐시 적중률,
+    작업 종류별 스레드 풀 대기/실행 건수, 이벤트 루프 지연, 일감 이벤트 발행/구독자 수 등)"""
+    return {
+        "single_flight": get_single_flight_metrics(),
+        "analytics_pool": get_analytics_pool_metrics(),
+        "response_cache": get_response_cache_metrics(),
+        "blocking_pools": get_blocking_pool_metrics(),
+        "loop_lag": loop_lag_monitor.get_metrics(),
+        "issue_events": issue_event_broker.get_metrics()
+    }
+
 @app.post("/api/login")
 async def login(req: LoginRequest):  # 수정 불가
     # Redmine REST API endpoint (예시: /users/current.json)
     url = "https://pms.ati2000.co.kr/users/current.json"
     try:
-        response = requests.get(url, auth=(req.id, req.password), timeout=5)
+        response = await run_blocking('redmine', requests.get, url, auth=(req.id, req.password), timeout=5)
         if response.status_code == 200:
             # 인증 성공
             return {"success": True}
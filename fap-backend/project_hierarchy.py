@@ -0,0 +1,302 @@
+"""
+FAP 2.0 - 프로젝트 계층 인덱스 (백엔드)
+
+주요 기능:
+- projects 테이블 전체를 한 번만 읽어 SITE → Sub Site → Product 계층을 메모리에 인덱싱
+- 동기화 세대(sync generation) 기준 캐시: 프로젝트 동기화가 끝나면 자동으로 다시 생성
+- 계층 부트스트랩 API(/api/issues/hierarchy)용 트리 데이터 생성
+- 디스크 스냅샷: 계층이 새로 만들어질 때마다 pickle 로 저장, 서버 시작 시 세대 확인 후 바로 로딩
+
+계층 규칙 (analyze_and_save_project_relationships 의 level 기준):
+- Site: CUSTOMER_PROJECT_IDS 의 프로젝트 (Level 1)
+- Sub Site: Site 의 직접 하위 프로젝트
+- Product: Sub Site 하위의 Level 4 프로젝트 + Level 3 하위의 Level 4 프로젝트
+- Product 이름: 프로젝트 이름의 "#01" 앞부분 (예: "설비A #01" -> "설비A")
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import re
+import threading
+import time
+from typing import Dict, List, Optional
+
+from config import CUSTOMER_PROJECT_IDS, HIERARCHY_GENERATION_CHECK_SECONDS, HIERARCHY_SNAPSHOT_PATH
+from db_manager import DatabaseManager
+
+PRODUCT_NAME_PATTERN = re.compile(r'^(.+?)\s+#\d+')
+SITE_NUMBER_PATTERN = re.compile(r'^\d+\.\s*')
+
+# 고객사 구성이 바뀌면 ETag 도 달라지도록 설정값 요약을 함께 사용
+CUSTOMER_CONFIG_DIGEST = hashlib.sha1(json.dumps(CUSTOMER_PROJECT_IDS).encode()).hexdigest()[:8]
+
+# 스냅샷 구조가 바뀌면 올려서 이전 파일을 무시하도록 함
+HIERARCHY_SNAPSHOT_VERSION = 1
+SNAPSHOT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), HIERARCHY_SNAPSHOT_PATH)
+
+
+def extract_product_name(project_name: str) -> Optional[str]:
+    """프로젝트 이름에서 Product 이름(#번호 앞부분) 추출, 패턴이 없으면 None"""
+    match = PRODUCT_NAME_PATTERN.match(project_name or '')
+    if match:
+        return match.group(1).strip()
+    return None
+
+
+def clean_site_name(project_name: str) -> str:
+    """"01. 삼성전자" -> "삼성전자" 처럼 Site 이름 앞 번호 제거"""
+    return SITE_NUMBER_PATTERN.sub('', project_name or '')
+
+
+class ProjectHierarchy:
+    """projects 테이블 한 번 조회로 만든 읽기 전용 계층 인덱스"""
+
+    def __init__(self, projects: List[Dict], generation: Optional[int]):
+        self.generation = generation
+        self.projects = {}
+        self.ids_by_name = {}
+
+        # projects 는 DB 에서 이름순으로 정렬되어 들어오므로 순서를 그대로 기록
+        for order, project in enumerate(projects):
+            children_ids = project.get('children_ids') or []
+            if isinstance(children_ids, str):
+                try:
+                    children_ids = json.loads(children_ids)
+                except json.JSONDecodeError:
+                    children_ids = []
+
+            parent = project.get('data', {}).get('parent') or {}
+            project_id = project.get('redmine_project_id')
+            project_name = project.get('project_name', '')
+
+            self.projects[project_id] = {
+                'id': project_id,
+                'name': project_name,
+                'parent_id': parent.get('id'),
+                'children_ids': children_ids,
+                'level': project.get('level', 0),
+                'order': order
+            }
+            self.ids_by_name.setdefault(project_name, project_id)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict) -> 'ProjectHierarchy':
+        """to_snapshot() 결과로 인덱스 복원 (raw_data/children_ids JSON 파싱 없음)"""
+        hierarchy = cls.__new__(cls)
+        hierarchy.generation = snapshot['generation']
+        hierarchy.projects = snapshot['projects']
+        hierarchy.ids_by_name = snapshot['ids_by_name']
+        return hierarchy
+
+    def to_snapshot(self) -> Dict:
+        """디스크 저장용 스냅샷 데이터"""
+        return {
+            'version': HIERARCHY_SNAPSHOT_VERSION,
+            'config_digest': CUSTOMER_CONFIG_DIGEST,
+            'generation': self.generation,
+            'projects': self.projects,
+            'ids_by_name': self.ids_by_name
+        }
+
+    def get(self, project_id: int) -> Optional[Dict]:
+        """프로젝트 ID로 노드 조회"""
+        return self.projects.get(project_id)
+
+    def find_by_name(self, project_name: str) -> Optional[Dict]:
+        """프로젝트 이름으로 노드 조회 (get_projects_by_name 과 동일하게 첫 번째 일치 항목)"""
+        project_id = self.ids_by_name.get(project_name)
+        return self.projects.get(project_id) if project_id is not None else None
+
+    def get_site(self, site_index: int) -> Optional[Dict]:
+        """SITE 버튼 인덱스로 Site 노드 조회"""
+        return self.projects.get(CUSTOMER_PROJECT_IDS[site_index])
+
+    def get_nodes(self, project_ids: List[int]) -> List[Dict]:
+        """ID 리스트로 노드 조회 (get_projects_by_ids 와 동일하게 이름순 정렬)"""
+        nodes = [self.projects[project_id] for project_id in set(project_ids) if project_id in self.projects]
+        return sorted(nodes, key=lambda node: node['order'])
+
+    def children(self, project_id: int) -> List[Dict]:
+        """하위 프로젝트 노드 목록 (이름순)"""
+        node = self.projects.get(project_id)
+        if not node:
+            return []
+        return self.get_nodes(node['children_ids'])
+
+    def product_projects(self, sub_site_id: int) -> List[Dict]:
+        """Sub Site 하위의 Level 4 프로젝트 목록 (직접 하위 → Level 3 하위 순서)"""
+        products = []
+        products_ids = []
+        for project in self.children(sub_site_id):
+            if project['level'] == 4:
+                products.append(project)
+            elif project['level'] == 3:
+                products_ids.extend(project['children_ids'])
+
+        for project in self.get_nodes(products_ids):
+            if project['level'] == 4:
+                products.append(project)
+
+        return products
+
+    def product_project_ids(self, sub_site_id: int, product_name: str = "ALL") -> List[int]:
+        """Sub Site 의 Product 프로젝트 ID 목록 (product_name 이 ALL 이 아니면 이름이 일치하는 것만)"""
+        product_ids = []
+        for project in self.product_projects(sub_site_id):
+            if product_name == "ALL" or (extract_product_name(project['name']) or project['name']) == product_name:
+                product_ids.append(project['id'])
+        return product_ids
+
+    def site_product_project_ids(self, site_id: int, product_name: str = "ALL") -> List[int]:
+        """Site 전체(모든 Sub Site)의 Product 프로젝트 ID 목록"""
+        product_ids = []
+        for sub_site in self.children(site_id):
+            product_ids.extend(self.product_project_ids(sub_site['id'], product_name))
+        return product_ids
+
+    def product_names(self, sub_site_id: int) -> List[str]:
+        """Sub Site 의 Product 이름 목록 (중복 제거, 순서 유지)"""
+        names = []
+        for project in self.product_projects(sub_site_id):
+            product_name = extract_product_name(project['name'])
+            if product_name and product_name not in names:
+                names.append(product_name)
+        return names
+
+    def to_tree(self) -> Dict:
+        """고객사 → Sub Site → Product 이름 전체 트리 생성"""
+        sites = []
+        for site_index, site_id in enumerate(CUSTOMER_PROJECT_IDS):
+            site = self.projects.get(site_id)
+            if not site:
+                continue
+
+            sub_sites = []
+            for sub_site in self.children(site_id):
+                sub_sites.append({
+                    'project_id': sub_site['id'],
+                    'project_name': sub_site['name'],
+                    'products': self.product_names(sub_site['id'])
+                })
+
+            sites.append({
+                'site_index': site_index,
+                'project_id': site_id,
+                'project_name': clean_site_name(site['name']),
+                'sub_sites': sub_sites
+            })
+
+        return {
+            'generation': self.generation,
+            'sites': sites
+        }
+
+
+_hierarchy_lock = threading.Lock()
+_hierarchy_cache: Optional[ProjectHierarchy] = None
+_hierarchy_checked_at = 0.0
+
+
+def get_project_hierarchy(db: Optional[DatabaseManager] = None) -> ProjectHierarchy:
+    """캐시된 계층 인덱스 반환 (동기화 세대가 바뀌었을 때만 projects 테이블을 다시 읽음)"""
+    global _hierarchy_cache, _hierarchy_checked_at
+
+    with _hierarchy_lock:
+        cached = _hierarchy_cache
+        if cached is not None and time.monotonic() - _hierarchy_checked_at < HIERARCHY_GENERATION_CHECK_SECONDS:
+            return cached
+
+        db = db or DatabaseManager()
+        generation = db.get_sync_generation('projects')
+
+        # DB 세대 조회 실패 시에는 기존 캐시를 그대로 사용
+        # (캐시가 없으면 generation=None 인 임시 계층: 캐시/ETag 에 쓰지 않음)
+        if generation is None:
+            return cached if cached is not None else ProjectHierarchy(db.get_all_projects(), None)
+
+        if cached is not None and generation == cached.generation:
+            _hierarchy_checked_at = time.monotonic()
+            return cached
+
+        projects = db.get_all_projects()
+        if not projects:
+            return cached if cached is not None else ProjectHierarchy([], None)
+
+        hierarchy = ProjectHierarchy(projects, generation)
+        _hierarchy_cache = hierarchy
+        _hierarchy_checked_at = time.monotonic()
+
+    # 새로 만든 계층은 다음 재시작을 위해 스냅샷으로 저장
+    save_hierarchy_snapshot(hierarchy)
+    return hierarchy
+
+
+def invalidate_project_hierarchy():
+    """다음 조회 시 동기화 세대를 즉시 다시 확인하도록 캐시 확인 시각 초기화"""
+    global _hierarchy_checked_at
+
+    with _hierarchy_lock:
+        _hierarchy_checked_at = 0.0
+
+
+def refresh_project_hierarchy() -> ProjectHierarchy:
+    """프로젝트 동기화 직후 호출 - 계층을 바로 다시 만들고 스냅샷까지 저장"""
+    invalidate_project_hierarchy()
+    return get_project_hierarchy()
+
+
+def get_hierarchy_etag(hierarchy: ProjectHierarchy) -> Optional[str]:
+    """계층 트리 응답용 강한 ETag (동기화 세대 + 고객사 설정), DB 장애 등으로 만든 임시 계층(generation None)은 None"""
+    if hierarchy.generation is None:
+        return None
+    return f'"hierarchy-{hierarchy.generation}-{CUSTOMER_CONFIG_DIGEST}"'
+
+
+def save_hierarchy_snapshot(hierarchy: ProjectHierarchy) -> bool:
+    """계층 인덱스를 디스크 스냅샷으로 저장 (임시 파일에 쓴 뒤 교체해서 부분 저장 방지)"""
+    try:
+        os.makedirs(os.path.dirname(SNAPSHOT_FILE), exist_ok=True)
+        temp_file = f"{SNAPSHOT_FILE}.{os.getpid()}.tmp"
+        with open(temp_file, 'wb') as f:
+            pickle.dump(hierarchy.to_snapshot(), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, SNAPSHOT_FILE)
+        return True
+    except Exception as e:
+        print(f"계층 스냅샷 저장 실패: {e}")
+        return False
+
+
+def load_hierarchy_snapshot(db: Optional[DatabaseManager] = None) -> bool:
+    """서버 시작 시 스냅샷을 읽어 DB 동기화 세대와 같으면 캐시로 사용 (다르면 새로 생성)"""
+    global _hierarchy_cache, _hierarchy_checked_at
+
+    db = db or DatabaseManager()
+    generation = db.get_sync_generation('projects')
+    if generation is None:
+        return False
+
+    try:
+        with open(SNAPSHOT_FILE, 'rb') as f:
+            snapshot = pickle.load(f)
+    except FileNotFoundError:
+        snapshot = None
+    except Exception as e:
+        print(f"계층 스냅샷 로딩 실패: {e}")
+        snapshot = None
+
+    if (
+        not isinstance(snapshot, dict)
+        or snapshot.get('version') != HIERARCHY_SNAPSHOT_VERSION
+        or snapshot.get('config_digest') != CUSTOMER_CONFIG_DIGEST
+        or snapshot.get('generation') != generation
+    ):
+        # 스냅샷이 없거나 오래된 경우 DB 에서 새로 만들고 스냅샷도 갱신
+        get_project_hierarchy(db)
+        return False
+
+    with _hierarchy_lock:
+        _hierarchy_cache = ProjectHierarchy.from_snapshot(snapshot)
+        _hierarchy_checked_at = time.monotonic()
+    return True
@@ -0,0 +1,109 @@
+"""
+FAP 2.0 - 분석 응답 캐시 (백엔드)
+
+주요 기능:
+- 정규화된 요청 파라미터 + 동기화 세대(sync_generations) 를 키로 계산 결과를 메모리에 보관
+- 동기화/상태 변경 시 세대가 올라가므로 이전 세대 키는 더 이상 조회되지 않음 (TTL 없음)
+- 전체 크기 상한(바이트)을 넘으면 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+- 적중/미적중/제거 횟수와 적중률 지표 제공 (/api/metrics)
+
+사용 예:
+    analytics_cache = create_response_cache("issue_analytics", max_bytes=256 * 1024 * 1024)
+    cached = analytics_cache.get(key)
+    if cached is None:
+        cached = compute()
+        analytics_cache.put(key, cached, estimate_size(cached))  # 크기를 이미 알면 직접 전달
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+
+from fast_json import dumps
+
+
+def estimate_size(value: Any) -> int:
+    """캐시 항목 크기 추정 (응답과 같은 orjson 직렬화 길이, 바이트)"""
+    return len(dumps(value))
+
+
+class ResponseCache:
+    """크기 상한이 있는 LRU 응답 캐시 (스레드 안전)"""
+
+    def __init__(self, name: str, max_bytes: int):
+        self.name = name
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시된 값 반환 (없으면 None), 조회된 항목은 가장 최근 사용으로 이동"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: Optional[int] = None):
+        """값 저장 (상한보다 큰 값은 저장하지 않음), 상한을 넘으면 오래된 항목부터 제거
+
+        size 를 넘기지 않으면 여기서 직렬화해서 추정 (호출하는 쪽이 이미 알거나 스레드 풀에서 계산한 값 전달 권장)
+        """
+        size = estimate_size(value) if size is None else size
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= previous[1]
+
+            self._entries[key] = (value, size)
+            self.total_bytes += size
+
+            while self.total_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def get_metrics(self) -> Dict:
+        """적중률과 사용량 지표"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'name': self.name,
+                'entries': len(self._entries),
+                'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': round(self.hits / lookups, 3) if lookups else 0
+            }
+
+
+_response_caches: List[ResponseCache] = []
+
+
+def create_response_cache(name: str, max_bytes: int) -> ResponseCache:
+    """지표 조회 대상에 등록된 ResponseCache 생성"""
+    cache = ResponseCache(name, max_bytes)
+    _response_caches.append(cache)
+    return cache
+
+
+def get_response_cache_metrics() -> List[Dict]:
+    """등록된 모든 응답 캐시의 지표"""
+    return [cache.get_metrics() for cache in _response_caches]
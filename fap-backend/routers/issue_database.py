@@ -8,16 +8,27 @@ FAP 2.0 - 이슈 데이터베이스 API 라우터 (백엔드)
 - 다중 선택 처리: 여러 항목 동시 선택 시 데이터 통합
 
 API 엔드포인트:
-- /site: 고객사 프로젝트 목록 조회
+- /site: 고객사 프로젝트 목록 조회 (동기화 세대 기반 ETag)
 - /sub-site: 하위 사이트 목록 조회
 - /sub-sites: 다중 사이트 선택 처리
+- /hierarchy: 고객사 → Sub Site → Product 전체 트리 (ETag 지원)
 - /summary: 요약 통계 데이터
 - /progress: 진행률 데이터
 - /type: 유형별 분석 데이터
 - /member: 인원별 분석 데이터
 - /hw: HW 관련 데이터
 - /sw: SW 관련 데이터
+- /get-dashboard-data: 요청한 분석 블럭들을 한 번에 계산 (블럭별 계산 시간은 Server-Timing 헤더)
+- 분석 API(/get-*-data 등)는 데이터 세대 + 요청 파라미터 ETag 를 주고, If-None-Match 가 같으면 304
+- /get-issue-detail: 요약 응답의 드릴다운 키로 tracker/Product/작업자 셀 일감을 페이지 단위 조회
+- /get-issue-list: 분석 API 와 같은 필터의 일감 목록을 (정렬 컬럼, redmine_id) 키셋 커서로 페이지 조회
+- /export-issues: 분석 API 와 같은 필터의 일감 전체를 NDJSON / CSV 스트리밍으로 내보내기
+- 분석/일감 API 는 fields (issues 컬럼 목록) 를 받으면 해당 컬럼만 조회해서 응답의 일감 항목에 포함
+- /get-site-comparison: 전체 고객사 KPI 비교 (집계 쿼리 1번)
+- /get-problematic-sites: 고객사 안에서 진행중 일감이 많은 Sub Site Top K (툴팁 포함)
 - /update-issue-status: 이슈 상태 업데이트
+- /update-progress-status-batch: 여러 이슈 상태 일괄 업데이트 (Redmine 동시 호출, 로컬 DB 한 트랜잭션, 건별 결과)
+- /ws/status-events (WebSocket): 상태 변경 이벤트 실시간 전달 (열린 대시보드가 전체 재조회 없이 화면 갱신)
 
 기술 스택:
 - FastAPI
@@ -26,167 +37,309 @@ API 엔드포인트:
 - 실시간 데이터 처리
 """
 
-from fastapi import APIRouter, Query, HTTPException, Request
+from fastapi import APIRouter, Query, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from typing import List, Dict, Optional
 from db_manager import DatabaseManager
-from config import CUSTOMER_PROJECT_IDS
-from .redmine_service import update_issue_status
-
+from config import CUSTOMER_PROJECT_IDS, ANALYTICS_SQL_COUNT_BLOCKS, ANALYTICS_ROLLUP_COUNT_BLOCKS, ISSUE_DETAIL_PAGE_SIZE, ISSUE_DETAIL_MAX_PAGE_SIZE, ANALYTICS_RESPONSE_CACHE_MAX_BYTES, ISSUE_LIST_PAGE_SIZE, ISSUE_LIST_MAX_PAGE_SIZE, ISSUE_EXPORT_BATCH_SIZE, ISSUE_STATUS_BATCH_MAX_ITEMS, ISSUE_STATUS_BATCH_CONCURRENCY
+from project_hierarchy import ProjectHierarchy, get_project_hierarchy, get_hierarchy_etag, clean_site_name, CUSTOMER_CONFIG_DIGEST
+from issue_analytics import BLOCKS, RANKING_BLOCKS, SUMMARY_BLOCKS, decode_drill_key, top_k_items, compute_block, group_issues, compute_blocks_from_groups, is_count_block, required_issue_columns, COUNT_GROUP_COLUMNS
+from single_flight import create_single_flight
+from analytics_pool import compute_blocks_pooled
+from response_cache import create_response_cache, estimate_size
+from http_etag import make_etag, etag_matches, etag_headers, not_modified_response
+from fast_json import fast_json_response, dumps as json_dumps
+from blocking_pools import run_blocking
+from issue_events import issue_event_broker, make_status_event, ISSUE_STATUS_TOPIC
+from .redmine_service import update_issue_status, create_redmine_session, apply_issue_status_change
+
+import asyncio
+import base64
+import csv
+import io
 import json
 import re
+import time
+from collections import Counter
 
 
 
 
-def get_overall_issue_status(issues: List[Dict]) -> Dict:
-    """전체 이슈 현황 계산 헬퍼 함수"""
-    total_issues = len(issues)
-    
-    # 완료율 계산
-    completed_count = sum(1 for issue in issues if issue.get('is_closed') == 1)
-    in_progress_count = total_issues - completed_count
-    completion_rate = (completed_count / total_issues * 100) if total_issues > 0 else 0
-    
-    # 모든 일감 유형별 카운트 (완료/미완료 구분 없이)
-    tracker_counts = {}
-    for issue in issues:
-        tracker_name = issue.get('tracker_name', 'Unknown')
-        # 대괄호 제거하고 깔끔한 이름으로 변환
-        clean_name = tracker_name.replace('[AE][이슈] ', '').replace('[AE][Setup] ', '').replace('[AE] ', '')
-        tracker_counts[clean_name] = tracker_counts.get(clean_name, 0) + 1
-    
-    # tracker별 텍스트 생성
-    tracker_text_parts = []
-    
-    for tracker_name, count in tracker_counts.items():
-        # tracker별 고정 색상 매핑
-        if 'HW' in tracker_name:
-            color = '#FF6B6B'  # 빨간색
-        elif 'SW' in tracker_name:
-            color = '#4CAF50'  # 초록색
-        elif 'AE' in tracker_name:
-            color = '#2196F3'  # 파란색
-        else:
-            color = '#222222'  # 검정색
-        
-        # 모든 tracker를 동일한 폰트 크기로 표시
-        tracker_text_parts.append(f'<span style="color: {color}">{tracker_name}: {count}건</span>')
-    
-    # 3개씩 그룹으로 나누어서 줄바꿈
-    tracker_text = ""
-    for i in range(0, len(tracker_text_parts), 3):
-        group = tracker_text_parts[i:i+3]
-        tracker_text += "&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;".join(group)
-        if i + 3 < len(tracker_text_parts):  # 마지막 그룹이 아니면 줄바꿈 추가
-            tracker_text += "<br>"
-    
+def get_issue_group_counts(db: DatabaseManager, start_date: str, end_date: str, project_ids: List[int], group_columns: List[str]) -> List[Dict]:
+    """그룹별 일감 수 조회 헬퍼 함수 (일별 집계 테이블 우선, 사용할 수 없으면 issues 집계)"""
+    if ANALYTICS_ROLLUP_COUNT_BLOCKS:
+        groups = db.get_issue_rollup_counts(start_date, end_date, project_ids, group_columns)
+        if groups is not None:
+            return groups
+    return db.get_issue_group_counts(start_date, end_date, project_ids, group_columns)
+
+
+def fetch_issue_block_data(start_date: str, end_date: str, project_ids: List[int], block_names: List[str], timings: Optional[Dict] = None,
+                           fields: Optional[List[str]] = None) -> Dict:
+    """분석 블럭 계산에 필요한 DB 조회 (건수 블럭은 일별 집계/SQL 집계, 나머지 블럭은 일감 1회 조회)
+
+    일감은 블럭 계산에 필요한 컬럼만 조회 (fields 가 있으면 블럭 안 일감 항목도 해당 컬럼만)
+    결과는 compute_issue_block_data 에 그대로 전달 ('db' 스레드 풀에서 호출)
+    """
+    db = DatabaseManager()
+
+    count_blocks = [name for name in block_names if ANALYTICS_SQL_COUNT_BLOCKS and is_count_block(name)]
+    issue_blocks = [name for name in block_names if name not in count_blocks]
+
+    data = {'count_blocks': count_blocks, 'groups': [], 'issue_blocks': issue_blocks, 'issues': []}
+    if count_blocks:
+        started = time.perf_counter()
+        data['groups'] = get_issue_group_counts(db, start_date, end_date, project_ids, COUNT_GROUP_COLUMNS)
+        if timings is not None:
+            timings['count_query_ms'] = round((time.perf_counter() - started) * 1000, 2)
+    if issue_blocks:
+        started = time.perf_counter()
+        columns = required_issue_columns(issue_blocks, fields)
+        data['issues'] = db.get_issue_columns_by_filter(start_date, end_date, project_ids, columns)
+        if timings is not None:
+            timings['issue_query_ms'] = round((time.perf_counter() - started) * 1000, 2)
+            timings['issue_count'] = len(data['issues'])
+            timings['issue_columns'] = len(columns)
+    return data
+
+
+def compute_issue_block_data(data: Dict, block_names: List[str], timings: Optional[Dict] = None, options: Optional[Dict] = None,
+                             fields: Optional[List[str]] = None) -> Dict[str, Dict]:
+    """fetch_issue_block_data 결과로 분석 블럭 계산 ('cpu' 스레드 풀에서 호출)
+
+    건수 블럭은 집계 결과로, 나머지 블럭은 일감 1회 순회로 계산 (일감이 많으면 프로세스 풀)
+    timings 가 있으면 순회 단계별 시간과 블럭별 계산 시간(ms)을 기록
+    """
+    results = {}
+    if data['count_blocks']:
+        results.update(compute_blocks_from_groups(data['groups'], data['count_blocks'], timings, options))
+    if data['issue_blocks']:
+        results.update(compute_blocks_pooled(data['issues'], data['issue_blocks'], timings, options, fields))
+
+    return {name: results[name] for name in block_names}
+
+
+def normalize_issue_filter(data: Dict) -> Dict:
+    """분석 API 요청 본문의 필터 정규화 (다중/단일 선택 모두 지원, 선택 목록은 중복 제거 후 정렬)"""
+    start_date = data.get('start_date')
+    end_date = data.get('end_date')
+    site_indexes = data.get('site_indexes', [])
+    sub_site_names = data.get('sub_site_names', [])
+    product_names = data.get('product_names', [])
+
+    # 기존 단일 선택 호환성을 위한 처리
+    if not site_indexes and data.get('site_index') is not None:
+        site_indexes = [data.get('site_index')]
+    if not sub_site_names and data.get('sub_site_name'):
+        sub_site_names = [data.get('sub_site_name')]
+    if not product_names and data.get('product_name'):
+        product_names = [data.get('product_name')]
+
+    if not all([start_date, end_date, site_indexes, sub_site_names, product_names]):
+        raise HTTPException(status_code=400, detail="필수 파라미터가 누락되었습니다: start_date, end_date, site_indexes, sub_site_names, product_names")
+
     return {
-        "total_issues": total_issues,
-        "completed_count": completed_count,
-        "in_progress_count": in_progress_count,
-        "completion_rate": round(completion_rate, 1),
-        "tracker_text": tracker_text
+        'start_date': start_date,
+        'end_date': end_date,
+        'site_indexes': sorted(set(site_indexes)),
+        'sub_site_names': sorted(set(sub_site_names)),
+        'product_names': sorted(set(product_names))
     }
 
 
-def get_most_problematic_products(issues: List[Dict]) -> Dict:
-    """가장 문제가 많은 Product Top 3 계산 헬퍼 함수"""
-    # Product별 통계 계산
-    product_stats = {}
-    
-    for issue in issues:
-        project_name = issue.get('project_name', '')
-        is_closed = issue.get('is_closed', 0)
-        
-        # Product 이름 추출 (예: "설비A #01" -> "설비A")
-        if '#' in project_name:
-            product_name = project_name.split('#')[0].strip()
-        else:
-            product_name = project_name
-        
-        if product_name not in product_stats:
-            product_stats[product_name] = {
-                'in_progress': 0,
-                'completed': 0,
-                'total': 0
-            }
-        
-        product_stats[product_name]['total'] += 1
-        if is_closed == 1:
-            product_stats[product_name]['completed'] += 1
-        else:
-            product_stats[product_name]['in_progress'] += 1
-    
-    # 진행중인 일감 수로 정렬하여 Top 3 선별
-    sorted_products = sorted(
-        product_stats.items(), 
-        key=lambda x: x[1]['in_progress'], 
-        reverse=True
-    )[:3]
-    
-    # 결과 데이터 구성
-    problematic_products = []
-    for product_name, stats in sorted_products:
-        completion_rate = (stats['completed'] / stats['total'] * 100) if stats['total'] > 0 else 0
-        problematic_products.append({
-            'product': product_name,
-            'in_progress': stats['in_progress'],
-            'completed': stats['completed'],
-            'completion_rate': round(completion_rate, 1)
-        })
-    
-    return {
-        "type": "problematic_products",
-        "data": problematic_products
+def normalize_issue_fields(fields) -> Optional[List[str]]:
+    """요청의 fields (목록 또는 쉼표 구분 문자열) 를 ISSUE_LIST_COLUMNS 순서의 컬럼 목록으로 정규화 (없으면 None)"""
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = [field.strip() for field in fields.split(',') if field.strip()]
+    if not isinstance(fields, list) or not fields or not all(isinstance(field, str) for field in fields):
+        raise HTTPException(status_code=400, detail="fields 는 컬럼 이름 목록 또는 쉼표로 구분한 문자열이어야 합니다")
+
+    unknown = [field for field in fields if field not in DatabaseManager.ISSUE_LIST_COLUMNS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 필드입니다: {unknown} (가능: {list(DatabaseManager.ISSUE_LIST_COLUMNS)})")
+    return [column for column in DatabaseManager.ISSUE_LIST_COLUMNS if column in fields]
+
+
+def get_issue_select_columns(fields: Optional[List[str]], *required: str) -> Optional[List[str]]:
+    """일감 API 의 조회 컬럼 (fields + 응답에 항상 필요한 컬럼, fields 가 없으면 None = 전체)"""
+    if fields is None:
+        return None
+    return [column for column in DatabaseManager.ISSUE_LIST_COLUMNS if column in fields or column in required]
+
+
+def resolve_issue_filter_project_ids(issue_filter: Dict) -> List[int]:
+    """정규화된 필터의 모든 선택 조합에 해당하는 프로젝트 ID 목록 (중복 제거)"""
+    all_project_ids = set()
+    for site_index in issue_filter['site_indexes']:
+        for sub_site_name in issue_filter['sub_site_names']:
+            for product_name in issue_filter['product_names']:
+                all_project_ids.update(get_issue_project_ids(site_index, sub_site_name, product_name))
+    return sorted(all_project_ids)
+
+
+def fetch_filtered_block_data(issue_filter: Dict, block_names: List[str], timings: Dict, fields: Optional[List[str]] = None) -> Dict:
+    """정규화된 필터로 프로젝트 ID를 구하고 블럭 계산용 데이터 조회 ('db' 스레드 풀에서 호출)"""
+    started = time.perf_counter()
+    project_ids = resolve_issue_filter_project_ids(issue_filter)
+    timings['filter_ms'] = round((time.perf_counter() - started) * 1000, 2)
+
+    return fetch_issue_block_data(issue_filter['start_date'], issue_filter['end_date'], project_ids, block_names, timings, fields)
+
+
+# 같은 필터/블럭 조합의 동시 요청은 계산 1번으로 합침 (조회는 'db', 계산은 'cpu' 스레드 풀에서 실행)
+issue_analytics_flight = create_single_flight("issue_analytics")
+
+# 동기화 세대별 분석 결과 캐시 (일감/프로젝트 데이터가 바뀌면 세대가 올라가서 새로 계산)
+issue_analytics_cache = create_response_cache("issue_analytics", ANALYTICS_RESPONSE_CACHE_MAX_BYTES)
+
+
+def get_analytics_generation() -> Optional[tuple]:
+    """분석 결과가 의존하는 데이터 세대 (일감 세대, 프로젝트 계층 세대), DB 조회 실패/임시 계층이면 None (캐시/ETag 사용 안 함)"""
+    issues_generation = DatabaseManager().get_sync_generation('issues')
+    if issues_generation is None:
+        return None
+    hierarchy_generation = get_project_hierarchy().generation
+    if hierarchy_generation is None:
+        return None
+    return issues_generation, hierarchy_generation
+
+
+async def compute_cached_blocks(cache_key: Optional[tuple], issue_filter: Dict, block_names: List[str], options: Optional[Dict] = None,
+                                fields: Optional[List[str]] = None) -> Dict:
+    """DB 조회는 'db', 블럭 계산은 'cpu' 스레드 풀에서 실행 후 세대 키로 캐시에 저장 (cache_key 가 None 이면 저장하지 않음)
+
+    → {'blocks': {이름: 결과}, 'timings': {...}}
+    """
+    started = time.perf_counter()
+    timings = {}
+    data = await run_blocking('db', fetch_filtered_block_data, issue_filter, block_names, timings, fields)
+    blocks = await run_blocking('cpu', compute_issue_block_data, data, block_names, timings, options, fields)
+    timings['total_ms'] = round((time.perf_counter() - started) * 1000, 2)
+
+    result = {
+        'blocks': blocks,
+        'timings': timings
     }
+    if cache_key is not None:
+        # 캐시 크기는 응답과 같은 orjson 직렬화 길이 (직렬화도 'cpu' 스레드 풀에서)
+        size = await run_blocking('cpu', estimate_size, result)
+        issue_analytics_cache.put(cache_key, result, size)
+    return result
+
+
+async def get_filtered_blocks(data: Dict, block_names: List[str], options: Optional[Dict] = None,
+                              request: Optional[Request] = None, response: Optional[Response] = None) -> Dict:
+    """요청 본문 필터로 블럭 계산
+
+    같은 데이터 세대에서 이미 계산한 결과는 캐시에서 반환하고,
+    동일 필터 동시 요청은 진행 중인 계산 결과를 함께 사용
+
+    request 가 있으면 데이터 세대 + 경로 + 파라미터로 ETag 를 만들어 response 헤더에 설정
+    (분석 API 는 POST 이므로 If-None-Match 로 304 를 보내지 않음, 클라이언트는 ETag 를 비교해 화면 갱신 생략 가능)
+
+    요청 본문에 fields 가 있으면 블럭 안 일감 항목을 해당 컬럼만으로 줄임 (조회 컬럼도 함께 줄어듦)
+    """
+    issue_filter = normalize_issue_filter(data)
+    fields = normalize_issue_fields(data.get('fields'))
+    key = (
+        json.dumps(issue_filter, sort_keys=True, ensure_ascii=False),
+        tuple(block_names),
+        json.dumps(options or {}, sort_keys=True),
+        tuple(fields) if fields is not None else None
+    )
+
+    generation = await run_blocking('db', get_analytics_generation)
+    if request is not None and generation is not None:
+        etag = make_etag("analytics", list(generation), {'path': request.url.path, 'key': key, 'config': CUSTOMER_CONFIG_DIGEST})
+        if response is not None:
+            response.headers.update(etag_headers(etag))
+
+    cache_key = (generation, key) if generation is not None else None
+    if cache_key is not None:
+        cached = issue_analytics_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached, cache_hit=True)
+
+    result = await issue_analytics_flight.run((generation, key), compute_cached_blocks, cache_key, issue_filter, list(block_names), options, fields)
+    return dict(result, cache_hit=False)
+
+
+def get_summary_options(data: Dict, block_names: List[str]) -> Dict:
+    """요청 본문에 summary: true 가 있으면 요약 지원 블럭에 summary 옵션 지정 (일감 목록 대신 드릴다운 키)"""
+    if not data.get('summary'):
+        return {}
+    return {name: {'summary': True} for name in block_names if name in SUMMARY_BLOCKS}
+
+
+def get_overall_issue_status(issues: List[Dict]) -> Dict:
+    """전체 이슈 현황 계산 헬퍼 함수"""
+    return compute_block(issues, 'overall_issue_status')
+
+
+def get_most_problematic_products(issues: List[Dict], top_k: int = 3) -> Dict:
+    """가장 문제가 많은 Product Top K 계산 헬퍼 함수"""
+    return compute_block(issues, 'problematic_products', top_k=top_k)
+
+
+# Site 툴팁(generate_site_tooltip) 생성에 필요한 issues 컬럼 (project_id 는 Sub Site 매핑용)
+SITE_TOOLTIP_COLUMNS = ['project_id', 'tracker_name', 'is_closed', 'subject', 'author_name']
+
 
+def get_most_problematic_sites(site_index: int, start_date: str, end_date: str, product_name: str, top_k: Optional[int] = None) -> Dict:
+    """가장 문제가 많은 Site Top K 계산 헬퍼 함수 (top_k 가 None 이면 전체, 'db' 스레드 풀에서 호출)
 
-def get_most_problematic_sites(site_index: int, start_date: str, end_date: str, product_name: str) -> Dict:
-    """가장 문제가 많은 Site Top 3 계산 헬퍼 함수"""
+    Sub Site별 일감 수는 계층 인덱스로 Product → Sub Site를 매핑해서 집계 쿼리 1번으로 계산하고,
+    툴팁은 순위에 든 Sub Site(top_k개)의 일감을 툴팁 컬럼만 한 번 더 조회해서 생성한다.
+    """
     try:
         db = DatabaseManager()
-        
-        # 1. Site index로 Site ID 찾기
+        hierarchy = get_project_hierarchy(db)
+
+        # 1. Site index로 Site의 하위 프로젝트(Sub Site)와 Product 프로젝트 매핑 구성
         site_id = CUSTOMER_PROJECT_IDS[site_index]
-        site_project = db.get_projects_by_ids([site_id])[0]
-        
-        # 2. Site의 하위 프로젝트 정보 조회
-        children_ids = site_project.get('children_ids', [])
-        if isinstance(children_ids, str):
-            children_ids = json.loads(children_ids)
-        
-        sub_projects = db.get_projects_by_ids(children_ids)
-        
-        # 3. 각 Sub Site별로 통계 계산
+        sub_site_by_project = {}
+        sub_site_names = {}
+        for sub_project in hierarchy.children(site_id):
+            sub_site_names[sub_project['id']] = sub_project['name']
+            for project_id in hierarchy.product_project_ids(sub_project['id'], product_name):
+                sub_site_by_project[project_id] = sub_project['id']
+
+        # 2. 프로젝트별 일감 수를 한 번에 집계한 뒤 Sub Site 단위로 합산
+        project_counts = db.get_issue_counts_by_project(start_date, end_date, list(sub_site_by_project.keys()))
+        sub_site_counts = {}
+        for project_id, counts in project_counts.items():
+            sub_site_id = sub_site_by_project[project_id]
+            if sub_site_id not in sub_site_counts:
+                sub_site_counts[sub_site_id] = {'total': 0, 'completed': 0}
+            sub_site_counts[sub_site_id]['total'] += counts['total']
+            sub_site_counts[sub_site_id]['completed'] += counts['completed']
+
+        # 3. 진행중인 일감 수 상위 top_k개 선택 (진행 중이거나 완료된 일감이 있는 Sub Site만)
         site_stats = []
-        for sub_project in sub_projects:
-            sub_site_name = sub_project.get('project_name')
-            
-            # 해당 Sub Site의 모든 Product 프로젝트 ID 가져오기
-            project_ids = get_issue_project_ids(site_index, sub_site_name, product_name)
-            
-            # 이슈 데이터 조회
-            issues = db.get_issues_by_filter(start_date, end_date, project_ids)
-            
-            # Sub Site별 통계 계산
-            stats = get_overall_issue_status(issues)
-            
-            # 진행 중이거나 완료된 일감이 있는 경우만 추가
-            if stats['in_progress_count'] > 0 or stats['completed_count'] > 0:
-                # 툴팁 정보 생성
-                tooltip_info = generate_site_tooltip(issues)
-                
-                site_stats.append({
-                    'site': sub_site_name,
-                    'in_progress': stats['in_progress_count'],
-                    'completed': stats['completed_count'],
-                    'completion_rate': stats['completion_rate'],
-                    'tooltip': tooltip_info
-                })
-        
-        # 4. 진행중인 일감 수로 정렬
-        sorted_sites = sorted(site_stats, key=lambda x: x['in_progress'], reverse=True)
-        
+        for sub_site_id, counts in sub_site_counts.items():
+            if counts['total'] == 0:
+                continue
+            completion_rate = counts['completed'] / counts['total'] * 100
+            site_stats.append({
+                'sub_site_id': sub_site_id,
+                'site': sub_site_names[sub_site_id],
+                'in_progress': counts['total'] - counts['completed'],
+                'completed': counts['completed'],
+                'completion_rate': round(completion_rate, 1)
+            })
+        sorted_sites = top_k_items(site_stats, top_k, key=lambda x: x['in_progress'])
+
+        # 4. 표시되는 Sub Site의 일감만 조회해서 툴팁 생성
+        displayed_ids = {site['sub_site_id'] for site in sorted_sites}
+        tooltip_project_ids = [project_id for project_id, sub_site_id in sub_site_by_project.items() if sub_site_id in displayed_ids]
+        tooltip_issues = db.get_issue_columns_by_filter(start_date, end_date, tooltip_project_ids, SITE_TOOLTIP_COLUMNS)
+        issues_by_sub_site = group_issues(tooltip_issues, [lambda issue: sub_site_by_project[issue.get('project_id')]])
+
+        for site in sorted_sites:
+            site['tooltip'] = generate_site_tooltip(issues_by_sub_site.get(site.pop('sub_site_id'), []))
+
         return {
             "type": "problematic_sites",
             "data": sorted_sites
@@ -199,511 +352,102 @@ def get_most_problematic_sites(site_index: int, start_date: str, end_date: str,
         }
 
 
-def get_member_best_work_data(issues: List[Dict]) -> Dict: # 수정 불가
-    """최고 성과 멤버 상세 데이터 계산 헬퍼 함수"""
-    # [AE]BEST 작업인 이슈들 필터링
-    best_issues = [issue for issue in issues if issue.get('status_name') == '[AE]BEST 작업']
-    
-    # 필요한 정보 추출
-    best_member_data = []
-    for issue in best_issues:
-        best_member_data.append({
-            'author': issue.get('author_name', ''),
-            'product': issue.get('product', ''),
-            'issue_id': issue.get('redmine_id', ''),
-            'subject': issue.get('subject', '')
+def fetch_site_comparison_data(start_date: str, end_date: str) -> tuple:
+    """전체 고객사 Site별 KPI 비교에 필요한 DB 조회 ('db' 스레드 풀에서 호출)
+
+    → (프로젝트 계층, Product 프로젝트 → Site 인덱스 매핑, project_id/tracker/완료 여부 GROUP BY 1번 결과)
+    """
+    db = DatabaseManager()
+    hierarchy = get_project_hierarchy(db)
+
+    # 1. Product 프로젝트 → Site 인덱스 매핑
+    site_index_by_project = {}
+    for site_index, site_id in enumerate(CUSTOMER_PROJECT_IDS):
+        for project_id in hierarchy.site_product_project_ids(site_id):
+            site_index_by_project[project_id] = site_index
+
+    # 2. 전체 Site의 일감 수를 한 번에 집계
+    groups = get_issue_group_counts(db, start_date, end_date, list(site_index_by_project.keys()), ['project_id', 'tracker_name', 'is_closed'])
+    return hierarchy, site_index_by_project, groups
+
+
+def get_site_comparison(hierarchy: ProjectHierarchy, site_index_by_project: Dict[int, int], groups: List[Dict]) -> Dict:
+    """fetch_site_comparison_data 결과로 전체 고객사 Site별 KPI 비교 계산 ('cpu' 스레드 풀에서 호출)"""
+    site_stats = {}
+    for group in groups:
+        site_index = site_index_by_project[group['project_id']]
+        if site_index not in site_stats:
+            site_stats[site_index] = {'total': 0, 'completed': 0, 'tracker_counts': {}}
+        stats = site_stats[site_index]
+        tracker_name = group['tracker_name'] or 'Unknown'
+
+        stats['total'] += group['count']
+        if group['is_closed'] == 1:
+            stats['completed'] += group['count']
+        stats['tracker_counts'][tracker_name] = stats['tracker_counts'].get(tracker_name, 0) + group['count']
+
+    # Site별 KPI 구성 (CUSTOMER_PROJECT_IDS 순서, 일감이 없는 Site도 0으로 포함)
+    sites = []
+    for site_index, site_id in enumerate(CUSTOMER_PROJECT_IDS):
+        site = hierarchy.get(site_id)
+        if not site:
+            continue
+
+        stats = site_stats.get(site_index, {'total': 0, 'completed': 0, 'tracker_counts': {}})
+        total = stats['total']
+        hw_count = stats['tracker_counts'].get('[AE][이슈] HW Part', 0)
+        sw_count = stats['tracker_counts'].get('[AE][이슈] SW Part', 0)
+
+        sites.append({
+            'site_index': site_index,
+            'project_id': site_id,
+            'project_name': clean_site_name(site['name']),
+            'total_count': total,
+            'completed_count': stats['completed'],
+            'in_progress_count': total - stats['completed'],
+            'completion_rate': round(stats['completed'] / total * 100, 1) if total > 0 else 0,
+            'tracker_counts': dict(sorted(stats['tracker_counts'].items(), key=lambda x: x[1], reverse=True)),
+            'hw_count': hw_count,
+            'hw_ratio': round(hw_count / total * 100, 1) if total > 0 else 0,
+            'sw_count': sw_count,
+            'sw_ratio': round(sw_count / total * 100, 1) if total > 0 else 0
         })
-    
+
     return {
-        "type": "best_member_data",
-        "data": best_member_data
+        "type": "site_comparison",
+        "data": sites
     }
 
+
+def get_member_best_work_data(issues: List[Dict]) -> Dict: # 수정 불가
+    """최고 성과 멤버 상세 데이터 계산 헬퍼 함수"""
+    return compute_block(issues, 'best_member_data')
+
 def get_member_best_work_summary(issues: List[Dict]) -> Dict: # 수정 불가
     """최고 성과 멤버 요약 데이터 계산 헬퍼 함수"""
-    # [AE]BEST 작업인 이슈들 필터링
-    best_issues = [issue for issue in issues if issue.get('status_name') == '[AE]BEST 작업']
-    
-    # 작성자별 BEST 작업 건수 카운트
-    author_counts = {}
-    for issue in best_issues:
-        author_name = issue.get('author_name', '')
-        if author_name:
-            author_counts[author_name] = author_counts.get(author_name, 0) + 1
-    
-    # 요약 데이터 생성
-    best_member_summary = []
-    for author_name, count in author_counts.items():
-        best_member_summary.append({
-            'author': author_name,
-            'count': count
-        })
-    
-    # 건수 기준으로 내림차순 정렬
-    best_member_summary.sort(key=lambda x: x['count'], reverse=True)
-    
-    return {
-        "type": "best_member_summary",
-        "data": best_member_summary
-    }
+    return compute_block(issues, 'best_member_summary')
 
 def get_member_issue_type(issues: List[Dict]) -> Dict: # 수정 불가
     """멤버별 이슈 타입 데이터 조회"""
-    # 작성자별 통계 계산
-    member_stats = {}
-    
-    for issue in issues:
-        author_name = issue.get('author_name', 'Unknown')
-        tracker_name = issue.get('tracker_name', 'Unknown')
-        is_closed = issue.get('is_closed', 0)
-        
-        # tracker_name에서 대괄호 제거하고 깔끔한 이름으로 변환
-        clean_tracker_name = tracker_name.replace('[AE][이슈] ', '').replace('[AE][Setup] ', '').replace('[AE] ', '')
-        
-        if author_name not in member_stats:
-            member_stats[author_name] = {
-                'total_tasks': 0,
-                'in_progress_tasks': 0,
-                'completed_tasks': 0,
-                'completion_rate': 0,
-                'in_progress_types': {},
-                'completed_types': {}
-            }
-        
-        # 전체 작업 수 증가
-        member_stats[author_name]['total_tasks'] += 1
-        
-        # 완료/진행중 작업 분류
-        if is_closed == 1:
-            member_stats[author_name]['completed_tasks'] += 1
-            # 완료 작업 유형 카운트
-            if clean_tracker_name not in member_stats[author_name]['completed_types']:
-                member_stats[author_name]['completed_types'][clean_tracker_name] = 0
-            member_stats[author_name]['completed_types'][clean_tracker_name] += 1
-        else:
-            member_stats[author_name]['in_progress_tasks'] += 1
-            # 진행중 작업 유형 카운트
-            if clean_tracker_name not in member_stats[author_name]['in_progress_types']:
-                member_stats[author_name]['in_progress_types'][clean_tracker_name] = 0
-            member_stats[author_name]['in_progress_types'][clean_tracker_name] += 1
-    
-    # 완료율 계산
-    for author_name, stats in member_stats.items():
-        if stats['total_tasks'] > 0:
-            stats['completion_rate'] = round((stats['completed_tasks'] / stats['total_tasks']) * 100, 1)
-    
-    # 결과 데이터 구성
-    member_issue_data = []
-    for author_name, stats in member_stats.items():
-        # 진행중 작업 유형 텍스트 생성
-        in_progress_text_parts = []
-        for tracker_name, count in stats['in_progress_types'].items():
-            # tracker별 고정 색상 매핑
-            if 'HW' in tracker_name:
-                color = '#FF6B6B'  # 빨간색
-            elif 'SW' in tracker_name:
-                color = '#4CAF50'  # 초록색
-            elif 'AE' in tracker_name:
-                color = '#2196F3'  # 파란색
-            else:
-                color = '#222222'  # 검정색
-            
-            in_progress_text_parts.append(f'<span style="color: {color}">{tracker_name}: {count}건</span>')
-        
-        in_progress_text = "&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;".join(in_progress_text_parts) if in_progress_text_parts else "없음"
-        
-        # 완료 작업 유형 텍스트 생성
-        completed_text_parts = []
-        for tracker_name, count in stats['completed_types'].items():
-            # tracker별 고정 색상 매핑
-            if 'HW' in tracker_name:
-                color = '#FF6B6B'  # 빨간색
-            elif 'SW' in tracker_name:
-                color = '#4CAF50'  # 초록색
-            elif 'AE' in tracker_name:
-                color = '#2196F3'  # 파란색
-            else:
-                color = '#222222'  # 검정색
-            
-            completed_text_parts.append(f'<span style="color: {color}">{tracker_name}: {count}건</span>')
-        
-        completed_text = "&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;".join(completed_text_parts) if completed_text_parts else "없음"
-        
-        # 해당 작업자의 Product별 상세 일감 정보 수집
-        products_data = {}
-        for issue in issues:
-            if issue.get('author_name') == author_name:
-                product = issue.get('product', 'Unknown')
-                if product not in products_data:
-                    products_data[product] = []
-                
-                products_data[product].append({
-                    'redmine_id': issue.get('redmine_id'),
-                    'subject': issue.get('subject'),
-                    'tracker_name': issue.get('tracker_name'),
-                    'status_name': issue.get('status_name'),
-                    'created_date': issue.get('created_at'),
-                    'updated_date': issue.get('updated_at'),
-                    'description': issue.get('description'),
-                    'is_closed': issue.get('is_closed')
-                })
-        
-        member_issue_data.append({
-            'worker': author_name,
-            'total_tasks': stats['total_tasks'],
-            'in_progress_tasks': stats['in_progress_tasks'],
-            'completed_tasks': stats['completed_tasks'],
-            'completion_rate': stats['completion_rate'],
-            'in_progress_types': in_progress_text,
-            'completed_types': completed_text,
-            'products': products_data  # Product별 상세 일감 정보 추가
-        })
-    
-    # 전체 작업 수로 정렬 (내림차순)
-    member_issue_data.sort(key=lambda x: x['total_tasks'], reverse=True)
-    
-    return {
-        "type": "member_issue_type",
-        "title": "작업자별 이슈 유형",
-        "data": member_issue_data
-    }
+    return compute_block(issues, 'member_issue_type')
 
 def get_type_data_count(issues: List[Dict]) -> Dict: # 수정 불가
     """이슈 데이터를 받아서 유형별 통계를 생성하는 헬퍼 함수"""
-    
-    # tracker_name별 카운팅
-    tracker_counts = {}
-    
-    for issue in issues:
-        tracker_name = issue.get('tracker_name', 'Unknown')
-        tracker_counts[tracker_name] = tracker_counts.get(tracker_name, 0) + 1
-    
-    return {
-        "tracker_counts": tracker_counts
-    }
+    return compute_block(issues, 'type_data_count')
 
 def get_type_data_list(issues: List[Dict]) -> Dict: # 수정 불가
     """이슈 데이터를 받아서 유형별 상세 리스트를 생성하는 헬퍼 함수"""
-    
-    # tracker_name별로 이슈들을 그룹화
-    tracker_groups = {}
-    
-    for issue in issues:
-        tracker_name = issue.get('tracker_name', 'Unknown')
-        # tracker_name별 그룹화
-        if tracker_name not in tracker_groups:
-            tracker_groups[tracker_name] = []
-        tracker_groups[tracker_name].append(issue)
-    
-    # 각 tracker별로 상세 정보 구성
-    type_list = []
-    
-    for tracker_name, issue_list in tracker_groups.items():
-        # 완료/미완료 분리
-        completed_issues = [issue for issue in issue_list if issue.get('is_closed') == 1]
-        in_progress_issues = [issue for issue in issue_list if issue.get('is_closed') == 0]
-        
-        # 통계 계산
-        total_count = len(issue_list)
-        completed_count = len(completed_issues)
-        in_progress_count = len(in_progress_issues)
-        completion_rate = (completed_count / total_count * 100) if total_count > 0 else 0
-        
-        # Product별 통계 계산 및 제목 수집
-        product_stats = {}
-        product_titles = {}
-        product_closed_status = {}
-        product_issue_numbers = {}
-        product_descriptions = {}
-        product_members = {}
-        for issue in issue_list:
-            product = issue.get('product', 'Unknown')
-            is_closed = issue.get('is_closed', 0)
-            subject = issue.get('subject', '제목 없음')
-            description = issue.get('description', '')
-            redmine_id = issue.get('redmine_id', 0)
-            assigned_to = issue.get('author_name', 'Unknown')
-            
-            if product not in product_stats:
-                product_stats[product] = {
-                    'total': 0,
-                    'completed': 0,
-                    'in_progress': 0
-                }
-                product_titles[product] = []
-                product_closed_status[product] = []
-                product_issue_numbers[product] = []
-                product_descriptions[product] = []
-                product_members[product] = {}
-            
-            product_stats[product]['total'] += 1
-            product_titles[product].append(subject)
-            product_closed_status[product].append(is_closed)
-            product_issue_numbers[product].append(redmine_id)
-            product_descriptions[product].append(description)
-            
-            # 인원별 통계 추가
-            if assigned_to not in product_members[product]:
-                product_members[product][assigned_to] = {
-                    'total': 0,
-                    'completed': 0,
-                    'in_progress': 0,
-                    'issues': []
-                }
-            
-            product_members[product][assigned_to]['total'] += 1
-            product_members[product][assigned_to]['issues'].append({
-                'subject': subject,
-                'redmine_id': redmine_id,
-                'is_closed': is_closed,
-                'description': description
-            })
-            
-            if is_closed == 1:
-                product_stats[product]['completed'] += 1
-                product_members[product][assigned_to]['completed'] += 1
-            else:
-                product_stats[product]['in_progress'] += 1
-                product_members[product][assigned_to]['in_progress'] += 1
-        
-        # Product별 완료율 계산
-        product_details = []
-        for product, stats in product_stats.items():
-            product_completion_rate = (stats['completed'] / stats['total'] * 100) if stats['total'] > 0 else 0
-            
-            # 인원별 정보 정리
-            member_details = []
-            for member_name, member_stats in product_members[product].items():
-                member_completion_rate = (member_stats['completed'] / member_stats['total'] * 100) if member_stats['total'] > 0 else 0
-                member_details.append({
-                    'member_name': member_name,
-                    'total_count': member_stats['total'],
-                    'completed_count': member_stats['completed'],
-                    'in_progress_count': member_stats['in_progress'],
-                    'completion_rate': round(member_completion_rate, 1),
-                    'issues': member_stats['issues']
-                })
-            
-            # 인원별 총 건수로 정렬 (내림차순)
-            member_details.sort(key=lambda x: x['total_count'], reverse=True)
-            
-            product_details.append({
-                'product_name': product,
-                'total_count': stats['total'],
-                'completed_count': stats['completed'],
-                'in_progress_count': stats['in_progress'],
-                'completion_rate': round(product_completion_rate, 1),
-                'issue_titles': product_titles[product],
-                'issue_closed_status': product_closed_status[product],
-                'issue_numbers': product_issue_numbers[product],
-                'issue_descriptions': product_descriptions[product],
-                'member_details': member_details
-            })
-        
-        # Product별 완료율로 정렬 (내림차순)
-        product_details.sort(key=lambda x: x['completion_rate'], reverse=True)
-        
-        type_list.append({
-            "tracker_name": tracker_name,
-            "total_count": total_count,
-            "completed_count": completed_count,
-            "in_progress_count": in_progress_count,
-            "completion_rate": round(completion_rate, 1),
-            "product_details": product_details
-            
-        })
-    
-    # 총 건수로 정렬 (내림차순)
-    type_list.sort(key=lambda x: x['total_count'], reverse=True)
-    
-    return {
-        "type_list": type_list
-    }
+    return compute_block(issues, 'type_data_list')
 
 def get_progress_summary(issues: List[Dict]) -> Dict: # 수정 불가
     """이슈 데이터를 받아서 진행률 요약 정보를 생성하는 헬퍼 함수"""
-    
-    # 업무 유형별로 그룹화
-    tracker_groups = {}
-    
-    for issue in issues:
-        tracker_name = issue.get('tracker_name', 'Unknown')
-        status_name = issue.get('status_name', 'Unknown')
-        is_closed = issue.get('is_closed', 0)
-        
-        # [사내]가 포함된 tracker는 그룹화하지 않음
-        if '[사내]' in tracker_name:
-            continue
-        
-        if tracker_name not in tracker_groups:
-            tracker_groups[tracker_name] = {}
-        
-        if status_name not in tracker_groups[tracker_name]:
-            tracker_groups[tracker_name][status_name] = {
-                'total': 0,
-                'completed': 0,
-                'in_progress': 0
-            }
-        
-        tracker_groups[tracker_name][status_name]['total'] += 1
-        if is_closed == 1:
-            tracker_groups[tracker_name][status_name]['completed'] += 1
-        else:
-            tracker_groups[tracker_name][status_name]['in_progress'] += 1
-    
-    # 결과 데이터 구성
-    progress_data = []
-    
-    for tracker_name, status_groups in tracker_groups.items():
-        tracker_total = 0
-        tracker_completed = 0
-        
-        status_details = []
-        for status_name, stats in status_groups.items():
-            tracker_total += stats['total']
-            tracker_completed += stats['completed']
-            
-            status_details.append({
-                'status_name': status_name,
-                'total_count': stats['total'],
-                'completed_count': stats['completed'],
-                'in_progress_count': stats['in_progress']
-            })
-        
-        tracker_completion_rate = (tracker_completed / tracker_total * 100) if tracker_total > 0 else 0
-        
-        progress_data.append({
-            'tracker_name': tracker_name,
-            'total_count': tracker_total,
-            'completed_count': tracker_completed,
-            'in_progress_count': tracker_total - tracker_completed,
-            'completion_rate': round(tracker_completion_rate, 1),
-            'status_details': status_details
-        })
-    
-    # 전체 갯수 기준으로 정렬 (내림차순)
-    progress_data.sort(key=lambda x: x['total_count'], reverse=True)
-    
-    return {
-        "progress_data": progress_data
-    }
+    return compute_block(issues, 'progress_summary')
 
 def get_progress_detail(issues: List[Dict]) -> Dict: # 수정 불가
     """이슈 데이터를 받아서 진행률 상세 정보를 생성하는 헬퍼 함수"""
-    
-    # 업무 유형별로 그룹화
-    tracker_details = {}
-    
-    for issue in issues:
-        tracker_name = issue.get('tracker_name', 'Unknown')
-        status_name = issue.get('status_name', 'Unknown')
-        assigned_to = issue.get('assigned_to', '미지정')
-        subject = issue.get('subject', '제목 없음')
-        description = issue.get('description', '내용 없음')
-        redmine_id = issue.get('redmine_id', 0)
-        
-        if tracker_name not in tracker_details:
-            tracker_details[tracker_name] = {}
-        
-        if status_name not in tracker_details[tracker_name]:
-            tracker_details[tracker_name][status_name] = []
-        
-        tracker_details[tracker_name][status_name].append({
-            'assigned_to': assigned_to,
-            'subject': subject,
-            'description': description,
-            'status_name': status_name,
-            'redmine_id': redmine_id,
-            'author_name': issue.get('author_name', '미지정')
-        })
-    
-    # 결과 데이터 구성
-    detail_data = []
-    
-
-    
-    for tracker_name, status_groups in tracker_details.items():
-        tracker_detail = {
-            'tracker_name': tracker_name,
-            'status_details': []
-        }
-        
-        # tracker_name에 따른 status_order 설정
-        current_status_order = []
-        if tracker_name == '[AE][이슈] AE Part':
-            current_status_order = [
-                '[AE][운영]이슈 등록',
-                '[AE][운영] 문제 조치', 
-                '[AE][운영] 확산 적용',
-                '[AE][운영] 조치 완료',
-                '[AE]BEST 작업'
-            ]
-        elif tracker_name == '[AE][이슈] HW Part':
-            current_status_order = [
-                '[AE][HW] 이슈 등록',
-                '[AE][HW] 개선 방향 협의',
-                '[AE][HW] 문제 조치',
-                '[AE][HW] 확산',
-                '[AE][HW] 조치 완료',
-                '[AE]BEST 작업'
-            ]
-        elif tracker_name == '[AE][이슈] SW Part':
-            current_status_order = [
-                '[AE][SW] 이슈 등록',
-                '[AE][SW] 개선 방향 협의',
-                '[사내][SW] 개발',
-                '[사내][SW] 개발 완료',
-                '[AE][SW] 현장 적용',
-                '[AE][SW] 확산 Patch',
-                '[AE][SW] 조치 완료',
-                '[AE]BEST 작업'
-            ]
-        elif tracker_name == '[AE][Setup] 이설 Setup':
-            current_status_order = [
-                '[AE][Setup] 반입&레벨링',
-                '[AE][Setup] 기초 Setup',
-                '[AE][Setup] TTTM',
-                '[AE][Setup] 자동화',
-                '[AE][Setup] Setup 완료'
-            ]
-        elif tracker_name == '[AE][Setup] 초기 Setup':
-            current_status_order = [
-                '[AE][Setup] 반입&레벨링',
-                '[AE][Setup] 기초 Setup',
-                '[AE][Setup] TTTM',
-                '[AE][Setup] 자동화',
-                '[AE][Setup] Setup 완료'
-            ]
-        elif tracker_name == '[AE] 확산 적용':
-            current_status_order = [
-                '[AE][확산] 확산 시작',
-                '[AE][확산] 확산 완료'
-            ]
-        
-        # 정의된 순서대로 status_details 정렬 (카운트가 0이어도 출력)
-        for status_name in current_status_order:
-            status_detail = {
-                'status_name': status_name,
-                'issues': status_groups.get(status_name, [])  # 없으면 빈 배열
-            }
-            tracker_detail['status_details'].append(status_detail)
-        
-        # 정의되지 않은 status_name들도 추가 (순서 뒤에)
-        for status_name, issues in status_groups.items():
-            if status_name not in current_status_order:
-                status_detail = {
-                    'status_name': status_name,
-                    'issues': issues
-                }
-                tracker_detail['status_details'].append(status_detail)
-        
-        detail_data.append(tracker_detail)
-    
-    return {
-        "progress_detail": detail_data
-    }
+    return compute_block(issues, 'progress_detail')
 
-def generate_site_tooltip(issues: List[Dict]) -> str: 
+def generate_site_tooltip(issues: List[Dict], top_k: int = 3) -> str: 
     """이슈 데이터를 받아서 Site 툴팁용 요약 텍스트를 생성하는 헬퍼 함수"""
     # 완료된 일감과 미완료 일감 분리
     completed_issues = [issue for issue in issues if issue.get('is_closed') == 1]
@@ -767,8 +511,9 @@ def generate_site_tooltip(issues: List[Dict]) -> str:
     if completed_parts:
         tooltip_text += f'<div style="margin-bottom: 8px;"><span style="color: #FFFFFF; font-weight: bold;">완료</span>&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;' + "&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;".join(completed_parts) + '</div>'
     
-    # 각 tracker별 주요 작업 추가
+    # 각 tracker별 주요 작업 추가 (완료 일감을 tracker별로 한 번에 묶어서 사용)
     tooltip_text += "<br><br>"
+    completed_issues_by_tracker = group_issues(completed_issues, ['tracker_name'])
     
     for tracker_name, count in completed_tracker_counts.items():
         clean_name = tracker_name.replace('[AE][이슈] ', '').replace('[AE][Setup] ', '').replace('[AE] ', '')
@@ -783,7 +528,7 @@ def generate_site_tooltip(issues: List[Dict]) -> str:
             color = '#FF9800'  # 주황색
         
         # 해당 tracker의 일감들 필터링
-        tracker_issues = [issue for issue in completed_issues if issue.get('tracker_name') == tracker_name]
+        tracker_issues = completed_issues_by_tracker.get(tracker_name, [])
         
         tooltip_text += f'<div style="margin-bottom: 8px;"><span style="color: {color}; font-weight: bold; font-size: 1.1rem;">{clean_name} 주요 작업</span><br>'
         
@@ -798,16 +543,16 @@ def generate_site_tooltip(issues: List[Dict]) -> str:
         
         tooltip_text += '</div>'
     
-    # 등록 인원별 Top 3 추가 (완료된 일감 기준)
+    # 등록 인원별 Top K 추가 (완료된 일감 기준)
     author_counts = {}
     for issue in completed_issues:
         author = issue.get('author_name', 'Unknown')
         author_counts[author] = author_counts.get(author, 0) + 1
     
-    # 등록 인원별 Top 3 정렬
-    top_authors = sorted(author_counts.items(), key=lambda x: x[1], reverse=True)[:3]
+    # 등록 인원별 Top K 선택 (전체 정렬 없이 상위 K명만)
+    top_authors = top_k_items(author_counts.items(), top_k, key=lambda x: x[1])
     
-    tooltip_text += f'<br><div style="margin-top: 8px;"><span style="color: #9C27B0; font-weight: bold; font-size: 1.1rem;">등록 인원별 Top 3 (완료)</span><br>'
+    tooltip_text += f'<br><div style="margin-top: 8px;"><span style="color: #9C27B0; font-weight: bold; font-size: 1.1rem;">등록 인원별 Top {top_k} (완료)</span><br>'
     for i, (author, count) in enumerate(top_authors, 1):
         tooltip_text += f'<span style="font-size: 1.1rem;">{i}. {author}: {count}건</span><br>'
     tooltip_text += '</div>'
@@ -1057,284 +802,42 @@ def get_issue_project_ids(site_index: int, sub_site_name: str, product_name: str
 
 def get_hw_equipment_analysis(issues: List[Dict]) -> Dict: # 수정 불가
     """설비군별 HW 부품 문제 분석 헬퍼 함수"""
-    # HW 이슈만 필터링
-    hw_issues = [issue for issue in issues if issue.get('tracker_name') == '[AE][이슈] HW Part']
-    
-    if not hw_issues:
-        return {}
-    
-    # 설비군별로 그룹화
-    equipment_analysis = {}
-    
-    for issue in hw_issues:
-        product_name = issue.get('product', 'Unknown')
-        raw_data = issue.get('raw_data', '{}')
-        
-        try:
-            raw_dict = json.loads(raw_data)
-            custom_fields = raw_dict.get('custom_fields', [])
-            
-            # 설비군별 데이터 초기화
-            if product_name not in equipment_analysis:
-                equipment_analysis[product_name] = {
-                    'total_hw_issues': 0,
-                    'hw_components': [],
-                    'hw_issues': []
-                }
-            
-            equipment_analysis[product_name]['total_hw_issues'] += 1
-            
-            # [HW]와 [Optic] 태그가 붙은 필드들 찾기
-            hw_values = []
-            for field in custom_fields:
-                field_name = field.get('name', '')
-                field_value = field.get('value', '')
-                
-                # [HW] 또는 [Optic] 태그가 있고 값이 있는 경우
-                if ('[HW]' in field_name or '[Optic]' in field_name) and field_value:
-                    hw_values.append(field_value)
-            
-            # HW 관련 값들을 설비군에 추가
-            if hw_values:
-                equipment_analysis[product_name]['hw_components'].extend(hw_values)
-            else:
-                # HW 값이 없으면 "없음" 추가
-                equipment_analysis[product_name]['hw_components'].append("없음")
-            
-            # HW 이슈 상세 정보 추가
-            issue_detail = {
-                'redmine_id': issue.get('redmine_id'),
-                'subject': issue.get('subject', ''),
-                'hw_components': hw_values,
-                'is_closed': issue.get('is_closed', 0),
-                'description': issue.get('description', '')
-            }
-            equipment_analysis[product_name]['hw_issues'].append(issue_detail)
-                    
-        except json.JSONDecodeError:
-            continue
-    
-    return equipment_analysis
+    return compute_block(issues, 'hw_equipment_analysis')
 
 def get_hw_overview_summary(issues: List[Dict]) -> Dict: # 수정 불가
     """HW 이슈 전체 요약 정보 생성 헬퍼 함수"""
-    # HW 이슈만 필터링
-    hw_issues = [issue for issue in issues if issue.get('tracker_name') == '[AE][이슈] HW Part']
-    
-    if not hw_issues:
-        return {
-            "total_hw_issues": 0,
-            "total_equipment": 0,
-            "completion_rate": 0,
-            "equipment_summary": {}
-        }
-    
-    # 전체 HW 이슈 통계
-    total_hw_issues = len(hw_issues)
-    completed_hw_issues = sum(1 for issue in hw_issues if issue.get('is_closed') == 1)
-    completion_rate = round((completed_hw_issues / total_hw_issues * 100), 1) if total_hw_issues > 0 else 0
-    
-    # 설비군별 전체 이슈 vs HW 이슈 비교
-    equipment_summary = {}
-    
-    # 모든 이슈를 설비군별로 그룹화
-    all_equipment_issues = {}
-    for issue in issues:
-        product_name = issue.get('product', 'Unknown')
-        if product_name not in all_equipment_issues:
-            all_equipment_issues[product_name] = []
-        all_equipment_issues[product_name].append(issue)
-    
-    # HW 이슈를 설비군별로 그룹화
-    hw_equipment_issues = {}
-    for issue in hw_issues:
-        product_name = issue.get('product', 'Unknown')
-        if product_name not in hw_equipment_issues:
-            hw_equipment_issues[product_name] = []
-        hw_equipment_issues[product_name].append(issue)
-    
-    # 설비군별 요약 정보 생성
-    for equipment in all_equipment_issues.keys():
-        total_issues = len(all_equipment_issues[equipment])
-        hw_issues_count = len(hw_equipment_issues.get(equipment, []))
-        hw_ratio = round((hw_issues_count / total_issues * 100), 1) if total_issues > 0 else 0
-        
-        # HW 이슈 중 완료된 것 계산
-        completed_hw = sum(1 for issue in hw_equipment_issues.get(equipment, []) if issue.get('is_closed') == 1)
-        hw_completion_rate = round((completed_hw / hw_issues_count * 100), 1) if hw_issues_count > 0 else 0
-        
-        equipment_summary[equipment] = {
-            "total": total_issues,
-            "hw": hw_issues_count,
-            "hw_ratio": hw_ratio,
-            "hw_completion_rate": hw_completion_rate
-        }
-    
-    # 전체 이슈 대비 HW 이슈 비율 계산
-    total_all_issues = len(issues)
-    hw_ratio = round((total_hw_issues / total_all_issues * 100), 1) if total_all_issues > 0 else 0
-    
-    return {
-        "total_hw_issues": total_hw_issues,
-        "total_all_issues": total_all_issues,
-        "hw_ratio": hw_ratio,
-        "completion_rate": completion_rate,
-        "equipment_summary": equipment_summary
-    }
+    return compute_block(issues, 'hw_overview_summary')
 
 def get_sw_overview_summary(issues: List[Dict]) -> Dict: # 수정 불가
     """SW 이슈 전체 요약 정보 생성 헬퍼 함수"""
-    # SW 이슈만 필터링
-    sw_issues = [issue for issue in issues if issue.get('tracker_name') == '[AE][이슈] SW Part']
-    
-    if not sw_issues:
-        return {
-            "total_sw_issues": 0,
-            "total_equipment": 0,
-            "completion_rate": 0,
-            "equipment_summary": {}
-        }
-    
-    # 전체 SW 이슈 통계
-    total_sw_issues = len(sw_issues)
-    completed_sw_issues = sum(1 for issue in sw_issues if issue.get('is_closed') == 1)
-    completion_rate = round((completed_sw_issues / total_sw_issues * 100), 1) if total_sw_issues > 0 else 0
-    
-    # 설비군별 전체 이슈 vs SW 이슈 비교
-    equipment_summary = {}
-    
-    # 모든 이슈를 설비군별로 그룹화
-    all_equipment_issues = {}
-    for issue in issues:
-        product_name = issue.get('product', 'Unknown')
-        if product_name not in all_equipment_issues:
-            all_equipment_issues[product_name] = []
-        all_equipment_issues[product_name].append(issue)
-    
-    # SW 이슈를 설비군별로 그룹화
-    sw_equipment_issues = {}
-    for issue in sw_issues:
-        product_name = issue.get('product', 'Unknown')
-        if product_name not in sw_equipment_issues:
-            sw_equipment_issues[product_name] = []
-        sw_equipment_issues[product_name].append(issue)
-    
-    # 설비군별 요약 정보 생성
-    for equipment in all_equipment_issues.keys():
-        total_issues = len(all_equipment_issues[equipment])
-        sw_issues_count = len(sw_equipment_issues.get(equipment, []))
-        sw_ratio = round((sw_issues_count / total_issues * 100), 1) if total_issues > 0 else 0
-        
-        # SW 이슈 중 완료된 것 계산
-        completed_sw = sum(1 for issue in sw_equipment_issues.get(equipment, []) if issue.get('is_closed') == 1)
-        sw_completion_rate = round((completed_sw / sw_issues_count * 100), 1) if sw_issues_count > 0 else 0
-        
-        equipment_summary[equipment] = {
-            "total": total_issues,
-            "sw": sw_issues_count,
-            "sw_ratio": sw_ratio,
-            "sw_completion_rate": sw_completion_rate
-        }
-    
-    # 전체 이슈 대비 SW 이슈 비율 계산
-    total_all_issues = len(issues)
-    sw_ratio = round((total_sw_issues / total_all_issues * 100), 1) if total_all_issues > 0 else 0
-    
-    return {
-        "total_sw_issues": total_sw_issues,
-        "total_all_issues": total_all_issues,
-        "sw_ratio": sw_ratio,
-        "completion_rate": completion_rate,
-        "equipment_summary": equipment_summary
-    }
+    return compute_block(issues, 'sw_overview_summary')
 
 def get_sw_detail_analysis(issues: List[Dict]) -> Dict: # 수정 불가
     """SW 이슈 상세 분석 헬퍼 함수"""
-    # SW 이슈만 필터링
-    sw_issues = [issue for issue in issues if issue.get('tracker_name') == '[AE][이슈] SW Part']
-    
-    if not sw_issues:
-        return {}
-    
-    # 설비군별로 그룹화
-    equipment_analysis = {}
-    
-    for issue in sw_issues:
-        product_name = issue.get('product', 'Unknown')
-        
-        # 설비군별 데이터 초기화
-        if product_name not in equipment_analysis:
-            equipment_analysis[product_name] = {
-                'total_sw_issues': 0,
-                'project_groups': {}
-            }
-        
-        equipment_analysis[product_name]['total_sw_issues'] += 1
-        
-        # Project ID로 그룹화
-        project_id = issue.get('project_id', 'Unknown')
-        
-        # Project ID별 그룹 초기화
-        if project_id not in equipment_analysis[product_name]['project_groups']:
-            # 프로젝트 이름에서 #태그 뒷부분만 추출하고 첫 번째 단어를 파란색으로 처리
-            original_project_name = issue.get('project_name', '')
-            processed_project_name = original_project_name
-            
-            # #숫자 패턴 이후부터 추출
-            import re
-            match = re.search(r'#\d+\s*(.+)', original_project_name)
-            if match:
-                processed_project_name = match.group(1).strip()
-            
-            # 첫 번째 단어는 파란색, 두 번째 단어는 엔터, 그 이후는 그대로
-            if processed_project_name:
-                words = processed_project_name.split()
-                if len(words) >= 1:
-                    first_word = f'<span style="color: #007bff; font-weight: 600;">{words[0]}</span>'
-                    if len(words) >= 2:
-                        second_word = f'<br/>{words[1]}'
-                        remaining_words = ' '.join(words[2:]) if len(words) > 2 else ''
-                        processed_project_name = f'{first_word}{second_word} {remaining_words}'.strip()
-                    else:
-                        processed_project_name = first_word
-                else:
-                    processed_project_name = ''
-            
-            equipment_analysis[product_name]['project_groups'][project_id] = {
-                'total_issues': 0,
-                'project_name': processed_project_name,
-                'sw_issues': []
-            }
-        
-        equipment_analysis[product_name]['project_groups'][project_id]['total_issues'] += 1
-        
-        # SW 이슈 상세 정보 추가
-        issue_detail = {
-            'redmine_id': issue.get('redmine_id'),
-            'subject': issue.get('subject', ''),
-            'is_closed': issue.get('is_closed', 0),
-            'description': issue.get('description', ''),
-            'created_on': issue.get('created_at', ''),
-            'updated_on': issue.get('updated_at', ''),
-            'author_name': issue.get('author_name', ''),
-            'status': issue.get('status', ''),
-            'project_id': project_id,
-            'project_name': issue.get('project_name', '')
-        }
-        equipment_analysis[product_name]['project_groups'][project_id]['sw_issues'].append(issue_detail)
-    
-    return equipment_analysis
+    return compute_block(issues, 'sw_detail_analysis')
 
 router = APIRouter(prefix="/api/issues", tags=["issues"])
 
 
 
+def get_site_etag() -> Optional[str]:
+    """SITE 목록 ETag (프로젝트 동기화 세대 + 고객사 설정), DB 조회 실패 시 None"""
+    generation = DatabaseManager().get_sync_generation('projects')
+    if generation is None:
+        return None
+    return make_etag("site", [generation], CUSTOMER_CONFIG_DIGEST)
+
+
 @router.get("/site")
-async def get_site(): # 수정 불가
-    """고객사 프로젝트 목록 조회 (SITE 버튼용)"""
+async def get_site(request: Request, response: Response): # 수정 불가
+    """고객사 프로젝트 목록 조회 (SITE 버튼용, 같은 세대를 가진 클라이언트에는 본문 없이 304)"""
     try:
+        etag = await run_blocking('db', get_site_etag)
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+
         db = DatabaseManager()
-        projects = db.get_projects_by_ids(CUSTOMER_PROJECT_IDS)
+        projects = await run_blocking('db', db.get_projects_by_ids, CUSTOMER_PROJECT_IDS)
         
         # 프로젝트 이름에서 번호 제거 (예: "01. 삼성전자" -> "삼성전자")
         site_list = []
@@ -1348,6 +851,8 @@ async def get_site(): # 수정 불가
                 'project_name': clean_name
             })
         
+        if etag:
+            response.headers.update(etag_headers(etag))
         return {
             "success": True,
             "projects": site_list
@@ -1362,7 +867,7 @@ async def get_sub_site(site_index: int = Query(..., description="SITE 버튼 인
     site_id = CUSTOMER_PROJECT_IDS[site_index]
     
     db = DatabaseManager()
-    project_info = db.get_projects_by_ids([site_id])
+    project_info = await run_blocking('db', db.get_projects_by_ids, [site_id])
     
     if not project_info:
         return {"success": True, "projects": [{"project_name": "ALL"}]}
@@ -1371,7 +876,7 @@ async def get_sub_site(site_index: int = Query(..., description="SITE 버튼 인
     # JSON 문자열을 파싱해서 숫자 리스트로 변환
     if isinstance(children_ids, str):
         children_ids = json.loads(children_ids)
-    sub_projects = db.get_projects_by_ids(children_ids)
+    sub_projects = await run_blocking('db', db.get_projects_by_ids, children_ids)
     
     sub_site_list = []
     sub_site_list.append({
@@ -1410,7 +915,7 @@ async def get_sub_sites(request: Request): # 수정 불가
                 site_id = CUSTOMER_PROJECT_IDS[site_index]
                 
                 db = DatabaseManager()
-                project_info = db.get_projects_by_ids([site_id])
+                project_info = await run_blocking('db', db.get_projects_by_ids, [site_id])
                 
                 if not project_info:
                     continue
@@ -1419,7 +924,7 @@ async def get_sub_sites(request: Request): # 수정 불가
                 # JSON 문자열을 파싱해서 숫자 리스트로 변환
                 if isinstance(children_ids, str):
                     children_ids = json.loads(children_ids)
-                sub_projects = db.get_projects_by_ids(children_ids)
+                sub_projects = await run_blocking('db', db.get_projects_by_ids, children_ids)
                 
                 # 각 SITE의 Sub Site 목록 추가
                 for project in sub_projects:
@@ -1450,7 +955,7 @@ async def get_product_list(sub_project_name: str = Query(..., description="SUB 
         db = DatabaseManager()
         
         # 1. SUB 프로젝트 이름으로 프로젝트 정보 조회
-        projects = db.get_projects_by_name(sub_project_name)
+        projects = await run_blocking('db', db.get_projects_by_name, sub_project_name)
         
         # 2. children_ids를 JSON에서 파싱해서 ID 리스트로 변환
         children_ids = []
@@ -1460,7 +965,7 @@ async def get_product_list(sub_project_name: str = Query(..., description="SUB 
                 children_ids = json.loads(children_ids_str)
         
         # 3. children_ids로 하위 프로젝트들의 모든 정보 조회
-        sub_projects = db.get_projects_by_ids(children_ids)
+        sub_projects = await run_blocking('db', db.get_projects_by_ids, children_ids)
         
         # 4. 레벨에 따라 처리
         products = []
@@ -1479,7 +984,7 @@ async def get_product_list(sub_project_name: str = Query(..., description="SUB 
                     products_ids.extend(sub_children_ids)
         
         # 5. products_ids로 하위 프로젝트들의 모든 정보 조회
-        final_products = db.get_projects_by_ids(products_ids)
+        final_products = await run_blocking('db', db.get_projects_by_ids, products_ids)
         
         # 6. final_products에서 레벨 4인 프로젝트들만 products에 저장
         for project in final_products:
@@ -1532,7 +1037,7 @@ async def get_product_lists(request: Request): # 수정 불가가
             try:
                 # 기존 get_product_list 함수의 로직을 재사용
                 db = DatabaseManager()
-                projects = db.get_projects_by_name(sub_site_name)
+                projects = await run_blocking('db', db.get_projects_by_name, sub_site_name)
                 
                 if not projects:
                     continue
@@ -1541,7 +1046,7 @@ async def get_product_lists(request: Request): # 수정 불가가
                 if isinstance(children_ids_str, str):
                     children_ids = json.loads(children_ids_str)
                 
-                sub_projects = db.get_projects_by_ids(children_ids)
+                sub_projects = await run_blocking('db', db.get_projects_by_ids, children_ids)
                 
                 # 레벨에 따라 처리
                 products = []
@@ -1558,7 +1063,7 @@ async def get_product_lists(request: Request): # 수정 불가가
                             products_ids.extend(sub_children_ids)
                 
                 # products_ids로 하위 프로젝트들의 모든 정보 조회
-                final_products = db.get_projects_by_ids(products_ids)
+                final_products = await run_blocking('db', db.get_projects_by_ids, products_ids)
                 
                 # final_products에서 레벨 4인 프로젝트들만 products에 저장
                 for project in final_products:
@@ -1629,14 +1134,14 @@ async def get_all_product_list(request: Request):  # 수정 불가
             
             # 각 Sub Site의 프로젝트 데이터를 all_projects에 추가
             db = DatabaseManager()
-            projects = db.get_projects_by_name(sub_site_name)
+            projects = await run_blocking('db', db.get_projects_by_name, sub_site_name)
             
             if projects and len(projects) > 0:
                 children_ids_str = projects[0].get('children_ids', '[]')
                 if isinstance(children_ids_str, str):
                     children_ids = json.loads(children_ids_str)
                 
-                sub_projects = db.get_projects_by_ids(children_ids)
+                sub_projects = await run_blocking('db', db.get_projects_by_ids, children_ids)
                 
                 # 레벨에 따라 처리
                 products = []
@@ -1652,7 +1157,7 @@ async def get_all_product_list(request: Request):  # 수정 불가
                             sub_children_ids = json.loads(children_ids_str)
                             products_ids.extend(sub_children_ids)
                 
-                final_products = db.get_projects_by_ids(products_ids)
+                final_products = await run_blocking('db', db.get_projects_by_ids, products_ids)
                 
                 for project in final_products:
                     level = project.get('level', 0)
@@ -1686,61 +1191,48 @@ async def get_all_product_list(request: Request):  # 수정 불가
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"전체 Product List 조회 실패: {str(e)}") 
 
+@router.get("/hierarchy")
+async def get_hierarchy(request: Request, response: Response):
+    """고객사 → Sub Site → Product 전체 트리를 한 번에 조회 (동기화 세대 기반 ETag)"""
+    try:
+        hierarchy = await run_blocking('db', get_project_hierarchy)
+        etag = get_hierarchy_etag(hierarchy)
+
+        # 클라이언트가 같은 세대의 트리를 이미 가지고 있으면 본문 없이 304 반환
+        # (DB 장애 시 만든 임시 트리는 ETag 없이 반환해서 캐시되지 않도록 함)
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+
+        if etag:
+            response.headers.update(etag_headers(etag))
+        return {
+            "success": True,
+            "data": hierarchy.to_tree()
+        }
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"계층 트리 조회 실패: {str(e)}")
+
 @router.post("/get-summary-report")
-async def get_summary_report(request: Request): # 수정 불가
+async def get_summary_report(request: Request, response: Response): # 수정 불가
     """주간 업무보고 요약 데이터 조회 API"""
     try:
         data = await request.json()
-        start_date = data.get('start_date')
-        end_date = data.get('end_date')
-        site_indexes = data.get('site_indexes', [])  # 다중 SITE 지원
-        sub_site_names = data.get('sub_site_names', [])  # 다중 Sub Site 지원
-        product_names = data.get('product_names', [])  # 다중 Product 지원
-        
-        # 기존 단일 선택 호환성을 위한 처리
-        if not site_indexes and data.get('site_index') is not None:
-            site_indexes = [data.get('site_index')]
-        if not sub_site_names and data.get('sub_site_name'):
-            sub_site_names = [data.get('sub_site_name')]
-        if not product_names and data.get('product_name'):
-            product_names = [data.get('product_name')]
         
-        if not all([start_date, end_date, site_indexes, sub_site_names, product_names]):
-            raise HTTPException(status_code=400, detail="필수 파라미터가 누락되었습니다: start_date, end_date, site_indexes, sub_site_names, product_names")
-        
-        # 선택된 리스트들 로그 출력
-        
-        # 모든 선택된 항목들의 프로젝트 ID 리스트 수집
-        all_project_ids = []
-        
-        for site_index in site_indexes:
-            for sub_site_name in sub_site_names:
-                for product_name in product_names:
-                    # 헬퍼 함수 호출하여 프로젝트 ID 리스트 가져오기
-                    project_ids = get_issue_project_ids(site_index, sub_site_name, product_name)
-                    all_project_ids.extend(project_ids)
-        
-        # 중복 제거
-        all_project_ids = list(set(all_project_ids))
-        
-        # project_ids와 기간을 가지고 이슈 데이터 조회
-        db = DatabaseManager()
-        issues = db.get_issues_by_filter(start_date, end_date, all_project_ids)
-        
-        # 진행률 요약 블럭과 유형별 상세 현황 블럭 생성
-        progress_summary = get_progress_summary(issues)
-        type_data_list = get_type_data_list(issues)
+        # 진행률 요약 블럭과 유형별 상세 현황 블럭 생성 (동일 필터 동시 요청은 계산 1번으로 합침)
+        block_names = ['progress_summary', 'type_data_list']
+        results = (await get_filtered_blocks(data, block_names, get_summary_options(data, block_names), request, response))['blocks']
         blocks = [
-            {"type": "progress_summary", "data": progress_summary},
-            {"type": "type_data_list", "data": type_data_list}
+            {"type": "progress_summary", "data": results['progress_summary']},
+            {"type": "type_data_list", "data": results['type_data_list']}
         ]
         
-        return {
+        return fast_json_response({
             "success": True,
             "data": {
                 "blocks": blocks
             }
-        }
+        }, response)
             
     except HTTPException:
         raise
@@ -1749,47 +1241,15 @@ async def get_summary_report(request: Request): # 수정 불가
 
 
 @router.post("/get-progress-data")
-async def get_progress_data(request: Request): # 수정 불가
+async def get_progress_data(request: Request, response: Response): # 수정 불가
     """진행율 데이터 조회 API"""
     try:
         data = await request.json()
-        start_date = data.get('start_date')
-        end_date = data.get('end_date')
-        site_indexes = data.get('site_indexes', [])
-        sub_site_names = data.get('sub_site_names', [])
-        product_names = data.get('product_names', [])
-
-        # 기존 단일 선택 호환성을 위한 처리
-        if not site_indexes and data.get('site_index') is not None:
-            site_indexes = [data.get('site_index')]
-        if not sub_site_names and data.get('sub_site_name'):
-            sub_site_names = [data.get('sub_site_name')]
-        if not product_names and data.get('product_name'):
-            product_names = [data.get('product_name')]
-
-        if not all([start_date, end_date, site_indexes, sub_site_names, product_names]):
-            raise HTTPException(status_code=400, detail="필수 파라미터가 누락되었습니다: start_date, end_date, site_indexes, sub_site_names, product_names")
-
-        # 모든 선택된 항목들의 프로젝트 ID 리스트 수집
-        all_project_ids = []
-        
-        for site_index in site_indexes:
-            for sub_site_name in sub_site_names:
-                for product_name in product_names:
-                    # 헬퍼 함수 호출하여 프로젝트 ID 리스트 가져오기
-                    project_ids = get_issue_project_ids(site_index, sub_site_name, product_name)
-                    all_project_ids.extend(project_ids)
         
-        # 중복 제거
-        all_project_ids = list(set(all_project_ids))
-        
-        # project_ids와 기간을 가지고 이슈 데이터 조회
-        db = DatabaseManager()
-        issues = db.get_issues_by_filter(start_date, end_date, all_project_ids)
-        
-        # 진행율 데이터 로직 구현
-        progress_summary = get_progress_summary(issues)
-        progress_detail = get_progress_detail(issues)
+        # 진행율 데이터 로직 구현 (동일 필터 동시 요청은 계산 1번으로 합침)
+        results = (await get_filtered_blocks(data, ['progress_summary', 'progress_detail'], None, request, response))['blocks']
+        progress_summary = results['progress_summary']
+        progress_detail = results['progress_detail']
         
         # 블럭 구조로 데이터 구성
         blocks = [
@@ -1803,12 +1263,12 @@ async def get_progress_data(request: Request): # 수정 불가
             }
         ]
 
-        return {
+        return fast_json_response({
             "success": True,
             "data": {
                 "blocks": blocks
             }
-        }
+        }, response)
             
     except HTTPException:
         raise
@@ -1817,46 +1277,16 @@ async def get_progress_data(request: Request): # 수정 불가
 
 
 @router.post("/get-type-data")
-async def get_type_data(request: Request): # 수정 불가
+async def get_type_data(request: Request, response: Response): # 수정 불가
     """유형 데이터 조회 API"""
     try:
         data = await request.json()
-        start_date = data.get('start_date')
-        end_date = data.get('end_date')
-        site_indexes = data.get('site_indexes', [])
-        sub_site_names = data.get('sub_site_names', [])
-        product_names = data.get('product_names', [])
-
-        # 기존 단일 선택 호환성을 위한 처리
-        if not site_indexes and data.get('site_index') is not None:
-            site_indexes = [data.get('site_index')]
-        if not sub_site_names and data.get('sub_site_name'):
-            sub_site_names = [data.get('sub_site_name')]
-        if not product_names and data.get('product_name'):
-            product_names = [data.get('product_name')]
-
-        if not all([start_date, end_date, site_indexes, sub_site_names, product_names]):
-            raise HTTPException(status_code=400, detail="필수 파라미터가 누락되었습니다: start_date, end_date, site_indexes, sub_site_names, product_names")
-        # 모든 선택된 항목들의 프로젝트 ID 리스트 수집
-        all_project_ids = []
-        
-        for site_index in site_indexes:
-            for sub_site_name in sub_site_names:
-                for product_name in product_names:
-                    # 헬퍼 함수 호출하여 프로젝트 ID 리스트 가져오기
-                    project_ids = get_issue_project_ids(site_index, sub_site_name, product_name)
-                    all_project_ids.extend(project_ids)
-        
-        # 중복 제거
-        all_project_ids = list(set(all_project_ids))
-        
-        # project_ids와 기간을 가지고 이슈 데이터 조회
-        db = DatabaseManager()
-        issues = db.get_issues_by_filter(start_date, end_date, all_project_ids)
         
-        # 유형 데이터 로직 구현
-        type_data_count = get_type_data_count(issues)
-        type_data_list = get_type_data_list(issues)
+        # 유형 데이터 로직 구현 (동일 필터 동시 요청은 계산 1번으로 합침)
+        block_names = ['type_data_count', 'type_data_list']
+        results = (await get_filtered_blocks(data, block_names, get_summary_options(data, block_names), request, response))['blocks']
+        type_data_count = results['type_data_count']
+        type_data_list = results['type_data_list']
 
         # 블럭 구조로 데이터 구성
         blocks = [
@@ -1870,12 +1300,12 @@ async def get_type_data(request: Request): # 수정 불가
             }
         ]
 
-        return {
+        return fast_json_response({
             "success": True,
             "data": {
                 "blocks": blocks
             }
-        }
+        }, response)
             
     except HTTPException:
         raise
@@ -1884,50 +1314,17 @@ async def get_type_data(request: Request): # 수정 불가
 
 
 @router.post("/get-member-data")
-async def get_member_data(request: Request): # 수정 불가
+async def get_member_data(request: Request, response: Response): # 수정 불가
     """인원 데이터 조회 API"""
     try:
         data = await request.json()
-        start_date = data.get('start_date')
-        end_date = data.get('end_date')
-        site_indexes = data.get('site_indexes', [])
-        sub_site_names = data.get('sub_site_names', [])
-        product_names = data.get('product_names', [])
-
-        # 기존 단일 선택 호환성을 위한 처리
-        if not site_indexes and data.get('site_index') is not None:
-            site_indexes = [data.get('site_index')]
-        if not sub_site_names and data.get('sub_site_name'):
-            sub_site_names = [data.get('sub_site_name')]
-        if not product_names and data.get('product_name'):
-            product_names = [data.get('product_name')]
-
-        if not all([start_date, end_date, site_indexes, sub_site_names, product_names]):
-            raise HTTPException(status_code=400, detail="필수 파라미터가 누락되었습니다: start_date, end_date, site_indexes, sub_site_names, product_names")
-
-        # 선택된 리스트들 로그 출력
-        
-        # 모든 선택된 항목들의 프로젝트 ID 리스트 수집
-        all_project_ids = []
-        
-        for site_index in site_indexes:
-            for sub_site_name in sub_site_names:
-                for product_name in product_names:
-                    # 헬퍼 함수 호출하여 프로젝트 ID 리스트 가져오기
-                    project_ids = get_issue_project_ids(site_index, sub_site_name, product_name)
-                    all_project_ids.extend(project_ids)
-        
-        # 중복 제거
-        all_project_ids = list(set(all_project_ids))
         
-        # project_ids와 기간을 가지고 이슈 데이터 조회
-        db = DatabaseManager()
-        issues = db.get_issues_by_filter(start_date, end_date, all_project_ids)
-
-        # TODO: 인원 데이터 로직 구현
-        best_member_data = get_member_best_work_data(issues)
-        best_member_summary = get_member_best_work_summary(issues)
-        member_issue_type = get_member_issue_type(issues)
+        # 인원 데이터 블럭 계산 (동일 필터 동시 요청은 계산 1번으로 합침)
+        block_names = ['best_member_data', 'best_member_summary', 'member_issue_type']
+        results = (await get_filtered_blocks(data, block_names, get_summary_options(data, block_names), request, response))['blocks']
+        best_member_data = results['best_member_data']
+        best_member_summary = results['best_member_summary']
+        member_issue_type = results['member_issue_type']
         
         # 블럭 리스트 초기화 (향후 여러 블럭 추가 가능)
         blocks = []
@@ -1935,12 +1332,12 @@ async def get_member_data(request: Request): # 수정 불가
         blocks.append(best_member_data)     # 상세 리스트를 나중에
         blocks.append(member_issue_type)    # 이슈 타입 데이터
 
-        return {
+        return fast_json_response({
             "success": True,
             "data": {
                 "blocks": blocks
             }
-        }
+        }, response)
             
     except HTTPException:
         raise
@@ -1948,48 +1345,15 @@ async def get_member_data(request: Request): # 수정 불가
         raise HTTPException(status_code=500, detail=f"인원 데이터 조회 실패: {str(e)}")
 
 @router.post("/get-hw-data")
-async def get_hw_data(request: Request): # 수정 불가
+async def get_hw_data(request: Request, response: Response): # 수정 불가
     """HW 데이터 조회 API"""
     try:
         data = await request.json()
-        start_date = data.get('start_date')
-        end_date = data.get('end_date')
-        site_indexes = data.get('site_indexes', [])
-        sub_site_names = data.get('sub_site_names', [])
-        product_names = data.get('product_names', [])
-
-        # 기존 단일 선택 호환성을 위한 처리
-        if not site_indexes and data.get('site_index') is not None:
-            site_indexes = [data.get('site_index')]
-        if not sub_site_names and data.get('sub_site_name'):
-            sub_site_names = [data.get('sub_site_name')]
-        if not product_names and data.get('product_name'):
-            product_names = [data.get('product_name')]
-
-        if not all([start_date, end_date, site_indexes, sub_site_names, product_names]):
-            raise HTTPException(status_code=400, detail="필수 파라미터가 누락되었습니다: start_date, end_date, site_indexes, sub_site_names, product_names")
-        # 선택된 리스트들 로그 출력
         
-        # 모든 선택된 항목들의 프로젝트 ID 리스트 수집
-        all_project_ids = []
-        
-        for site_index in site_indexes:
-            for sub_site_name in sub_site_names:
-                for product_name in product_names:
-                    # 헬퍼 함수 호출하여 프로젝트 ID 리스트 가져오기
-                    project_ids = get_issue_project_ids(site_index, sub_site_name, product_name)
-                    all_project_ids.extend(project_ids)
-        
-        # 중복 제거
-        all_project_ids = list(set(all_project_ids))
-        
-        # project_ids와 기간을 가지고 이슈 데이터 조회
-        db = DatabaseManager()
-        issues = db.get_issues_by_filter(start_date, end_date, all_project_ids)
-        
-        # HW 데이터 분석
-        hw_equipment_analysis = get_hw_equipment_analysis(issues)
-        hw_overview_summary = get_hw_overview_summary(issues)
+        # HW 데이터 분석 (동일 필터 동시 요청은 계산 1번으로 합침)
+        results = (await get_filtered_blocks(data, ['hw_equipment_analysis', 'hw_overview_summary'], None, request, response))['blocks']
+        hw_equipment_analysis = results['hw_equipment_analysis']
+        hw_overview_summary = results['hw_overview_summary']
         
 
         # 블럭 리스트 초기화
@@ -2013,12 +1377,12 @@ async def get_hw_data(request: Request): # 수정 불가
             }
             blocks.append(hw_summary_block)
 
-        return {
+        return fast_json_response({
             "success": True,
             "data": {
                 "blocks": blocks
             }
-        }
+        }, response)
             
     except HTTPException:
         raise
@@ -2027,48 +1391,15 @@ async def get_hw_data(request: Request): # 수정 불가
 
 
 @router.post("/get-sw-data")
-async def get_sw_data(request: Request): # 수정 불가
+async def get_sw_data(request: Request, response: Response): # 수정 불가
     """SW 데이터 조회 API"""
     try:
         data = await request.json()
-        start_date = data.get('start_date')
-        end_date = data.get('end_date')
-        site_indexes = data.get('site_indexes', [])
-        sub_site_names = data.get('sub_site_names', [])
-        product_names = data.get('product_names', [])
-
-        # 기존 단일 선택 호환성을 위한 처리
-        if not site_indexes and data.get('site_index') is not None:
-            site_indexes = [data.get('site_index')]
-        if not sub_site_names and data.get('sub_site_name'):
-            sub_site_names = [data.get('sub_site_name')]
-        if not product_names and data.get('product_name'):
-            product_names = [data.get('product_name')]
-
-        if not all([start_date, end_date, site_indexes, sub_site_names, product_names]):
-            raise HTTPException(status_code=400, detail="필수 파라미터가 누락되었습니다: start_date, end_date, site_indexes, sub_site_names, product_names")
-        # 선택된 리스트들 로그 출력
-        
-        # 모든 선택된 항목들의 프로젝트 ID 리스트 수집
-        all_project_ids = []
         
-        for site_index in site_indexes:
-            for sub_site_name in sub_site_names:
-                for product_name in product_names:
-                    # 헬퍼 함수 호출하여 프로젝트 ID 리스트 가져오기
-                    project_ids = get_issue_project_ids(site_index, sub_site_name, product_name)
-                    all_project_ids.extend(project_ids)
-        
-        # 중복 제거
-        all_project_ids = list(set(all_project_ids))
-        
-        # project_ids와 기간을 가지고 이슈 데이터 조회
-        db = DatabaseManager()
-        issues = db.get_issues_by_filter(start_date, end_date, all_project_ids)
-        
-        # SW 데이터 분석
-        sw_overview_summary = get_sw_overview_summary(issues)
-        sw_detail_analysis = get_sw_detail_analysis(issues)
+        # SW 데이터 분석 (동일 필터 동시 요청은 계산 1번으로 합침)
+        results = (await get_filtered_blocks(data, ['sw_overview_summary', 'sw_detail_analysis'], None, request, response))['blocks']
+        sw_overview_summary = results['sw_overview_summary']
+        sw_detail_analysis = results['sw_detail_analysis']
         
 
         # 블럭 리스트 초기화
@@ -2092,18 +1423,347 @@ async def get_sw_data(request: Request): # 수정 불가
             }
             blocks.append(sw_summary_block)
 
-        return {
+        return fast_json_response({
             "success": True,
             "data": {
                 "blocks": blocks
             }
-        }
+        }, response)
             
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"SW 데이터 조회 실패: {str(e)}")
 
+def server_timing_header(timings: Dict, cache_hit: bool) -> str:
+    """분석 진단 정보를 Server-Timing 헤더 값으로 변환 (시간은 dur, 건수는 desc, 블럭별 시간은 block-<이름>)
+
+    ETag 응답 본문은 압축 결과가 (ETag, 인코딩) 별로 캐시되므로 요청마다 달라지는 진단 값은 본문 대신 헤더로 전달
+    캐시 적중 시에는 계산을 하지 않았으므로 cache 항목만 기록
+    """
+    metrics = [f'cache;desc="{"hit" if cache_hit else "miss"}"']
+    if cache_hit:
+        return ', '.join(metrics)
+    for name, value in timings.items():
+        if name == 'blocks':
+            metrics += [f'block-{block_name};dur={block_ms}' for block_name, block_ms in value.items()]
+        elif name.endswith('_ms'):
+            metrics.append(f'{name[:-3]};dur={value}')
+        else:
+            metrics.append(f'{name};desc="{value}"')
+    return ', '.join(metrics)
+
+
+@router.post("/get-dashboard-data")
+async def get_dashboard_data(request: Request, response: Response):
+    """이슈 페이지 통합 데이터 조회 API (필터 1번 해석, 일감 1번 조회로 요청한 블럭을 한 번에 계산)
+
+    요청: 기존 분석 API 와 같은 필터 + block_types (예: ["progress_summary", "type_data_list"])
+          + 선택 top_k (순위 블럭 개수), summary (true 면 일감 목록 대신 드릴다운 키)
+    조회/순회 시간, 블럭별 계산 시간, 캐시 적중 여부는 Server-Timing 헤더로 전달
+    (본문은 같은 ETag 면 항상 같은 바이트여야 하므로 요청마다 달라지는 값은 넣지 않음)
+    """
+    try:
+        data = await request.json()
+        block_types = data.get('block_types', [])
+
+        if not block_types or not isinstance(block_types, list):
+            raise HTTPException(status_code=400, detail="필수 파라미터가 누락되었습니다: block_types")
+        unknown_types = [block_type for block_type in block_types if block_type not in BLOCKS]
+        if unknown_types:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 블럭입니다: {unknown_types}")
+        block_types = list(dict.fromkeys(block_types))
+
+        # 순위 블럭(problematic_products 등)은 top_k 개만 계산
+        top_k = data.get('top_k')
+        if top_k is not None and (not isinstance(top_k, int) or top_k <= 0):
+            raise HTTPException(status_code=400, detail="top_k 는 1 이상의 정수여야 합니다")
+        options = get_summary_options(data, block_types)
+        if top_k is not None:
+            for block_type in block_types:
+                if block_type in RANKING_BLOCKS:
+                    options.setdefault(block_type, {})['top_k'] = top_k
+
+        computed = await get_filtered_blocks(data, block_types, options, request, response)
+        response.headers['Server-Timing'] = server_timing_header(computed['timings'], computed['cache_hit'])
+
+        blocks = [{
+            "type": block_type,
+            "data": computed['blocks'][block_type]
+        } for block_type in block_types]
+
+        return fast_json_response({
+            "success": True,
+            "data": {
+                "blocks": blocks
+            }
+        }, response)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"통합 데이터 조회 실패: {str(e)}")
+
+
+@router.post("/get-issue-detail")
+async def get_issue_detail(request: Request, response: Response):
+    """드릴다운 상세 조회 API (요약 응답의 tracker/Product/작업자 셀 일감을 페이지 단위로 조회)
+
+    요청: 요약을 받을 때와 같은 필터 + drill_key + 선택 page (1부터), page_size, fields (redmine_id 는 항상 포함)
+    """
+    try:
+        data = await request.json()
+        issue_filter = normalize_issue_filter(data)
+        fields = normalize_issue_fields(data.get('fields'))
+
+        drill_key = data.get('drill_key')
+        if not drill_key or not isinstance(drill_key, str):
+            raise HTTPException(status_code=400, detail="필수 파라미터가 누락되었습니다: drill_key")
+        try:
+            cell = decode_drill_key(drill_key)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        page = data.get('page', 1)
+        page_size = data.get('page_size', ISSUE_DETAIL_PAGE_SIZE)
+        if not isinstance(page, int) or page < 1:
+            raise HTTPException(status_code=400, detail="page 는 1 이상의 정수여야 합니다")
+        if not isinstance(page_size, int) or not 1 <= page_size <= ISSUE_DETAIL_MAX_PAGE_SIZE:
+            raise HTTPException(status_code=400, detail=f"page_size 는 1 ~ {ISSUE_DETAIL_MAX_PAGE_SIZE} 사이의 정수여야 합니다")
+
+        project_ids = await run_blocking('db', resolve_issue_filter_project_ids, issue_filter)
+        db = DatabaseManager()
+        result = await run_blocking(
+            'db', db.get_issue_cell_page,
+            issue_filter['start_date'], issue_filter['end_date'], project_ids, cell,
+            limit=page_size, offset=(page - 1) * page_size,
+            columns=get_issue_select_columns(fields, 'redmine_id')
+        )
+
+        return fast_json_response({
+            "success": True,
+            "data": {
+                "drill_key": drill_key,
+                "cell": cell,
+                "page": page,
+                "page_size": page_size,
+                "total_count": result['total_count'],
+                "has_next": page * page_size < result['total_count'],
+                "issues": result['issues']
+            }
+        }, response)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"드릴다운 상세 조회 실패: {str(e)}")
+
+
+# 일감 목록 정렬 옵션 → (정렬 컬럼, 내림차순 여부)
+ISSUE_LIST_SORTS = {
+    'updated_desc': ('updated_at', True),
+    'updated_asc': ('updated_at', False),
+    'created_desc': ('created_at', True),
+    'created_asc': ('created_at', False)
+}
+
+
+def encode_issue_cursor(sort: str, issue: Dict, sort_column: str) -> str:
+    """페이지 마지막 일감의 (정렬 값, redmine_id) 를 불투명 커서로 변환"""
+    value = issue.get(sort_column)
+    payload = [sort, value.isoformat(sep=' ') if hasattr(value, 'isoformat') else value, issue.get('redmine_id')]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_issue_cursor(cursor: str, sort: str) -> tuple:
+    """커서를 (정렬 값, redmine_id) 로 되돌림 (형식이 잘못됐거나 정렬이 다르면 400)"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        cursor_sort, value, redmine_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+    except Exception:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다")
+    if cursor_sort != sort:
+        raise HTTPException(status_code=400, detail="커서와 정렬 옵션이 다릅니다")
+    return value, redmine_id
+
+
+@router.post("/get-issue-list")
+async def get_issue_list(request: Request, response: Response):
+    """일감 목록 페이지 조회 API (키셋 페이지: 뒤쪽 페이지도 조회 비용이 같음)
+
+    요청: 분석 API 와 같은 필터 + 선택 sort (updated_desc/updated_asc/created_desc/created_asc),
+          page_size, cursor (이전 응답의 next_cursor), fields (커서에 쓰는 redmine_id 와 정렬 컬럼은 항상 포함)
+    """
+    try:
+        data = await request.json()
+        issue_filter = normalize_issue_filter(data)
+        fields = normalize_issue_fields(data.get('fields'))
+
+        sort = data.get('sort', 'updated_desc')
+        if sort not in ISSUE_LIST_SORTS:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 정렬입니다: {sort} (가능: {list(ISSUE_LIST_SORTS)})")
+        sort_column, descending = ISSUE_LIST_SORTS[sort]
+
+        page_size = data.get('page_size', ISSUE_LIST_PAGE_SIZE)
+        if not isinstance(page_size, int) or not 1 <= page_size <= ISSUE_LIST_MAX_PAGE_SIZE:
+            raise HTTPException(status_code=400, detail=f"page_size 는 1 ~ {ISSUE_LIST_MAX_PAGE_SIZE} 사이의 정수여야 합니다")
+
+        cursor = data.get('cursor')
+        after = decode_issue_cursor(cursor, sort) if cursor else None
+
+        project_ids = await run_blocking('db', resolve_issue_filter_project_ids, issue_filter)
+        db = DatabaseManager()
+        # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+        issues = await run_blocking(
+            'db', db.get_issues_keyset_page,
+            issue_filter['start_date'], issue_filter['end_date'], project_ids,
+            sort_column, descending, after, page_size + 1,
+            columns=get_issue_select_columns(fields, 'redmine_id', sort_column)
+        )
+        has_next = len(issues) > page_size
+        issues = issues[:page_size]
+
+        return fast_json_response({
+            "success": True,
+            "data": {
+                "sort": sort,
+                "page_size": page_size,
+                "has_next": has_next,
+                "next_cursor": encode_issue_cursor(sort, issues[-1], sort_column) if has_next else None,
+                "issues": issues
+            }
+        }, response)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"일감 목록 조회 실패: {str(e)}")
+
+
+# 내보내기 형식 → (Content-Type, 파일 확장자)
+ISSUE_EXPORT_FORMATS = {
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+    'csv': ('text/csv; charset=utf-8', 'csv')
+}
+
+
+def stream_issues_ndjson(batches):
+    """일감 배치를 한 줄에 일감 하나씩 JSON 으로 변환 (배치 단위로 전송)"""
+    for batch in batches:
+        yield b''.join(json_dumps(issue) + b'\n' for issue in batch)
+
+
+def stream_issues_csv(batches, columns):
+    """일감 배치를 CSV 로 변환 (엑셀에서 한글이 깨지지 않도록 BOM + 헤더를 먼저 전송)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    buffer.write('\ufeff')
+    writer.writerow(columns)
+    for batch in batches:
+        for issue in batch:
+            writer.writerow(['' if issue[column] is None else issue[column] for column in columns])
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+
+@router.post("/export-issues")
+async def export_issues(request: Request):
+    """일감 내보내기 API (서버 측 커서로 읽으면서 바로 전송, 행 수와 관계없이 메모리 일정)
+
+    요청: 분석 API 와 같은 필터 + 선택 format (ndjson / csv, 기본 ndjson), fields (CSV 열도 해당 컬럼만)
+    """
+    try:
+        data = await request.json()
+        issue_filter = normalize_issue_filter(data)
+        columns = normalize_issue_fields(data.get('fields')) or list(DatabaseManager.ISSUE_LIST_COLUMNS)
+
+        export_format = data.get('format', 'ndjson')
+        if export_format not in ISSUE_EXPORT_FORMATS:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 형식입니다: {export_format} (가능: {list(ISSUE_EXPORT_FORMATS)})")
+        media_type, extension = ISSUE_EXPORT_FORMATS[export_format]
+
+        project_ids = await run_blocking('db', resolve_issue_filter_project_ids, issue_filter)
+        db = DatabaseManager()
+        batches = db.iter_issues_by_filter(issue_filter['start_date'], issue_filter['end_date'], project_ids, ISSUE_EXPORT_BATCH_SIZE, columns)
+
+        if export_format == 'csv':
+            content = stream_issues_csv(batches, columns)
+        else:
+            content = stream_issues_ndjson(batches)
+
+        period = re.sub(r'[^0-9A-Za-z_-]', '', f"{issue_filter['start_date']}_{issue_filter['end_date']}")
+        filename = f"issues_{period}.{extension}"
+        return StreamingResponse(content, media_type=media_type, headers={
+            "Content-Disposition": f'attachment; filename="{filename}"'
+        })
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"일감 내보내기 실패: {str(e)}")
+
+
+@router.post("/get-site-comparison")
+async def get_site_comparison_data(request: Request):
+    """전체 고객사 비교 데이터 조회 API (site_index별 반복 호출 없이 한 번에)"""
+    try:
+        data = await request.json()
+        start_date = data.get('start_date')
+        end_date = data.get('end_date')
+
+        if not all([start_date, end_date]):
+            raise HTTPException(status_code=400, detail="필수 파라미터가 누락되었습니다: start_date, end_date")
+
+        comparison_data = await run_blocking('db', fetch_site_comparison_data, start_date, end_date)
+        site_comparison = await run_blocking('cpu', get_site_comparison, *comparison_data)
+
+        return {
+            "success": True,
+            "data": {
+                "blocks": [site_comparison]
+            }
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"고객사 비교 데이터 조회 실패: {str(e)}")
+
+@router.post("/get-problematic-sites")
+async def get_problematic_sites_data(request: Request):
+    """고객사 안에서 문제가 많은 Sub Site 순위 조회 API (top_k 가 없으면 전체)"""
+    try:
+        data = await request.json()
+        site_index = data.get('site_index')
+        start_date = data.get('start_date')
+        end_date = data.get('end_date')
+        product_name = data.get('product_name', 'ALL')
+        top_k = data.get('top_k')
+
+        if site_index is None or not all([start_date, end_date]):
+            raise HTTPException(status_code=400, detail="필수 파라미터가 누락되었습니다: site_index, start_date, end_date")
+        if not isinstance(site_index, int) or not 0 <= site_index < len(CUSTOMER_PROJECT_IDS):
+            raise HTTPException(status_code=400, detail=f"잘못된 site_index 입니다: {site_index}")
+
+        problematic_sites = await run_blocking('db', get_most_problematic_sites, site_index, start_date, end_date, product_name, top_k)
+
+        return {
+            "success": True,
+            "data": {
+                "blocks": [problematic_sites]
+            }
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Site 순위 조회 실패: {str(e)}")
+
 @router.put("/update-progress-status")
 async def update_progress_status(request: Request): # 수정 불가
     """이슈 진행 상태 업데이트 API"""
@@ -2119,7 +1779,7 @@ async def update_progress_status(request: Request): # 수정 불가
 
         # DB 매니저를 통한 API 키 조회
         db = DatabaseManager()
-        user_data = db.get_user_api_key(user_id)
+        user_data = await run_blocking('db', db.get_user_api_key, user_id)
         
         if not user_data.get("success"):
             raise HTTPException(status_code=400, detail="API 키가 등록되지 않았습니다. Setting 페이지에서 API 키를 등록해주세요.")
@@ -2129,14 +1789,14 @@ async def update_progress_status(request: Request): # 수정 불가
             raise HTTPException(status_code=400, detail="API 키를 가져올 수 없습니다.")
 
         # 1. 레드마인 API 호출해서 실제 이슈 상태 변경 시도
-        redmine_result = update_issue_status(redmine_id, old_status_name, new_status_name, api_key)
+        redmine_result = await run_blocking('redmine', update_issue_status, redmine_id, old_status_name, new_status_name, api_key)
         
         if not redmine_result.get("success"):
             raise HTTPException(status_code=400, detail=f"레드마인 업데이트 실패: {redmine_result.get('message')}")
         
         # 2. 레드마인에서 실제 상태 재확인 (권한 문제 등으로 실제 변경되지 않았을 수 있음)
         from .redmine_service import fetch_redmine_issue
-        updated_issue = fetch_redmine_issue(redmine_id)
+        updated_issue = await run_blocking('redmine', fetch_redmine_issue, redmine_id)
         
         if not updated_issue:
             raise HTTPException(status_code=400, detail="이슈 정보를 가져올 수 없습니다.")
@@ -2148,10 +1808,17 @@ async def update_progress_status(request: Request): # 수정 불가
             raise HTTPException(status_code=400, detail=f"권한이 없어 상태 변경이 되지 않았습니다. 현재 상태: {actual_status_name}")
         
         # 4. 실제 상태가 변경되었을 때만 로컬 DB 업데이트
-        db_result = db.set_update_issue_statusname(redmine_id, old_status_name, new_status_name)
+        db_result = await run_blocking('db', db.set_update_issue_statusname, redmine_id, old_status_name, new_status_name)
         
         if not db_result.get("success"):
             raise HTTPException(status_code=400, detail=db_result.get("message", "DB 업데이트 실패"))
+
+        # 5. 열린 대시보드에 상태 변경 이벤트 전달
+        changed = db_result.get("data", {})
+        issue_event_broker.publish(ISSUE_STATUS_TOPIC, make_status_event(
+            redmine_id, old_status_name, new_status_name,
+            changed.get("tracker_name"), changed.get("product"), changed.get("project_id")
+        ))
         
         return {
             "success": True,
@@ -2168,3 +1835,157 @@ async def update_progress_status(request: Request): # 수정 불가
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"이슈 상태 업데이트 실패: {str(e)}")
 
+
+def resolve_status_ids(db: DatabaseManager, status_names: List[str]) -> Dict[str, Optional[int]]:
+    """상태명 → 상태 ID (상태명마다 1번만 조회, 없으면 None)"""
+    status_ids = {}
+    for status_name in status_names:
+        status_result = db.get_status_id_by_name(status_name)
+        status_ids[status_name] = status_result["data"]["status_id"] if status_result.get("success") else None
+    return status_ids
+
+
+def normalize_status_moves(moves) -> List[Dict]:
+    """일괄 상태 변경 요청의 moves 검증 (redmine_id 중복 불가, 최대 ISSUE_STATUS_BATCH_MAX_ITEMS 건)"""
+    if not isinstance(moves, list) or not moves:
+        raise HTTPException(status_code=400, detail="moves 는 (redmine_id, old_status_name, new_status_name) 목록이어야 합니다")
+    if len(moves) > ISSUE_STATUS_BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {ISSUE_STATUS_BATCH_MAX_ITEMS}건까지 변경할 수 있습니다")
+
+    normalized = []
+    for move in moves:
+        if not isinstance(move, dict) or not all([move.get('redmine_id'), move.get('old_status_name'), move.get('new_status_name')]):
+            raise HTTPException(status_code=400, detail="필수 파라미터가 누락되었습니다: redmine_id, old_status_name, new_status_name")
+        # JSON true/false 는 bool(int 하위 타입)로 들어오므로 따로 거부
+        if isinstance(move['redmine_id'], bool) or not isinstance(move['redmine_id'], int):
+            raise HTTPException(status_code=400, detail=f"redmine_id 는 정수여야 합니다: {move['redmine_id']}")
+        normalized.append({
+            'redmine_id': move['redmine_id'],
+            'old_status_name': move['old_status_name'],
+            'new_status_name': move['new_status_name']
+        })
+
+    redmine_id_counts = Counter(move['redmine_id'] for move in normalized)
+    duplicated = sorted(redmine_id for redmine_id, count in redmine_id_counts.items() if count > 1)
+    if duplicated:
+        raise HTTPException(status_code=400, detail=f"같은 이슈를 여러 번 변경할 수 없습니다: {duplicated}")
+    return normalized
+
+
+@router.put("/update-progress-status-batch")
+async def update_progress_status_batch(request: Request):
+    """이슈 진행 상태 일괄 업데이트 API (보드에서 여러 카드를 한 번에 옮길 때)
+
+    요청: user_id + moves: [{redmine_id, old_status_name, new_status_name}, ...]
+    - API 키 조회와 상태명 → ID 조회는 요청당 1번
+    - Redmine 확인/변경/재확인은 이슈별로 동시에 실행 (요청당 ISSUE_STATUS_BATCH_CONCURRENCY 건까지)
+    - Redmine 변경이 확인된 이슈만 로컬 DB 에 한 트랜잭션으로 반영하고 상태 변경 이벤트 발행
+    응답: 요청 순서대로 이슈별 {redmine_id, success, message} (일부만 실패해도 200, 전체 성공 여부는 success)
+    """
+    try:
+        data = await request.json()
+        user_id = data.get('user_id')
+        if not user_id:
+            raise HTTPException(status_code=400, detail="필수 파라미터가 누락되었습니다: user_id")
+        moves = normalize_status_moves(data.get('moves'))
+
+        db = DatabaseManager()
+        user_data = await run_blocking('db', db.get_user_api_key, user_id)
+        if not user_data.get("success"):
+            raise HTTPException(status_code=400, detail="API 키가 등록되지 않았습니다. Setting 페이지에서 API 키를 등록해주세요.")
+        api_key = user_data.get("data", {}).get("api_key")
+        if not api_key:
+            raise HTTPException(status_code=400, detail="API 키를 가져올 수 없습니다.")
+
+        status_names = list(dict.fromkeys(move['new_status_name'] for move in moves))
+        status_ids = await run_blocking('db', resolve_status_ids, db, status_names)
+
+        # 1. 레드마인 상태 변경 (이슈별 동시 실행, 동시 호출 수 제한)
+        semaphore = asyncio.Semaphore(ISSUE_STATUS_BATCH_CONCURRENCY)
+        session = create_redmine_session(ISSUE_STATUS_BATCH_CONCURRENCY)
+
+        async def apply_move(move: Dict) -> Dict:
+            new_status_id = status_ids.get(move['new_status_name'])
+            if new_status_id is None:
+                return {"success": False, "message": f"상태명 '{move['new_status_name']}'에 해당하는 ID를 찾을 수 없습니다."}
+            async with semaphore:
+                return await run_blocking(
+                    'redmine', apply_issue_status_change, session,
+                    move['redmine_id'], move['old_status_name'], move['new_status_name'], new_status_id, api_key
+                )
+
+        try:
+            redmine_results = await asyncio.gather(*(apply_move(move) for move in moves))
+        finally:
+            session.close()
+
+        # 2. 레드마인 변경이 확인된 이슈만 로컬 DB 에 한 트랜잭션으로 반영
+        applied_moves = [move for move, result in zip(moves, redmine_results) if result.get("success")]
+        db_result = await run_blocking('db', db.set_update_issue_statusnames, applied_moves)
+
+        results = []
+        for move, redmine_result in zip(moves, redmine_results):
+            redmine_id = move['redmine_id']
+            if not redmine_result.get("success"):
+                results.append({"redmine_id": redmine_id, "success": False, "message": f"레드마인 업데이트 실패: {redmine_result.get('message')}"})
+                continue
+
+            item_result = db_result.get("results", {}).get(redmine_id)
+            if item_result is None:
+                results.append({"redmine_id": redmine_id, "success": False, "message": db_result.get("message", "DB 업데이트 실패")})
+                continue
+
+            results.append({"redmine_id": redmine_id, "success": item_result["success"], "message": item_result["message"]})
+            if item_result["success"]:
+                # 3. 열린 대시보드에 상태 변경 이벤트 전달
+                changed = item_result["data"]
+                issue_event_broker.publish(ISSUE_STATUS_TOPIC, make_status_event(
+                    redmine_id, move['old_status_name'], move['new_status_name'],
+                    changed.get("tracker_name"), changed.get("product"), changed.get("project_id")
+                ))
+
+        succeeded = sum(1 for result in results if result["success"])
+        return {
+            "success": succeeded == len(results),
+            "message": f"{succeeded}/{len(results)}건 상태 변경 완료",
+            "data": {
+                "total": len(results),
+                "succeeded": succeeded,
+                "failed": len(results) - succeeded,
+                "results": results
+            }
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"이슈 상태 일괄 업데이트 실패: {str(e)}")
+
+
+@router.websocket("/ws/status-events")
+async def issue_status_events(websocket: WebSocket):
+    """일감 상태 변경 이벤트 WebSocket (서버 → 클라이언트 단방향, 이벤트 1개당 JSON 텍스트 메시지 1개)
+
+    이벤트: {'type': 'issue_status_changed', redmine_id, old_status, new_status, tracker_name, product, project_id}
+    {'type': 'resync'} 를 받으면 놓친 이벤트가 있으므로 전체 데이터를 다시 조회
+    """
+    await websocket.accept()
+    async with issue_event_broker.subscribe(ISSUE_STATUS_TOPIC) as queue:
+        # 클라이언트 메시지는 사용하지 않고 연결 종료 감지에만 사용
+        receiver = asyncio.ensure_future(websocket.receive())
+        getter = asyncio.ensure_future(queue.get())
+        try:
+            while True:
+                done, _ = await asyncio.wait({receiver, getter}, return_when=asyncio.FIRST_COMPLETED)
+                if receiver in done:
+                    if receiver.result()['type'] == 'websocket.disconnect':
+                        break
+                    receiver = asyncio.ensure_future(websocket.receive())
+                if getter in done:
+                    await websocket.send_text(json_dumps(getter.result()).decode('utf-8'))
+                    getter = asyncio.ensure_future(queue.get())
+        except WebSocketDisconnect:
+            pass
+        finally:
+            receiver.cancel()
+            getter.cancel()
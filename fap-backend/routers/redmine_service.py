@@ -17,25 +17,38 @@ API 엔드포인트:
 - fetch_redmine_issue(): 특정 이슈 실시간 조회
 - get_parent_issue_id(): 부모 이슈 ID 실시간 조회
 - get_project_name(): 프로젝트 이름 실시간 조회
+- fetch_redmine_project_cached(): 프로젝트 정보 조회 (TTL 캐시, 동시 요청 1회 호출)
+- resolve_site_location(): 로컬 계층 기준 location/site 조회 (없을 때만 레드마인 조회)
 - update_issue_status(): 이슈 상태 실시간 업데이트
+- create_redmine_session() / apply_issue_status_change(): 일괄 상태 변경용 (연결 재사용, 상태 ID 미리 조회)
 
 기술 스택:
 - FastAPI
 - Redmine API
 - 실시간 데이터 처리
+- Redmine 호출은 전용 스레드 풀에서 실행 (blocking_pools.py, 이벤트 루프를 막지 않음)
 """
 
 # routers/redmine_service.py
 from fastapi import APIRouter
 import requests
 from fastapi import HTTPException
-from config import REDMINE_URL, API_KEY as REDMINE_API_KEY
+from config import REDMINE_URL, API_KEY as REDMINE_API_KEY, REDMINE_PROJECT_CACHE_TTL_SECONDS
 from fastapi import Request
 from fastapi.responses import FileResponse
+from blocking_pools import run_blocking
+from project_hierarchy import get_project_hierarchy
+import asyncio
 import shutil
 import os
+import threading
+import time
+from concurrent.futures import Future
 
 # 전역 캐시 딕셔너리 선언 (파일 상단에 위치해야 함)
+_project_cache = {}  # project_id -> (만료 시각, 프로젝트 정보)
+_project_cache_lock = threading.Lock()
+_project_fetches = {}  # project_id -> 조회 중 Future (같은 프로젝트 동시 요청은 1번만 호출하고 결과 공유)
 
 router = APIRouter(prefix="/api/projects", tags=["projects"])
 
@@ -79,6 +92,92 @@ def get_project_name(project_id: int):  # 수정 불가
         return project.get('name', '')
     return None
 
+def fetch_redmine_project_cached(project_id: int):
+    """
+    Redmine 프로젝트 정보를 TTL 캐시로 조회하는 헬퍼 함수
+    같은 프로젝트를 동시에 요청하면 첫 요청만 Redmine을 호출하고 나머지는 결과를 공유
+    """
+    with _project_cache_lock:
+        cached = _project_cache.get(project_id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        fetch = _project_fetches.get(project_id)
+        is_leader = fetch is None
+        if is_leader:
+            fetch = _project_fetches[project_id] = Future()
+
+    if not is_leader:
+        # 먼저 조회를 시작한 요청의 결과를 함께 기다림
+        return fetch.result()
+
+    project = None
+    url = f"{REDMINE_URL}/projects/{project_id}.json"
+    headers = {"X-Redmine-API-Key": REDMINE_API_KEY}
+    try:
+        resp = requests.get(url, headers=headers, timeout=10)
+        if resp.status_code == 200:
+            project = resp.json().get("project", {})
+    except requests.exceptions.RequestException:
+        pass
+    finally:
+        # 캐시를 채운 뒤 진행 목록에서 제거 (기다리던 요청은 Future 를 이미 잡고 있으므로 결과를 그대로 받음)
+        with _project_cache_lock:
+            if project is not None:
+                _project_cache[project_id] = (time.monotonic() + REDMINE_PROJECT_CACHE_TTL_SECONDS, project)
+            _project_fetches.pop(project_id, None)
+        fetch.set_result(project)
+    return project
+
+def _lookup_project(project_id: int, hierarchy):
+    """
+    프로젝트 이름/부모 정보를 로컬 계층에서 찾고, 없을 때만 Redmine(캐시)에서 조회
+    반환: {'name', 'parent_id', 'parent_name'} 또는 None
+    """
+    node = hierarchy.get(project_id)
+    if node:
+        parent = hierarchy.get(node['parent_id']) if node['parent_id'] else None
+        return {
+            'name': node['name'],
+            'parent_id': node['parent_id'],
+            'parent_name': parent['name'] if parent else None
+        }
+
+    project = fetch_redmine_project_cached(project_id)
+    if project is None:
+        return None
+    parent = project.get('parent') or {}
+    return {
+        'name': project.get('name', ''),
+        'parent_id': parent.get('id'),
+        'parent_name': parent.get('name')
+    }
+
+def resolve_site_location(project_id: int):
+    """
+    project_id의 1단계 부모(location)와 2단계 부모(site) 이름을 반환하는 헬퍼 함수
+    projects 테이블 계층을 우선 사용하므로 보통 Redmine 호출이 없음
+    """
+    hierarchy = get_project_hierarchy()
+
+    project = _lookup_project(project_id, hierarchy)
+    parent1 = project.get('parent_id') if project else None
+    if not parent1:
+        return None, None
+
+    location_project = _lookup_project(parent1, hierarchy)
+    if not location_project:
+        return None, project.get('parent_name')
+    location = location_project['name']
+
+    parent2 = location_project.get('parent_id')
+    if not parent2:
+        return None, location
+    site = location_project.get('parent_name')
+    if site is None:
+        site_project = _lookup_project(parent2, hierarchy)
+        site = site_project['name'] if site_project else None
+    return site, location
+
 # ===== Redmine 관련 메서드들 FAP to PMS =====
 
 def update_issue_status(issue_id: int, old_status_name: str, new_status_name: str, api_key: str) -> dict: # 수정 불가
@@ -172,6 +271,54 @@ def update_issue_status(issue_id: int, old_status_name: str, new_status_name: st
             "message": f"이슈 상태 업데이트 중 오류 발생: {str(e)}"
         }
 
+def create_redmine_session(pool_size: int) -> requests.Session:
+    """일괄 호출용 Session (동시 호출 수만큼 연결을 유지해서 요청마다 TLS 연결을 새로 맺지 않음)"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def apply_issue_status_change(session: requests.Session, issue_id: int, old_status_name: str, new_status_name: str,
+                              new_status_id: int, api_key: str) -> dict:
+    """
+    update_issue_status 와 같은 순서(현재 상태 확인 → 변경 → 서버 키로 재확인)로 이슈 1건 상태 변경
+    상태 ID 는 호출하는 쪽에서 미리 조회해서 전달 (일괄 변경 시 상태명마다 1번만 조회)
+    """
+    url = f"{REDMINE_URL}/issues/{issue_id}.json"
+    try:
+        # 1. 사용자 키로 현재 상태 확인
+        response = session.get(url, headers={"X-Redmine-API-Key": api_key}, timeout=10)
+        if response.status_code != 200:
+            return {"success": False, "message": f"이슈 #{issue_id} 정보를 가져올 수 없습니다. (상태 코드: {response.status_code})"}
+
+        current_status_name = response.json().get("issue", {}).get("status", {}).get("name", "")
+        if current_status_name != old_status_name:
+            return {"success": False, "message": f"이슈 #{issue_id}의 현재 상태가 일치하지 않습니다. 현재: {current_status_name}, 예상: {old_status_name}"}
+
+        # 2. 사용자 키로 상태 변경
+        update_response = session.put(
+            url,
+            headers={"X-Redmine-API-Key": api_key, "Content-Type": "application/json"},
+            json={"issue": {"status_id": new_status_id}},
+            timeout=10
+        )
+        if update_response.status_code != 204:
+            return {"success": False, "message": "권한이 없습니다."}
+
+        # 3. 실제로 변경되었는지 서버 키로 재확인 (권한 문제 등으로 변경되지 않았을 수 있음)
+        verify_response = session.get(url, headers={"X-Redmine-API-Key": REDMINE_API_KEY}, timeout=10)
+        if verify_response.status_code != 200:
+            return {"success": False, "message": "이슈 정보를 가져올 수 없습니다."}
+        actual_status_name = verify_response.json().get("issue", {}).get("status", {}).get("name", "")
+        if actual_status_name != new_status_name:
+            return {"success": False, "message": f"권한이 없어 상태 변경이 되지 않았습니다. 현재 상태: {actual_status_name}"}
+
+        return {"success": True, "message": f"이슈 #{issue_id} 레드마인 상태 변경 완료: {old_status_name} → {new_status_name}"}
+
+    except requests.exceptions.RequestException as e:
+        return {"success": False, "message": f"Redmine API 연결 오류: {str(e)}"}
+
 # ===== Router API AE Make Report 관련 =====
 @router.post('/find-report')
 async def find_report(request: Request):  # 수정 불가
@@ -181,7 +328,7 @@ async def find_report(request: Request):  # 수정 불가
     data = await request.json() if request.method == 'POST' else request.query_params
     issue_id = int(data.get('issue_id', 0))
     if issue_id:
-        issue = fetch_redmine_issue(issue_id)
+        issue = await run_blocking('redmine', fetch_redmine_issue, issue_id)
         if issue:
             return {"issues": [issue]}
         else:
@@ -193,20 +340,18 @@ async def find_report(request: Request):  # 수정 불가
 async def find_five_report(request: Request):  # 수정 불가
     """
     Find Five Report: author_name을 받아 offset을 사용해 3개가 찰 때까지 100개씩 최대 5번(총 500개) Redmine에서 이슈를 받아오고, 작성자가 일치하는 이슈만 detailed_issues에 추가하여 3개가 되면 리턴.
-    병렬처리로 성능 개선.
+    병렬처리로 성능 개선 (상세 조회는 Redmine 스레드 풀에서 동시 실행, 동시 호출 수는 풀 크기로 제한).
     """
     data = await request.json() if request.method == 'POST' else request.query_params
     author_name = data.get('author_name', None)
     if not author_name:
         return {"issues": []}
-    import requests
-    from concurrent.futures import ThreadPoolExecutor, as_completed
     detailed_issues = []
     offset = 0
     while len(detailed_issues) < 3 and offset < 500:
         url = f"{REDMINE_URL}/issues.json?limit=100&offset={offset}&sort=id:desc"
         headers = {"X-Redmine-API-Key": REDMINE_API_KEY}
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = await run_blocking('redmine', requests.get, url, headers=headers, timeout=10)
         if resp.status_code != 200:
             break
         issues = resp.json().get("issues", [])
@@ -215,15 +360,10 @@ async def find_five_report(request: Request):  # 수정 불가
         # 작성자가 일치하는 이슈들만 필터링
         matching_issues = [i for i in issues if i.get('author', {}).get('name') == author_name]
         if matching_issues:
-            # 병렬로 상세 정보 가져오기
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                future_to_issue = {executor.submit(fetch_redmine_issue, issue['id']): issue for issue in matching_issues}
-                for future in as_completed(future_to_issue):
-                    detail = future.result()
-                    if detail:
-                        detailed_issues.append(detail)
-                        if len(detailed_issues) == 3:
-                            break
+            # 병렬로 상세 정보 가져오기 (최신 일감 순서 유지)
+            details = await asyncio.gather(*(run_blocking('redmine', fetch_redmine_issue, issue['id']) for issue in matching_issues))
+            detailed_issues.extend(detail for detail in details if detail)
+            detailed_issues = detailed_issues[:3]
         offset += 100
     return {"issues": detailed_issues}
 
@@ -236,10 +376,7 @@ async def get_site(request: Request):  # 수정 불가
     project_id = int(data.get('project_id', 0))
     if not project_id:
         return {"site": None, "location": None}
-    parent1 = get_parent_issue_id(project_id)
-    location = get_project_name(parent1) if parent1 else None
-    parent2 = get_parent_issue_id(parent1) if parent1 else None
-    site = get_project_name(parent2) if parent2 else None
+    site, location = await run_blocking('redmine', resolve_site_location, project_id)
     return {"site": site, "location": location}
 
 # ===== 미사용 TEST 코드 =====
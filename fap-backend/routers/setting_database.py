@@ -24,6 +24,8 @@ API 엔드포인트:
 from fastapi import APIRouter, HTTPException, Request, Query
 from typing import Dict
 from db_manager import DatabaseManager
+from project_hierarchy import refresh_project_hierarchy
+from blocking_pools import run_blocking
 
 router = APIRouter(prefix="/api/settings", tags=["settings"])
 
@@ -39,7 +41,7 @@ async def save_user_api_key(request: Request): # 수정 불가
 
         # DB 매니저를 통한 API 키 저장
         db = DatabaseManager()
-        result = db.save_user_api_key(api_key)
+        result = await run_blocking('db', db.save_user_api_key, api_key)
         
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("message", "API 키 저장 실패"))
@@ -64,7 +66,7 @@ async def check_user_api_key(login: str): # 수정 불가
 
         # DB 매니저를 통한 API 키 조회
         db = DatabaseManager()
-        result = db.get_user_api_key(login)
+        result = await run_blocking('db', db.get_user_api_key, login)
         
         return {
             "success": result.get("success", False),
@@ -83,7 +85,7 @@ async def sync_issue_statuses(): # 수정 불가
     try:
         # DB 매니저를 통한 이슈 상태 동기화
         db = DatabaseManager()
-        result = db.sync_issue_status()
+        result = await run_blocking('redmine', db.sync_issue_status)
         
         return {
             "success": result.get("success", False),
@@ -100,7 +102,7 @@ async def sync_issues(limit: int = Query(100, ge=1, le=10000, description="동
     try:
         db = DatabaseManager()
         # result = db.sync_recent_issues(limit)  # 기존 함수 주석 처리
-        result = db.sync_recent_issues_full_data(limit)  # 새로운 함수로 테스트
+        result = await run_blocking('redmine', db.sync_recent_issues_full_data, limit)  # 새로운 함수로 테스트
         
         if result['success']:
             return {
@@ -125,9 +127,10 @@ async def sync_projects(limit: int = Query(1000, ge=1, le=1000, description="동
     """레드마인에서 프로젝트 동기화 (빠른 동기화)"""
     try:
         db = DatabaseManager()
-        result = db.sync_projects_fast(limit)  # 빠른 동기화 함수 사용
+        result = await run_blocking('redmine', db.sync_projects_fast, limit)  # 빠른 동기화 함수 사용
         
         if result['success']:
+            await run_blocking('db', refresh_project_hierarchy)
             return {
                 "success": True,
                 "message": result['message'],
@@ -150,7 +153,7 @@ async def sync_roadmap_data():  # 수정 불가
     """레드맵 데이터 동기화"""
     try:
         db = DatabaseManager()
-        result = db.sync_roadmap_data()
+        result = await run_blocking('redmine', db.sync_roadmap_data)
         
         if result['success']:
             return {
@@ -0,0 +1,97 @@
+"""
+FAP 2.0 - 동일 요청 합치기 (Single-flight) (백엔드)
+
+주요 기능:
+- 같은 키(정규화된 필터)의 요청이 동시에 들어오면 계산은 한 번만 실행하고 나머지는 결과를 함께 기다림
+- 동기 함수는 작업 종류별 스레드 풀에서 실행 (동기 DB 호출이 이벤트 루프를 막지 않도록, blocking_pools.py)
+- async 함수는 이벤트 루프에서 그대로 실행 (단계별로 다른 스레드 풀을 쓰는 계산, 예: 조회는 db / 계산은 cpu)
+- 먼저 요청한 클라이언트가 연결을 끊어도 계산은 끝까지 진행되어 기다리는 요청에 전달
+- 실행/합류 횟수 지표 제공 (/api/metrics)
+
+사용 예:
+    issue_flight = create_single_flight("issue_analytics", category="cpu")
+    result = await issue_flight.run(key, compute_function, arg1, arg2)
+    result = await issue_flight.run(key, async_compute_function, arg1)  # async 함수는 category 무시
+"""
+
+import asyncio
+import threading
+from typing import Any, Callable, Dict, Hashable, List
+
+from blocking_pools import run_blocking
+
+
+class SingleFlight:
+    """키별로 진행 중인 계산을 하나만 유지하는 요청 합치기 그룹"""
+
+    def __init__(self, name: str, category: str = 'db'):
+        self.name = name
+        self.category = category
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    async def run(self, key: Hashable, func: Callable, *args) -> Any:
+        """key 로 진행 중인 계산이 있으면 그 결과를 기다리고, 없으면 func(*args)를 category 스레드 풀에서 실행
+
+        func 가 async 함수면 스레드 풀을 거치지 않고 코루틴을 그대로 실행 (안에서 run_blocking 으로 단계별 풀 지정)
+        """
+        task = self._in_flight.get(key)
+
+        with self._stats_lock:
+            self.requests += 1
+            if task is not None:
+                self.coalesced += 1
+            else:
+                self.executions += 1
+
+        if task is None:
+            if asyncio.iscoroutinefunction(func):
+                task = asyncio.ensure_future(func(*args))
+            else:
+                task = asyncio.ensure_future(run_blocking(self.category, func, *args))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done, key=key: self._finish(key, done))
+
+        # 요청 하나가 취소되어도 공유 계산은 취소되지 않도록 shield
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Future):
+        """계산 종료 시 진행 목록에서 제거 (예외는 기다리던 요청들이 각각 받음)"""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled() and task.exception() is not None:
+            with self._stats_lock:
+                self.errors += 1
+
+    def get_metrics(self) -> Dict:
+        """실행/합류 횟수 지표"""
+        with self._stats_lock:
+            requests = self.requests
+            return {
+                'name': self.name,
+                'requests': requests,
+                'executions': self.executions,
+                'coalesced': self.coalesced,
+                'errors': self.errors,
+                'in_flight': len(self._in_flight),
+                'coalesce_ratio': round(self.coalesced / requests, 3) if requests else 0
+            }
+
+
+_flight_groups: List[SingleFlight] = []
+
+
+def create_single_flight(name: str, category: str = 'db') -> SingleFlight:
+    """지표 조회 대상에 등록된 SingleFlight 생성 (category 는 동기 계산을 실행할 스레드 풀 종류)"""
+    flight = SingleFlight(name, category)
+    _flight_groups.append(flight)
+    return flight
+
+
+def get_single_flight_metrics() -> List[Dict]:
+    """등록된 모든 SingleFlight 그룹의 지표"""
+    return [flight.get_metrics() for flight in _flight_groups]
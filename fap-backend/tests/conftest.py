@@ -0,0 +1,131 @@
+"""
+FAP 2.0 - 테스트 공용 설정 (백엔드)
+
+- fap-backend 폴더를 import 경로에 추가 (tests/ 에서 `import db_manager` 등 사용)
+- MariaDB 없이 DatabaseManager 메서드를 확인하는 가짜 연결/커서
+  - 실행된 SQL 과 인자를 순서대로 기록
+  - responder(sql, params) 가 SELECT 결과 행을 돌려주고, 예외를 던지면 해당 쿼리 실패로 처리
+- 실제 SQL 을 실행해 봐야 하는 경우 SQLite 메모리 DB 의 issues 테이블로 연결하는 DatabaseManager
+"""
+
+import os
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db_manager import DatabaseManager  # noqa: E402
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self._rows = []
+
+    def execute(self, sql, params=None):
+        sql = ' '.join(sql.split())
+        self.connection.statements.append((sql, params))
+        rows = self.connection.responder(sql, params)
+        self._rows = list(rows or [])
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+
+class FakeConnection:
+    def __init__(self, responder):
+        self.responder = responder
+        self.statements = []
+        self.committed = False
+        self.rolled_back = False
+        self.closed = False
+
+    def cursor(self, *args):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    """get_connection 이 FakeConnection 을 돌려주는 DatabaseManager 생성기
+
+    사용 예: db, connections = fake_db(responder)
+    """
+    def make(responder=lambda sql, params: []):
+        connections = []
+
+        def get_connection():
+            connection = FakeConnection(responder)
+            connections.append(connection)
+            return connection
+
+        db = DatabaseManager()
+        monkeypatch.setattr(db, 'get_connection', get_connection)
+        return db, connections
+
+    return make
+
+
+class SQLiteConnection:
+    """PyMySQL 형식(%s) 쿼리를 SQLite 로 실행하는 연결"""
+
+    def __init__(self, connection, statements):
+        self.connection = connection
+        self.statements = statements
+
+    def cursor(self, *args):
+        return SQLiteCursor(self.connection.cursor(), self.statements)
+
+    def close(self):
+        pass
+
+
+class SQLiteCursor:
+    def __init__(self, cursor, statements):
+        self._cursor = cursor
+        self.statements = statements
+
+    def execute(self, sql, params=None):
+        self.statements.append(' '.join(sql.split()))
+        self._cursor.execute(sql.replace('%s', '?'), params or [])
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+
+@pytest.fixture
+def sqlite_db(monkeypatch):
+    """issues 테이블(ISSUE_LIST_COLUMNS)에 rows 를 넣은 SQLite 메모리 DB 에 연결하는 DatabaseManager 생성기
+
+    사용 예: db = sqlite_db([{'redmine_id': 1, ...}]) (실행한 SQL 은 db.statements 에 기록)
+    """
+    def make(rows):
+        connection = sqlite3.connect(':memory:')
+        connection.execute(f"CREATE TABLE issues ({', '.join(DatabaseManager.ISSUE_LIST_COLUMNS)})")
+        for row in rows:
+            columns = list(row)
+            connection.execute(
+                f"INSERT INTO issues ({', '.join(columns)}) VALUES ({', '.join(['?'] * len(columns))})",
+                [row[column] for column in columns]
+            )
+
+        db = DatabaseManager()
+        db.statements = []
+        monkeypatch.setattr(db, 'get_connection', lambda: SQLiteConnection(connection, db.statements))
+        return db
+
+    return make
@@ -0,0 +1,83 @@
+"""통합 분석 API 응답 본문이 같은 ETag 에서 항상 같은 바이트인지 확인 (진단 값은 Server-Timing 헤더)"""
+
+import datetime
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+import project_hierarchy
+import routers.issue_database as issue_database
+from db_manager import DatabaseManager
+
+
+def make_issues(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    started_at = datetime.datetime(2025, 1, 1, 9, 0)
+    return [{
+        'redmine_id': n,
+        'project_id': 1,
+        'project_name': 'Product A #01',
+        'tracker_name': rng.choice(['[AE][이슈] HW Part', '[AE][이슈] SW Part', '[AE][이슈] AE Part']),
+        'status_name': rng.choice(['신규', '진행', '완료']),
+        'is_closed': rng.choice([0, 1]),
+        'author_name': f"작업자 {rng.randint(0, 5)}",
+        'product': rng.choice(['HW', 'SW', None]),
+        'subject': f"이슈 {n}",
+        'description': '설명',
+        'created_at': started_at + datetime.timedelta(hours=n),
+        'updated_at': started_at + datetime.timedelta(hours=n + 1)
+    } for n in range(count)]
+
+
+class AnalyticsDB:
+    ISSUE_LIST_COLUMNS = DatabaseManager.ISSUE_LIST_COLUMNS
+    issues = make_issues(300)
+
+    def get_sync_generation(self, scope):
+        return 1
+
+    def get_all_projects(self):
+        return [{'redmine_project_id': 1, 'project_name': 'Product A #01', 'parent_id': None, 'children_ids': [], 'level': 4, 'raw_data': {}}]
+
+    def get_issue_rollup_counts(self, *args):
+        return None
+
+    def get_issue_group_counts(self, start_date, end_date, project_ids, group_columns):
+        counts = {}
+        for issue in self.issues:
+            key = tuple(issue[column] for column in group_columns)
+            counts[key] = counts.get(key, 0) + 1
+        return [dict(zip(group_columns, key), count=count) for key, count in counts.items()]
+
+    def get_issue_columns_by_filter(self, start_date, end_date, project_ids, columns):
+        return [{column: issue[column] for column in columns} for issue in self.issues]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(issue_database, 'DatabaseManager', AnalyticsDB)
+    monkeypatch.setattr(issue_database, 'get_issue_project_ids', lambda *args: [1])
+    monkeypatch.setattr(project_hierarchy, 'DatabaseManager', AnalyticsDB)
+    monkeypatch.setattr(project_hierarchy, '_hierarchy_cache', None)
+    monkeypatch.setattr(project_hierarchy, 'save_hierarchy_snapshot', lambda hierarchy: True)
+    issue_database.issue_analytics_cache.clear()
+    return TestClient(main.app)
+
+
+def test_same_etag_same_body(client):
+    body = {'start_date': '2025-01-01', 'end_date': '2025-03-01', 'site_index': 0, 'sub_site_name': 'ALL', 'product_name': 'ALL',
+            'block_types': ['progress_summary', 'type_data_list']}
+    first = client.post('/api/issues/get-dashboard-data', json=body, headers={'Accept-Encoding': 'gzip'})
+    second = client.post('/api/issues/get-dashboard-data', json=body, headers={'Accept-Encoding': 'gzip'})
+
+    assert first.status_code == second.status_code == 200
+    assert first.headers['etag'] == second.headers['etag']
+    assert first.headers['content-encoding'] == 'gzip'
+    assert first.content == second.content
+    assert 'timings' not in first.json()['data']
+
+    assert first.headers['server-timing'].startswith('cache;desc="miss"')
+    assert 'block-type_data_list;dur=' in first.headers['server-timing']
+    assert second.headers['server-timing'] == 'cache;desc="hit"'
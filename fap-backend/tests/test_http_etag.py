@@ -0,0 +1,15 @@
+"""ETag 조건부 요청 비교 확인 (GET/HEAD 만 304 대상)"""
+
+import pytest
+from starlette.requests import Request
+
+from http_etag import etag_matches
+
+
+def make_request(method: str, if_none_match: str) -> Request:
+    return Request({'type': 'http', 'method': method, 'headers': [(b'if-none-match', if_none_match.encode())]})
+
+
+@pytest.mark.parametrize('method, expected', [('GET', True), ('HEAD', True), ('POST', False), ('PUT', False)])
+def test_only_get_and_head_are_conditional(method, expected):
+    assert etag_matches(make_request(method, 'W/"analytics-1-0-abc"'), '"analytics-1-0-abc"') is expected
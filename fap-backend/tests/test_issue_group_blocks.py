@@ -0,0 +1,51 @@
+"""건수 블럭: SQL GROUP BY 집계로 계산한 결과가 일감 순회(compute_blocks) 결과와 블럭마다 같은지 확인"""
+
+import datetime
+import random
+
+import pytest
+
+from issue_analytics import BLOCKS, COUNT_GROUP_COLUMNS, STATUS_ORDER_BY_TRACKER, compute_blocks, compute_blocks_from_groups, is_count_block
+
+COUNT_BLOCKS = [name for name in BLOCKS if is_count_block(name)]
+
+
+def make_issues(count, seed):
+    rng = random.Random(seed)
+    started_at = datetime.datetime(2025, 1, 1, 9, 0)
+    # 최근 수정순이 created_at 순서와 다르도록 섞되, 동률은 만들지 않음
+    updated_minutes = rng.sample(range(count * 10), count)
+    issues = []
+    for n in range(count):
+        tracker_name = rng.choice(list(STATUS_ORDER_BY_TRACKER) + ['[AE][기타] 문의'])
+        status_name = rng.choice(STATUS_ORDER_BY_TRACKER.get(tracker_name, ['신규', '완료']))
+        issues.append({
+            'redmine_id': n + 1,
+            'project_id': rng.choice([1, 2]),
+            'tracker_name': tracker_name,
+            'status_name': status_name,
+            'is_closed': int(status_name.endswith('완료')),
+            'author_name': rng.choice(['작업자 A', '작업자 B', '작업자 C', None]),
+            'product': rng.choice(['HW 설비', 'SW 설비', '공용', None]),
+            'created_at': str(started_at + datetime.timedelta(hours=n)),
+            'updated_at': str(started_at + datetime.timedelta(days=30, minutes=updated_minutes[n]))
+        })
+    return issues
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_group_blocks_match_issue_pass(sqlite_db, seed):
+    issues = make_issues(200, seed)
+    db = sqlite_db(issues)
+
+    groups = db.get_issue_group_counts('2025-01-01', '2025-12-31', [1, 2], COUNT_GROUP_COLUMNS)
+    assert sum(group['count'] for group in groups) == len(issues)
+    assert any('GROUP BY' in sql for sql in db.statements)
+
+    # 일감 조회와 같은 순서(updated_at DESC)로 순회한 결과와 비교
+    ordered = sorted(issues, key=lambda issue: issue['updated_at'], reverse=True)
+    expected = compute_blocks(ordered, COUNT_BLOCKS)
+    actual = compute_blocks_from_groups(groups, COUNT_BLOCKS)
+
+    for name in COUNT_BLOCKS:
+        assert actual[name] == expected[name], name
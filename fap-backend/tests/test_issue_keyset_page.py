@@ -0,0 +1,48 @@
+"""get_issues_keyset_page 키셋 페이지 순회 확인 (SQLite 메모리 DB 로 실제 SQL 실행)"""
+
+import pytest
+
+
+@pytest.fixture
+def keyset_db(sqlite_db):
+    updated_at = ['2025-01-03 00:00:00', None, '2025-01-02 00:00:00', None, '2025-01-03 00:00:00', None, '2025-01-01 00:00:00']
+    return sqlite_db([
+        {'redmine_id': redmine_id, 'project_id': 1, 'created_at': '2025-01-01 09:00:00', 'updated_at': value}
+        for redmine_id, value in enumerate(updated_at, start=1)
+    ])
+
+
+def read_all_pages(db, descending, page_size=2):
+    """next_cursor 를 만드는 라우트와 같은 방식으로 마지막 행의 (정렬 값, redmine_id) 를 넘기며 전체 순회"""
+    seen = []
+    after = None
+    while True:
+        page = db.get_issues_keyset_page('2025-01-01', '2025-12-31', [1], 'updated_at', descending, after, page_size + 1,
+                                         columns=['redmine_id', 'updated_at'])
+        seen += [issue['redmine_id'] for issue in page[:page_size]]
+        if len(page) <= page_size:
+            return seen
+        after = (page[page_size - 1]['updated_at'], page[page_size - 1]['redmine_id'])
+
+
+def test_null_sort_values_descending(keyset_db):
+    # NULL 정렬 값은 내림차순 맨 뒤 (동률은 redmine_id 내림차순)
+    assert read_all_pages(keyset_db, descending=True) == [5, 1, 3, 7, 6, 4, 2]
+
+
+def test_null_sort_values_ascending(keyset_db):
+    # NULL 정렬 값은 오름차순 맨 앞
+    assert read_all_pages(keyset_db, descending=False) == [2, 4, 6, 7, 3, 1, 5]
+
+
+@pytest.mark.parametrize('descending, expected', [(True, [5, 1, 3, 7, 6, 4, 2]), (False, [2, 4, 6, 7, 3, 1, 5])])
+@pytest.mark.parametrize('page_size', [1, 3, 4, 10])
+def test_same_order_for_any_page_size(keyset_db, descending, expected, page_size):
+    # 페이지 경계가 중복 값 / NULL 구간 안팎 어디에 걸려도 같은 순서로 한 번씩
+    assert read_all_pages(keyset_db, descending=descending, page_size=page_size) == expected
+
+
+def test_orders_on_raw_column(keyset_db):
+    # 인덱스 순서로 읽을 수 있도록 정렬 컬럼을 식으로 감싸지 않음
+    read_all_pages(keyset_db, descending=True, page_size=1)
+    assert all('ORDER BY updated_at DESC, redmine_id DESC' in sql and 'COALESCE' not in sql for sql in keyset_db.statements)
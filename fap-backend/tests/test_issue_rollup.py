@@ -0,0 +1,28 @@
+"""일별 집계(롤업) 갱신이 트랜잭션 안에서 DDL 없이 실행되는지 확인"""
+
+
+def test_refresh_slices_runs_no_ddl(fake_db):
+    def responder(sql, params):
+        if sql.startswith('SELECT DISTINCT DATE(created_at), project_id'):
+            return [('2024-01-02', 7)]
+        return []
+
+    db, connections = fake_db(responder)
+    cursor = db.get_connection().cursor()
+    db._refresh_issue_rollup_slices(cursor, [1, 2])
+
+    statements = [sql for sql, _ in connections[0].statements]
+    assert not any('CREATE TABLE' in sql for sql in statements)
+    assert statements[1].startswith('DELETE FROM issue_rollup_daily')
+    assert statements[2].startswith('INSERT INTO issue_rollup_daily')
+
+
+def test_rebuild_runs_no_ddl(fake_db):
+    db, connections = fake_db()
+    cursor = db.get_connection().cursor()
+    db._rebuild_issue_rollup(cursor)
+
+    statements = [sql for sql, _ in connections[0].statements]
+    assert statements[0] == 'DELETE FROM issue_rollup_daily'
+    assert statements[1].startswith('INSERT INTO issue_rollup_daily')
+    assert len(statements) == 2
@@ -0,0 +1,89 @@
+"""set_update_issue_statusnames 일괄 상태 변경의 트랜잭션 처리 확인"""
+
+import pytest
+
+
+def make_issue_store(fail_rollup=False):
+    """issues 상태를 흉내 내는 responder (UPDATE 는 커밋 전까지 pending 에만 기록)"""
+    store = {
+        'rows': {1: 'New', 2: 'New', 3: 'Resolved'},
+        'pending': {}
+    }
+
+    def responder(sql, params):
+        if 'CREATE TABLE' in sql:
+            raise AssertionError('요청 경로에서 DDL 실행')
+        if sql.startswith('SELECT redmine_id, status_name'):
+            return [(redmine_id, status, 'Bug', 'HW', 10)
+                    for redmine_id, status in store['rows'].items() if redmine_id in params]
+        if sql.startswith('UPDATE issues'):
+            new_status_name, redmine_id = params
+            store['pending'][redmine_id] = new_status_name
+            return []
+        if sql.startswith('SELECT DISTINCT DATE(created_at), project_id'):
+            return [('2024-01-02', 10)]
+        if sql.startswith('INSERT INTO issue_rollup_daily') and fail_rollup:
+            raise RuntimeError('rollup insert failed')
+        if sql.startswith('SELECT generation'):
+            return [(1,)]
+        return []
+
+    return store, responder
+
+
+def apply_commit(store, connection):
+    if connection.committed:
+        store['rows'].update(store['pending'])
+
+
+@pytest.mark.parametrize('fail_rollup', [False, True])
+def test_batch_rollup_failure_rolls_back_status(fake_db, fail_rollup):
+    store, responder = make_issue_store(fail_rollup)
+    db, connections = fake_db(responder)
+
+    result = db.set_update_issue_statusnames([
+        {'redmine_id': 1, 'old_status_name': 'New', 'new_status_name': 'In Progress'},
+        {'redmine_id': 2, 'old_status_name': 'New', 'new_status_name': 'Resolved'},
+        {'redmine_id': 3, 'old_status_name': 'New', 'new_status_name': 'Closed'},
+    ])
+    batch_connection = connections[0]
+    apply_commit(store, batch_connection)
+
+    if fail_rollup:
+        assert result['success'] is False
+        assert result['results'] == {}
+        assert batch_connection.rolled_back and not batch_connection.committed
+        assert store['rows'] == {1: 'New', 2: 'New', 3: 'Resolved'}
+        # 실패 시 세대 번호도 올리지 않음
+        assert len(connections) == 1
+    else:
+        assert result['success'] is True
+        assert result['results'][1]['success'] and result['results'][2]['success']
+        assert result['results'][3]['success'] is False
+        assert batch_connection.committed
+        assert store['rows'] == {1: 'In Progress', 2: 'Resolved', 3: 'Resolved'}
+
+    statements = [sql for sql, _ in batch_connection.statements]
+    assert not any('CREATE TABLE' in sql for sql in statements)
+
+
+@pytest.mark.parametrize('redmine_id', [True, False, '1', 1.0])
+def test_moves_reject_non_integer_ids(redmine_id):
+    from fastapi import HTTPException
+    from routers.issue_database import normalize_status_moves
+
+    with pytest.raises(HTTPException) as error:
+        normalize_status_moves([{'redmine_id': redmine_id, 'old_status_name': 'New', 'new_status_name': 'Resolved'}])
+    assert error.value.status_code == 400
+
+
+def test_moves_report_each_duplicate_once():
+    from fastapi import HTTPException
+    from routers.issue_database import normalize_status_moves
+
+    moves = [{'redmine_id': redmine_id, 'old_status_name': 'New', 'new_status_name': 'Resolved'} for redmine_id in [3, 1, 3, 2, 1, 3]]
+    with pytest.raises(HTTPException) as error:
+        normalize_status_moves(moves)
+    assert error.value.detail == "같은 이슈를 여러 번 변경할 수 없습니다: [1, 3]"
+
+    assert [move['redmine_id'] for move in normalize_status_moves(moves[:2] + moves[3:4])] == [3, 1, 2]
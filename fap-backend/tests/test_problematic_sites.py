@@ -0,0 +1,65 @@
+"""Sub Site 순위(get_most_problematic_sites): 툴팁 일감은 툴팁 컬럼만 조회, 라우트는 db 스레드 풀에서 실행"""
+
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+import routers.issue_database as issue_database
+
+
+class FakeHierarchy:
+    SUB_SITES = {101: 'Sub Site A', 102: 'Sub Site B'}
+    PRODUCTS = {101: [1, 2], 102: [3]}
+
+    def children(self, site_id):
+        return [{'id': sub_site_id, 'name': name} for sub_site_id, name in self.SUB_SITES.items()]
+
+    def product_project_ids(self, sub_site_id, product_name='ALL'):
+        return self.PRODUCTS[sub_site_id]
+
+
+class SitesDB:
+    calls = []
+
+    def get_issue_counts_by_project(self, start_date, end_date, project_ids):
+        return {1: {'total': 3, 'completed': 1}, 2: {'total': 2, 'completed': 0}, 3: {'total': 1, 'completed': 1}}
+
+    def get_issue_columns_by_filter(self, start_date, end_date, project_ids, columns):
+        self.calls.append((sorted(project_ids), list(columns), threading.current_thread().name))
+        return [{'project_id': 1, 'tracker_name': '[AE][이슈] HW Part', 'is_closed': 1, 'subject': '조치 완료', 'author_name': '작업자 A'}]
+
+    def get_issues_by_filter(self, *args):
+        raise AssertionError("툴팁 일감은 전체 컬럼을 조회하지 않아야 함")
+
+
+@pytest.fixture
+def sites_db(monkeypatch):
+    SitesDB.calls = []
+    monkeypatch.setattr(issue_database, 'DatabaseManager', SitesDB)
+    monkeypatch.setattr(issue_database, 'get_project_hierarchy', lambda db=None: FakeHierarchy())
+    return SitesDB
+
+
+def test_tooltip_reads_only_tooltip_columns(sites_db):
+    result = issue_database.get_most_problematic_sites(0, '2025-01-01', '2025-12-31', 'ALL', top_k=1)
+
+    assert [site['site'] for site in result['data']] == ['Sub Site A']
+    assert result['data'][0]['in_progress'] == 4
+    assert '조치 완료' in result['data'][0]['tooltip']
+    # 순위에 든 Sub Site 의 프로젝트만, 툴팁 컬럼만 조회
+    assert [call[:2] for call in sites_db.calls] == [([1, 2], issue_database.SITE_TOOLTIP_COLUMNS)]
+
+
+def test_route_runs_in_db_pool(sites_db):
+    client = TestClient(main.app)
+    body = {'site_index': 0, 'start_date': '2025-01-01', 'end_date': '2025-12-31', 'top_k': 5}
+
+    response = client.post('/api/issues/get-problematic-sites', json=body)
+
+    assert response.status_code == 200
+    assert [site['site'] for site in response.json()['data']['blocks'][0]['data']] == ['Sub Site A', 'Sub Site B']
+    assert sites_db.calls[0][2].startswith('fap-db')
+
+    assert client.post('/api/issues/get-problematic-sites', json=dict(body, site_index=99)).status_code == 400
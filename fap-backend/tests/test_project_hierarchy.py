@@ -0,0 +1,54 @@
+"""DB 장애 시 만든 임시 프로젝트 계층이 캐시/ETag 에 쓰이지 않는지 확인"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import project_hierarchy
+import routers.issue_database as issue_database
+from project_hierarchy import CUSTOMER_CONFIG_DIGEST, get_hierarchy_etag, get_project_hierarchy
+
+
+class DownDB:
+    """세대 조회가 실패하고 프로젝트도 읽지 못하는 DB"""
+
+    def get_sync_generation(self, scope):
+        return None
+
+    def get_all_projects(self):
+        return []
+
+
+class EmptyDB(DownDB):
+    """세대는 0 이지만 projects 가 아직 비어 있는 DB"""
+
+    def get_sync_generation(self, scope):
+        return 0
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(project_hierarchy, '_hierarchy_cache', None)
+    monkeypatch.setattr(project_hierarchy, '_hierarchy_checked_at', 0.0)
+
+
+@pytest.mark.parametrize('db_class', [DownDB, EmptyDB])
+def test_degraded_hierarchy_has_no_etag(db_class):
+    hierarchy = get_project_hierarchy(db_class())
+
+    assert hierarchy.generation is None
+    assert get_hierarchy_etag(hierarchy) is None
+    assert project_hierarchy._hierarchy_cache is None
+
+
+def test_hierarchy_route_omits_etag_when_degraded(monkeypatch):
+    monkeypatch.setattr(project_hierarchy, 'DatabaseManager', DownDB)
+    app = FastAPI()
+    app.include_router(issue_database.router)
+    client = TestClient(app)
+
+    response = client.get('/api/issues/hierarchy', headers={'If-None-Match': f'"hierarchy-0-{CUSTOMER_CONFIG_DIGEST}"'})
+
+    assert response.status_code == 200
+    assert 'etag' not in response.headers
+    assert response.json()['data']['generation'] is None
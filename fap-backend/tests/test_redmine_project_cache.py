@@ -0,0 +1,63 @@
+"""fetch_redmine_project_cached 동시 요청 합치기 확인 (같은 프로젝트는 Redmine 1회 호출, 결과 공유)"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import routers.redmine_service as redmine_service
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, project_id):
+        self.project_id = project_id
+
+    def json(self):
+        return {'project': {'id': self.project_id, 'name': f"프로젝트 {self.project_id}"}}
+
+
+def test_concurrent_fetches_share_one_call(monkeypatch):
+    monkeypatch.setattr(redmine_service, '_project_cache', {})
+    calls = []
+    release = threading.Event()
+
+    def slow_get(url, headers, timeout):
+        calls.append(url)
+        release.wait(5)
+        return FakeResponse(7)
+
+    monkeypatch.setattr(redmine_service.requests, 'get', slow_get)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(redmine_service.fetch_redmine_project_cached, 7) for _ in range(8)]
+        # 나머지 요청이 진행 중인 조회에 합류할 때까지 첫 호출을 붙잡아 둠
+        while not calls:
+            time.sleep(0.001)
+        time.sleep(0.05)
+        release.set()
+        results = [future.result(5) for future in futures]
+
+    assert len(calls) == 1
+    assert all(result == {'id': 7, 'name': '프로젝트 7'} for result in results)
+    assert 7 not in redmine_service._project_fetches
+
+    # 이후 요청은 캐시에서 바로 응답
+    assert redmine_service.fetch_redmine_project_cached(7) == results[0]
+    assert len(calls) == 1
+
+
+def test_failed_fetch_is_not_cached(monkeypatch):
+    monkeypatch.setattr(redmine_service, '_project_cache', {})
+    calls = []
+
+    def failing_get(url, headers, timeout):
+        calls.append(url)
+        raise redmine_service.requests.exceptions.ConnectionError()
+
+    monkeypatch.setattr(redmine_service.requests, 'get', failing_get)
+
+    assert redmine_service.fetch_redmine_project_cached(9) is None
+    assert redmine_service.fetch_redmine_project_cached(9) is None
+    assert len(calls) == 2
+    assert 9 not in redmine_service._project_fetches
@@ -0,0 +1,22 @@
+"""ResponseCache 크기 계산/LRU 제거 확인"""
+
+import datetime
+
+from fast_json import dumps
+from response_cache import ResponseCache, estimate_size
+
+
+def test_estimate_size_is_serialized_length():
+    value = {'blocks': {'progress_summary': {'total': 3, '완료율': 66.7}}, 'created_at': datetime.datetime(2025, 1, 1)}
+    assert estimate_size(value) == len(dumps(value))
+
+
+def test_put_uses_given_size_and_evicts_oldest():
+    cache = ResponseCache("test", max_bytes=100)
+    cache.put('a', {'x': 1}, 60)
+    cache.put('b', {'x': 2}, 60)
+
+    assert cache.get('a') is None
+    assert cache.get('b') == {'x': 2}
+    assert cache.get_metrics()['bytes'] == 60
+    assert cache.get_metrics()['evictions'] == 1
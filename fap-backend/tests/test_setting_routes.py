@@ -0,0 +1,38 @@
+"""설정/동기화 라우트가 DB·Redmine 호출을 이벤트 루프 밖(전용 스레드 풀)에서 실행하는지 확인"""
+
+import threading
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import routers.setting_database as setting_database
+
+
+class ThreadRecordingDB:
+    threads = {}
+
+    def _record(self, name, result):
+        self.threads[name] = threading.current_thread().name
+        return result
+
+    def sync_projects_fast(self, limit):
+        return self._record('sync_projects_fast', {'success': True, 'message': 'ok', 'count': 0})
+
+    def get_user_api_key(self, login):
+        return self._record('get_user_api_key', {'success': True, 'message': '', 'data': None})
+
+
+def test_sync_and_api_key_routes_use_pools(monkeypatch):
+    monkeypatch.setattr(setting_database, 'DatabaseManager', ThreadRecordingDB)
+    monkeypatch.setattr(setting_database, 'refresh_project_hierarchy',
+                        lambda: ThreadRecordingDB.threads.__setitem__('refresh', threading.current_thread().name))
+    app = FastAPI()
+    app.include_router(setting_database.router)
+    client = TestClient(app)
+
+    assert client.post('/api/settings/sync-projects').status_code == 200
+    assert client.get('/api/settings/check-user-api-key/tester').status_code == 200
+
+    assert ThreadRecordingDB.threads['sync_projects_fast'].startswith('fap-redmine')
+    assert ThreadRecordingDB.threads['refresh'].startswith('fap-db')
+    assert ThreadRecordingDB.threads['get_user_api_key'].startswith('fap-db')
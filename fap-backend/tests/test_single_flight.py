@@ -0,0 +1,32 @@
+"""SingleFlight 요청 합치기 확인 (동기 함수는 스레드 풀, async 함수는 이벤트 루프에서 실행)"""
+
+import asyncio
+import threading
+
+from single_flight import SingleFlight
+
+
+def test_async_function_coalesced_on_event_loop():
+    flight = SingleFlight("test_async")
+    calls = []
+
+    async def compute(value):
+        calls.append(threading.current_thread() is threading.main_thread())
+        await asyncio.sleep(0.01)
+        return value * 2
+
+    async def go():
+        return await asyncio.gather(*[flight.run('key', compute, 21) for _ in range(5)])
+
+    assert asyncio.run(go()) == [42] * 5
+    assert calls == [True]
+    assert flight.get_metrics()['coalesced'] == 4
+
+
+def test_sync_function_runs_in_pool():
+    flight = SingleFlight("test_sync", category='db')
+
+    def compute():
+        return threading.current_thread().name
+
+    assert asyncio.run(flight.run('key', compute)).startswith('fap-db')
@@ -0,0 +1,29 @@
+"""동기화 세대 조회/증가 경로에서 DDL 을 실행하지 않는지 확인"""
+
+
+def test_getters_only_select(fake_db):
+    db, connections = fake_db(lambda sql, params: [('issues', 3)] if sql.startswith('SELECT') else [])
+
+    assert db.get_sync_generations(['issues', 'projects']) == {'issues': 3, 'projects': 0}
+
+    statements = [sql for connection in connections for sql, _ in connection.statements]
+    assert len(statements) == 1
+    assert statements[0].startswith('SELECT scope, generation FROM sync_generations')
+
+
+def test_get_and_bump_do_not_create_table(fake_db):
+    db, connections = fake_db(lambda sql, params: [(5,)] if sql.startswith('SELECT') else [])
+
+    assert db.get_sync_generation('projects') == 5
+    assert db.bump_sync_generation('projects') == 5
+
+    statements = [sql for connection in connections for sql, _ in connection.statements]
+    assert not any('CREATE TABLE' in sql for sql in statements)
+
+
+def test_create_table_commits(fake_db):
+    db, connections = fake_db()
+
+    assert db.create_sync_generations_table() is True
+    assert 'CREATE TABLE IF NOT EXISTS sync_generations' in connections[0].statements[0][0]
+    assert connections[0].committed